@@ -0,0 +1,5 @@
+"""
+Tooling shared by the 2023 Advent of Code solutions.
+
+Run it from the 2023 directory with ``python -m aoc2023``.
+"""
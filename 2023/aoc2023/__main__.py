@@ -0,0 +1,7 @@
+"""
+Entry point for ``python -m aoc2023``.
+"""
+from aoc2023.cli import main
+
+if __name__ == "__main__":
+    main()
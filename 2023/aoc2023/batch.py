@@ -0,0 +1,137 @@
+"""
+Batch solving of many inputs of one day.
+
+The inputs (files, directories or glob patterns) are solved on a process
+pool, one input per job, and the results are yielded as the jobs finish,
+so they can be streamed as JSON lines. A job that fails, because its input
+is malformed or its worker died, gives a result with an ``error`` instead
+of an answer and the other inputs carry on.
+
+With a time or memory budget, every part runs in a worker process of its
+own (see budget), killed when it overruns, so that one runaway input can't
+hold the batch; the pool is then a pool of threads waiting on them.
+"""
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from aoc2023 import budget, days
+
+def expand(patterns):
+    """
+    Lists the input files designated by paths, directories and glob patterns.
+
+    Args:
+    patterns (list): Files, directories (all the files they contain, except
+    parse caches) or glob patterns.
+
+    Returns:
+    list: The files, sorted and without duplicates.
+    """
+    found = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            candidates = glob.glob(os.path.join(pattern, "*"))
+        else:
+            candidates = glob.glob(pattern) or [pattern]
+        found.update(path for path in candidates
+                     if not path.endswith(".parsed") and not os.path.isdir(path))
+    return sorted(found)
+
+def solve_input(day, path, parts=days.PARTS, seconds=None, memory_bytes=None):
+    """
+    Solves one input file. Runs in a worker process and never raises.
+
+    Args:
+    day (int): The day number.
+    path (str): The input file.
+    parts (tuple): The parts to solve.
+    seconds (float): Wall-clock budget of every part. None for no limit.
+    memory_bytes (int): Memory budget of every part. None for no limit.
+
+    Returns:
+    dict: The input, the day, the answers by part, the time taken in
+    nanoseconds, the error (None when it succeeded) and the budget exceeded
+    ('time', 'memory' or None).
+    """
+    start = time.perf_counter_ns()
+    answers = {}
+    error = None
+    exceeded = None
+    if seconds is None and memory_bytes is None:
+        try:
+            module = days.import_day(day)
+            with days.map_input(day, path) as mapped:
+                for part in parts:
+                    answers[f"part{part}"] = days.solver(module, part)(module.parse_input(mapped.buffer))
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+    else:
+        for part in parts:
+            row = budget.run_part(day, part, path, seconds, memory_bytes)
+            if row["error"] is not None:
+                error = f"part {part}: {row['error']}"
+                exceeded = row["exceeded"]
+                break
+            answers[f"part{part}"] = row["answer"]
+    return dict(input=path, day=day, answers=answers, error=error, exceeded=exceeded,
+                elapsed_ns=time.perf_counter_ns() - start)
+
+def run_batch(day, paths, parts=days.PARTS, workers=None, seconds=None, memory_bytes=None):
+    """
+    Solves input files on a process pool.
+
+    Args:
+    day (int): The day number.
+    paths (list): The input files.
+    parts (tuple): The parts to solve.
+    workers (int): Number of worker processes. Defaults to the number of CPUs.
+    seconds (float): Wall-clock budget of every part. None for no limit.
+    memory_bytes (int): Memory budget of every part. None for no limit.
+
+    Yields:
+    dict: The result of solve_input of every input, in the order they finish.
+    """
+    budgeted = seconds is not None or memory_bytes is not None
+    executor = ThreadPoolExecutor if budgeted else ProcessPoolExecutor
+    with executor(max_workers=workers or os.cpu_count() or 1) as pool:
+        futures = {pool.submit(solve_input, day, path, parts, seconds, memory_bytes): path
+                   for path in paths}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as exc:
+                # The worker itself failed (killed, out of memory...)
+                yield dict(input=futures[future], day=day, answers={}, elapsed_ns=None,
+                           error=f"{type(exc).__name__}: {exc}", exceeded=None)
+
+def stream(day, paths, output, parts=days.PARTS, workers=None, seconds=None, memory_bytes=None):
+    """
+    Solves input files and writes one JSON line per result as they finish.
+
+    Args:
+    day (int): The day number.
+    paths (list): The input files.
+    output (file): Where to write the JSON lines.
+    parts (tuple): The parts to solve.
+    workers (int): Number of worker processes. Defaults to the number of CPUs.
+    seconds (float): Wall-clock budget of every part. None for no limit.
+    memory_bytes (int): Memory budget of every part. None for no limit.
+
+    Returns:
+    dict: The number of inputs, the number of failures, the wall time in
+    nanoseconds and the throughput in inputs per second.
+    """
+    start = time.perf_counter_ns()
+    count = 0
+    failures = 0
+    for result in run_batch(day, paths, parts, workers, seconds, memory_bytes):
+        count += 1
+        failures += result["error"] is not None
+        output.write(json.dumps(result, default=str) + "\n")
+        output.flush()
+    wall_ns = time.perf_counter_ns() - start
+    return dict(inputs=count, failures=failures, wall_ns=wall_ns,
+                inputs_per_second=count / max(wall_ns / 1e9, 1e-9))
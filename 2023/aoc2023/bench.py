@@ -0,0 +1,148 @@
+"""
+Timing of the parse step and the parts of each day.
+
+Every measurement runs the function ``warmup + repeat`` times with
+``time.perf_counter_ns`` and keeps the last ``repeat`` samples. The parts
+modify their input in place on several days, so the input is parsed again
+(outside of the timed region) before every call.
+"""
+import functools
+import json
+import math
+import statistics
+import time
+
+from aoc2023 import days, parsecache
+
+def measure(func, prepare, warmup=1, repeat=10):
+    """
+    Times repeated calls of a function.
+
+    Args:
+    func (function): The function to time.
+    prepare (function): Called before every run, returns the tuple of
+    arguments passed to func. Its cost is not timed.
+    warmup (int): Number of untimed runs done first.
+    repeat (int): Number of timed runs.
+
+    Returns:
+    tuple: The result of the last call and the list of timings in nanoseconds.
+    """
+    samples = []
+    result = None
+    for i in range(warmup + repeat):
+        args = prepare()
+        start = time.perf_counter_ns()
+        result = func(*args)
+        elapsed = time.perf_counter_ns() - start
+        if i >= warmup:
+            samples.append(elapsed)
+    return result, samples
+
+def percentile(samples, fraction):
+    """
+    Nearest-rank percentile of a list of samples.
+
+    Args:
+    samples (list): The samples, in any order.
+    fraction (float): The percentile as a fraction, e.g. 0.95.
+
+    Returns:
+    int: The smallest sample greater or equal than that fraction of the samples.
+    """
+    ordered = sorted(samples)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+def summarize(samples):
+    """
+    Statistics of a list of timings.
+
+    Args:
+    samples (list): Timings in nanoseconds.
+
+    Returns:
+    dict: The number of runs and the min, median and p95 timings in nanoseconds.
+    """
+    return {
+        "runs": len(samples),
+        "min_ns": min(samples),
+        "median_ns": int(statistics.median(samples)),
+        "p95_ns": percentile(samples, 0.95),
+    }
+
+def bench_day(day, text=None, parts=days.PARTS, warmup=1, repeat=10, path=None, parse=True,
+              parse_cache=False):
+    """
+    Benchmarks the parse step and the requested parts of a day.
+
+    Args:
+    day (int): The day number.
+    text (str or bytes-like): The raw puzzle input. Defaults to the memory
+    mapped content of the input file.
+    parts (tuple): The parts to run.
+    warmup (int): Number of untimed runs of every phase.
+    repeat (int): Number of timed runs of every phase.
+    path (str): Input file used when no text is given. Defaults to dayN.txt.
+    parse (bool): Whether to time the parse step on its own.
+    parse_cache (bool): Load the parsed input from the cache file next to
+    the input file (see parsecache) instead of parsing the text.
+
+    Returns:
+    list: One dict per phase ('parse', 'part1', 'part2') with the day, the
+    phase, the answer (None for 'parse') and the statistics of summarize.
+    """
+    if text is None:
+        path = path or days.input_path(day)
+        with days.map_input(day, path) as mapped:
+            return bench_day(day, mapped.buffer, parts, warmup, repeat, path=path,
+                             parse=parse, parse_cache=parse_cache)
+
+    module = days.import_day(day)
+    parse_input = module.parse_input
+    if parse_cache and path is not None:
+        parse_input = functools.partial(parsecache.load, module, path=path)
+    rows = []
+    if parse:
+        _, samples = measure(parse_input, lambda: (text,), warmup, repeat)
+        rows.append(dict(day=day, phase="parse", answer=None, **summarize(samples)))
+
+    for part in parts:
+        answer, samples = measure(days.solver(module, part),
+                                  lambda: (parse_input(text),),
+                                  warmup, repeat)
+        rows.append(dict(day=day, phase=f"part{part}", answer=answer,
+                         **summarize(samples)))
+    return rows
+
+def format_text(rows):
+    """
+    Formats benchmark rows as an aligned table with timings in milliseconds.
+
+    Args:
+    rows (list): Rows as returned by bench_day.
+
+    Returns:
+    str: The table.
+    """
+    header = f"{'day':>3}  {'phase':<6}  {'answer':>20}  {'min ms':>10}  " \
+             f"{'median ms':>10}  {'p95 ms':>10}  {'runs':>5}"
+    lines = [header]
+    for row in rows:
+        answer = "" if row["answer"] is None else str(row["answer"])
+        lines.append(f"{row['day']:>3}  {row['phase']:<6}  {answer:>20}  "
+                     f"{row['min_ns'] / 1e6:>10.3f}  {row['median_ns'] / 1e6:>10.3f}  "
+                     f"{row['p95_ns'] / 1e6:>10.3f}  {row['runs']:>5}")
+    return "\n".join(lines)
+
+def format_json(rows):
+    """
+    Formats benchmark rows as a JSON document.
+
+    Args:
+    rows (list): Rows as returned by bench_day.
+
+    Returns:
+    str: The JSON array of rows.
+    """
+    return json.dumps(rows, indent=2, default=str)
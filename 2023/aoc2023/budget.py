@@ -0,0 +1,114 @@
+"""
+Wall-clock and memory budgets of the parts.
+
+A budgeted part runs in a process of its own, which parses the input and
+sends back the answer through a pipe. Meanwhile the parent waits on the
+pipe in short slices and, between two, checks the time elapsed since the
+process started and its resident set size (RSS). The process is killed as
+soon as one of them goes over its budget, and the result tells which.
+
+The time budget covers the parse and the part, which is what bounds the
+latency of a job. The memory budget is on the growth of the RSS of the
+worker process over its RSS when it starts, before importing the day, so
+the interpreter doesn't count; it is only enforced where the RSS of another
+process can be read (Linux). Some inputs make solvers run away: the walk of
+day 8 loops forever when the end node can't be reached.
+
+The workers are started by a fork server where there is one, or spawned,
+never forked: run_part is called from the threads of batch.run_batch, and
+forking a process with threads running can deadlock the child on a lock
+another thread held.
+"""
+import multiprocessing
+import time
+
+from aoc2023 import days, memory, parsecache
+
+POLL_INTERVAL = 0.01
+
+def _context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+def _worker(connection, day, part, path, parse_cache):
+    connection.send(memory.rss_bytes())
+    try:
+        module = days.import_day(day)
+        with days.map_input(day, path) as mapped:
+            if parse_cache:
+                data = parsecache.load(module, mapped.buffer, path or days.input_path(day))
+            else:
+                data = module.parse_input(mapped.buffer)
+        start = time.perf_counter_ns()
+        answer = days.solver(module, part)(data)
+        connection.send((answer, time.perf_counter_ns() - start, None))
+    except BaseException as exc:
+        # MemoryError and RecursionError included
+        connection.send((None, None, f"{type(exc).__name__}: {exc}"))
+    finally:
+        connection.close()
+
+def run_part(day, part, path=None, seconds=None, memory_bytes=None, parse_cache=False):
+    """
+    Answers one part of a day in a worker process killed if it overruns.
+
+    Args:
+    day (int): The day number.
+    part (int): The part number.
+    path (str): Input file. Defaults to dayN.txt in the day directory.
+    seconds (float): Wall-clock budget of the parse and the part. None for
+    no limit.
+    memory_bytes (int): Budget of the RSS of the worker. None for no limit.
+    parse_cache (bool): Load the parsed input through parsecache.
+
+    Returns:
+    dict: The day, the part, the answer (None unless it finished), the time
+    of the part and the wall time of the worker in nanoseconds, the RSS of
+    the worker when it started, its peak RSS seen and the growth between
+    both in bytes, the budget exceeded ('time', 'memory' or None) and the
+    error, if the part failed or was killed.
+    """
+    context = _context()
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_worker, args=(sender, day, part, path, parse_cache),
+                              daemon=True)
+    start = time.perf_counter_ns()
+    process.start()
+    sender.close()
+
+    result = dict(day=day, part=part, answer=None, elapsed_ns=None, wall_ns=None,
+                  rss_base_bytes=None, rss_peak_bytes=0, rss_growth_bytes=0, exceeded=None,
+                  error=None)
+    while True:
+        if receiver.poll(POLL_INTERVAL):
+            try:
+                message = receiver.recv()
+            except EOFError:
+                process.join()
+                result["error"] = f"Worker died with exit code {process.exitcode}"
+                break
+            if result["rss_base_bytes"] is None:
+                # The first message is the RSS of the worker when it started
+                result["rss_base_bytes"] = result["rss_peak_bytes"] = message
+                continue
+            result["answer"], result["elapsed_ns"], result["error"] = message
+            break
+        if result["rss_base_bytes"] is not None:
+            rss = memory.rss_bytes(process.pid)
+            result["rss_peak_bytes"] = max(result["rss_peak_bytes"], rss)
+            result["rss_growth_bytes"] = max(result["rss_growth_bytes"],
+                                             rss - result["rss_base_bytes"])
+        wall = (time.perf_counter_ns() - start) / 1e9
+        if memory_bytes is not None and result["rss_growth_bytes"] > memory_bytes:
+            result["exceeded"] = "memory"
+            result["error"] = f"Memory budget of {memory_bytes / 2**20:.0f} MB exceeded"
+        elif seconds is not None and wall > seconds:
+            result["exceeded"] = "time"
+            result["error"] = f"Time budget of {seconds:g} s exceeded"
+        if result["exceeded"]:
+            process.kill()
+            break
+    process.join()
+    receiver.close()
+    result["wall_ns"] = time.perf_counter_ns() - start
+    return result
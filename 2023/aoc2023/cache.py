@@ -0,0 +1,258 @@
+"""
+Content-addressed on-disk cache of answers.
+
+An answer is stored under a key made of the SHA-256 of the input bytes, the
+part and the SHA-256 of the source of the day module and of the aoc2023
+modules it uses, directly or not (the Grid, the reader, and what they
+import in turn). Changing the input or the code changes the key, so stale
+answers are never returned; they are just no longer read and end up
+evicted.
+
+Every entry is a small JSON file in the cache directory. Reading an entry
+touches its modification time, and when the directory grows over its size
+cap the least recently used entries are removed first.
+"""
+import hashlib
+import inspect
+import json
+import os
+import time
+
+from aoc2023 import budget, days, parsecache
+
+DEFAULT_DIR = os.environ.get("AOC2023_CACHE_DIR",
+                             os.path.join(days.YEAR_DIR, ".cache", "results"))
+DEFAULT_MAX_BYTES = 1 << 20
+
+def _helpers(module):
+    """
+    The aoc2023 modules a module uses: the modules it imports and the
+    modules of the functions and classes it imports from them.
+    """
+    helpers = set()
+    for value in vars(module).values():
+        name = value.__name__ if inspect.ismodule(value) else getattr(value, "__module__", None)
+        if isinstance(name, str) and name.startswith("aoc2023."):
+            helper = inspect.getmodule(value)
+            if helper is not None and getattr(helper, "__file__", None):
+                helpers.add(helper)
+    return helpers
+
+def helper_files(module):
+    """
+    Source files of the aoc2023 modules a module uses, directly or through
+    other aoc2023 modules.
+
+    Args:
+    module (module): The dayN module.
+
+    Returns:
+    list: The paths, sorted.
+    """
+    files = set()
+    pending = [module]
+    while pending:
+        for helper in _helpers(pending.pop()):
+            if helper.__file__ not in files and helper is not module:
+                files.add(helper.__file__)
+                pending.append(helper)
+    return sorted(files)
+
+def source_hash(module):
+    """
+    Hash of the source of a module and of the aoc2023 modules it uses,
+    directly or through other aoc2023 modules.
+
+    Args:
+    module (module): The dayN module.
+
+    Returns:
+    str: The hexadecimal SHA-256.
+    """
+    digest = hashlib.sha256()
+    for path in sorted({module.__file__, *helper_files(module)}):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def input_hash(buffer):
+    """
+    Hash of a raw input.
+
+    Args:
+    buffer (bytes-like): The raw input.
+
+    Returns:
+    str: The hexadecimal SHA-256.
+    """
+    return hashlib.sha256(buffer).hexdigest()
+
+def key(data_hash, part, code_hash):
+    """
+    Key of an answer.
+
+    Args:
+    data_hash (str): The input_hash of the input.
+    part (int): The part number.
+    code_hash (str): The source_hash of the day module.
+
+    Returns:
+    str: The key, usable as a file name.
+    """
+    return f"{data_hash[:32]}-{code_hash[:32]}-part{part}"
+
+class ResultCache:
+    """
+    Directory of answers with a size cap and least recently used eviction.
+    """
+
+    def __init__(self, directory=DEFAULT_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, entry_key):
+        return os.path.join(self.directory, entry_key + ".json")
+
+    def get(self, entry_key):
+        """
+        Reads an answer and marks it as recently used.
+
+        Args:
+        entry_key (str): The key of the answer.
+
+        Returns:
+        tuple: Whether the answer was found and the answer (None if not found).
+        """
+        path = self._path(entry_key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return False, None
+        os.utime(path)
+        return True, entry["answer"]
+
+    def put(self, entry_key, answer):
+        """
+        Stores an answer, then evicts entries if the cache is over its cap.
+
+        Args:
+        entry_key (str): The key of the answer.
+        answer (int or str): The answer.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(entry_key)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump({"answer": answer, "stored": time.time()}, f)
+        os.replace(temporary, path)
+        self.evict()
+
+    def entries(self):
+        """
+        Lists the entries from the least to the most recently used.
+
+        Returns:
+        list: The (modification time, size, path) of every entry.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                found.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(found)
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache fits its cap.
+
+        Returns:
+        int: The number of entries removed.
+        """
+        found = self.entries()
+        total = sum(size for _, size, _ in found)
+        removed = 0
+        for _, size, path in found:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """
+        Removes every entry.
+        """
+        for _, _, path in self.entries():
+            os.remove(path)
+
+def solve(day, parts=days.PARTS, path=None, cache=None, parse_cache=False, seconds=None,
+          memory_bytes=None):
+    """
+    Answers parts of a day, reusing the cached answers.
+
+    Args:
+    day (int): The day number.
+    parts (tuple): The parts to answer.
+    path (str): Input file. Defaults to dayN.txt in the day directory.
+    cache (ResultCache): The cache. None solves without caching.
+    parse_cache (bool): Load the parsed input from the cache file next to
+    the input file (see parsecache) instead of parsing the text.
+    seconds (float): Wall-clock budget of every part solved (see budget).
+    None for no limit.
+    memory_bytes (int): Memory budget of every part solved. None for no limit.
+
+    Returns:
+    list: One dict per part with the day, the part, the answer, whether it
+    came from the cache, the time taken in nanoseconds and the error (None
+    unless a budgeted part failed or overran).
+    """
+    module = days.import_day(day)
+    path = path or days.input_path(day)
+    rows = []
+    with days.map_input(day, path) as mapped:
+        if cache is not None:
+            data_hash = input_hash(mapped.buffer)
+            code_hash = source_hash(module)
+        for part in parts:
+            start = time.perf_counter_ns()
+            hit, answer, error = False, None, None
+            if cache is not None:
+                entry_key = key(data_hash, part, code_hash)
+                hit, answer = cache.get(entry_key)
+            if not hit:
+                if seconds is not None or memory_bytes is not None:
+                    row = budget.run_part(day, part, path, seconds, memory_bytes, parse_cache)
+                    answer, error = row["answer"], row["error"]
+                elif parse_cache:
+                    answer = days.solver(module, part)(parsecache.load(module, mapped.buffer, path))
+                else:
+                    answer = days.solver(module, part)(module.parse_input(mapped.buffer))
+                if cache is not None and error is None:
+                    cache.put(entry_key, answer)
+            rows.append(dict(day=day, part=part, answer=answer, cached=hit,
+                             elapsed_ns=time.perf_counter_ns() - start, error=error))
+    return rows
+
+def format_rows(rows):
+    """
+    Formats the rows of solve as an aligned table with timings in milliseconds.
+
+    Args:
+    rows (list): Rows as returned by solve.
+
+    Returns:
+    str: The table.
+    """
+    lines = [f"{'day':>3}  {'part':>4}  {'answer':>20}  {'ms':>10}  source"]
+    for row in rows:
+        source = row["error"] or ("cache" if row["cached"] else "solved")
+        lines.append(f"{row['day']:>3}  {row['part']:>4}  {str(row['answer']):>20}  "
+                     f"{row['elapsed_ns'] / 1e6:>10.3f}  {source}")
+    return "\n".join(lines)
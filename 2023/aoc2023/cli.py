@@ -0,0 +1,472 @@
+"""
+Command line interface of the 2023 tooling.
+
+Usage (from the 2023 directory):
+    python -m aoc2023 run --day 17 --repeat 50
+    python -m aoc2023 run --format json
+    python -m aoc2023 run --day 16 --part 2 --profile
+    python -m aoc2023 run --day 17 --memory
+    python -m aoc2023 run --day 17 --counters --format json
+    python -m aoc2023 all --jobs 8
+    python -m aoc2023 solve --day 16 --input day16.txt
+    python -m aoc2023 batch --day 7 inputs/ 'more/day7_*.txt' > answers.jsonl
+    python -m aoc2023 batch --day 8 inputs/ --time-limit 5 --memory-limit 500
+    python -m aoc2023 generate --day 1 --scale 1000 | python -m aoc2023 stream --day 1 --part 2
+    python -m aoc2023 generate --day 16 --scale 100 --output big16.txt
+    python -m aoc2023 gate --update
+    python -m aoc2023 complexity --day 7 --day 11
+    python -m aoc2023 fuzz --runs 1000
+    python -m aoc2023 watch --day 16
+    python -m aoc2023 trace --day 3 --day 11 --day 15 --output trace.json
+    python -m aoc2023 serve --socket /tmp/aoc2023.sock
+    python -m aoc2023 load --socket /tmp/aoc2023.sock --day 7 --requests 500 --concurrency 8
+    python -m aoc2023 gate --threshold 0.2
+    python -m aoc2023 history --day 17
+    python -m aoc2023 modes --day 16 --workers 8
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from aoc2023 import (batch, bench, cache, complexity, days, fuzz, generators, history, imports,
+                     memory, metrics, modes, orchestrator, profiling, regression, server,
+                     streaming, tracing, watch)
+
+def _megabytes(value):
+    return None if value is None else int(value * 2**20)
+
+def _add_budget_arguments(parser):
+    parser.add_argument("--time-limit", type=float, metavar="SECONDS",
+                        help="kill a part running longer than this (parse included)")
+    parser.add_argument("--memory-limit", type=float, metavar="MB",
+                        help="fail a part whose worker process grows its memory by more "
+                             "than this")
+
+def _cmd_run(args):
+    if args.input and len(args.day or days.DAYS) != 1:
+        raise SystemExit("--input needs exactly one --day")
+    if args.profile:
+        if len(args.day or days.DAYS) != 1:
+            raise SystemExit("--profile needs exactly one --day")
+        for part in args.part or days.PARTS:
+            report = profiling.profile_part(args.day[0], part, args.input, args.profile_dir)
+            print(profiling.format_report(report))
+        return 0
+    if args.memory:
+        rows = []
+        for day in args.day or days.DAYS:
+            rows.extend(memory.memory_day(day, parts=tuple(args.part or days.PARTS),
+                                          path=args.input))
+        print(memory.format_json(rows) if args.format == "json" else memory.format_text(rows))
+        return 0
+    if args.import_report:
+        print(imports.format_report(imports.import_report(args.day or days.DAYS),
+                                    args.day or days.DAYS))
+        print()
+    rows = []
+    for day in args.day or days.DAYS:
+        rows.extend(bench.bench_day(day,
+                                    path=args.input,
+                                    parts=tuple(args.part or days.PARTS),
+                                    warmup=args.warmup,
+                                    repeat=args.repeat,
+                                    parse_cache=args.parse_cache))
+    if not args.no_history:
+        history.record(rows, "run", args.history, args.input)
+    if args.counters:
+        metrics.add_counters(rows, args.input)
+    if args.format == "json":
+        print(bench.format_json(rows))
+    else:
+        print(bench.format_text(rows))
+        if args.counters:
+            print()
+            print(metrics.format_text(rows))
+    return 0
+
+def _cmd_all(args):
+    report = orchestrator.run_all(args.day, args.part, args.input_dir, args.jobs,
+                                  warmup=args.warmup, repeat=args.repeat)
+    if args.format == "json":
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        print(orchestrator.format_report(report))
+    return 1 if report["errors"] else 0
+
+def _cmd_solve(args):
+    if args.input and len(args.day or days.DAYS) != 1:
+        raise SystemExit("--input needs exactly one --day")
+    results = None if args.no_cache else cache.ResultCache(args.cache_dir, args.cache_size)
+    if args.clear_cache and results is not None:
+        results.clear()
+    rows = []
+    for day in args.day or days.DAYS:
+        rows.extend(cache.solve(day, tuple(args.part or days.PARTS), args.input, results,
+                                args.parse_cache, args.time_limit, _megabytes(args.memory_limit)))
+    print(cache.format_rows(rows))
+    return 1 if any(row["error"] for row in rows) else 0
+
+def _cmd_batch(args):
+    paths = batch.expand(args.inputs)
+    if not paths:
+        raise SystemExit("No input file found")
+    summary = batch.stream(args.day, paths, sys.stdout, tuple(args.part or days.PARTS), args.jobs,
+                           args.time_limit, _megabytes(args.memory_limit))
+    print(f"{summary['inputs']} inputs, {summary['failures']} failed, in "
+          f"{summary['wall_ns'] / 1e9:.2f} s ({summary['inputs_per_second']:.1f} inputs/s)",
+          file=sys.stderr)
+    return 1 if summary["failures"] else 0
+
+def _cmd_stream(args):
+    try:
+        rows = streaming.solve(args.day, tuple(args.part or days.PARTS), args.input)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    print(streaming.format_rows(rows))
+    return 0
+
+def _cmd_generate(args):
+    try:
+        lines = generators.generate_lines(args.day, size=args.size, seed=args.seed,
+                                          scale=args.scale, variant=args.variant)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+        else:
+            sys.stdout.writelines(lines)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    return 0
+
+def _cmd_gate(args):
+    rows = regression.run_suite(args.day, warmup=args.warmup, repeat=args.repeat)
+    if not args.no_history:
+        history.record(rows, "gate", args.history)
+    if args.update:
+        regression.save_baseline(rows, args.baseline)
+        print(bench.format_text(rows))
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    try:
+        baseline = regression.load_baseline(args.baseline)
+    except FileNotFoundError:
+        raise SystemExit(f"No baseline at {args.baseline}, create it with --update")
+    results = regression.compare(rows, baseline, args.threshold, f"{args.stat}_ns",
+                                 round(args.noise_floor * 1e6))
+    print(regression.format_results(results))
+    return 1 if regression.failed(results) else 0
+
+def _cmd_history(args):
+    try:
+        entries = history.load(args.history)
+    except FileNotFoundError:
+        raise SystemExit(f"No history at {args.history}, run benchmarks with run or gate first")
+    trends = history.trend_report(entries, args.day, args.window, args.alpha, args.min_effect,
+                                  args.reference)
+    if args.format == "json":
+        print(json.dumps(trends, indent=2, default=str))
+    else:
+        print(history.format_text(trends))
+    return 1 if any(row["status"] == "slower" for row in trends) else 0
+
+def _add_history_arguments(parser):
+    parser.add_argument("--history", default=history.DEFAULT_HISTORY,
+                        help="benchmark history file the results are appended to")
+    parser.add_argument("--no-history", action="store_true",
+                        help="don't append the results to the history")
+
+def _cmd_modes(args):
+    if args.workers:
+        os.environ["AOC2023_WORKERS"] = str(args.workers)
+    rows = []
+    for day in args.day or sorted(modes.PARALLEL_PARTS):
+        if day not in modes.PARALLEL_PARTS:
+            raise SystemExit(f"Day {day} has no part looping with map_tasks")
+        with days.map_input(day, args.input) as mapped:
+            for part in args.part or modes.PARALLEL_PARTS[day]:
+                rows.extend(modes.compare_modes(day, part, mapped.buffer, warmup=args.warmup,
+                                                repeat=args.repeat))
+    print(json.dumps(rows, indent=2, default=str) if args.format == "json"
+          else modes.format_text(rows))
+    return 0
+
+def _cmd_complexity(args):
+    rows = complexity.complexity_report(args.day, tuple(args.part or days.PARTS),
+                                        variants=not args.no_variants, start=args.start,
+                                        steps=args.steps, repeat=args.repeat,
+                                        budget=args.budget)
+    if args.format == "json":
+        print(complexity.format_json(rows))
+    else:
+        print(complexity.format_text(rows))
+    return 0
+
+def _cmd_fuzz(args):
+    results = fuzz.fuzz(args.day, args.runs, args.seed, minimize=not args.no_shrink)
+    print(fuzz.format_results(results))
+    return 1 if any(result["failure"] for result in results) else 0
+
+def _cmd_watch(args):
+    watch.watch(tuple(args.day or days.DAYS), tuple(args.part or days.PARTS),
+                args.interval, initial=not args.no_initial)
+    return 0
+
+def _cmd_trace(args):
+    if args.input and len(args.day or days.DAYS) != 1:
+        raise SystemExit("--input needs exactly one --day")
+    tracer, answers = tracing.trace_run(tuple(args.day or days.DAYS),
+                                        tuple(args.part or days.PARTS), args.input)
+    tracing.write(tracer, args.output)
+    for day, by_part in answers.items():
+        for part, answer in by_part.items():
+            print(f"day {day} part {part}: {answer}")
+    print(f"Trace written to {args.output}", file=sys.stderr)
+    return 0
+
+def _cmd_serve(args):
+    server.run_server(args.host, args.port, args.socket, args.workers,
+                      ready=lambda address: print(f"Serving on {address}, Ctrl-C to stop",
+                                                  file=sys.stderr, flush=True),
+                      seconds=args.time_limit, memory_bytes=_megabytes(args.memory_limit))
+    return 0
+
+def _cmd_load(args):
+    text = days.read_input(args.day, args.input)
+    try:
+        report = asyncio.run(server.load_test(args.day, args.part, text, args.requests,
+                                              args.concurrency, args.host, args.port,
+                                              args.socket))
+    except OSError as exc:
+        raise SystemExit(f"Cannot reach the server: {exc}")
+    print(json.dumps(report, indent=2) if args.format == "json" else server.format_load(report))
+    return 1 if report["errors"] else 0
+
+def _add_address_arguments(parser):
+    parser.add_argument("--host", default=server.DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=server.DEFAULT_PORT)
+    parser.add_argument("--socket", help="Unix socket path, instead of TCP")
+
+def build_parser():
+    """
+    Builds the argument parser of the command line interface.
+
+    Returns:
+    argparse.ArgumentParser: The parser, with one subcommand per tool.
+    """
+    parser = argparse.ArgumentParser(prog="python -m aoc2023",
+                                     description=__doc__.split("\n\n")[0].strip())
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="solve and time days")
+    run.add_argument("--day", type=int, action="append", choices=days.DAYS,
+                     help="day to run, can be repeated (default: all days)")
+    run.add_argument("--part", type=int, action="append", choices=days.PARTS,
+                     help="part to run, can be repeated (default: both)")
+    run.add_argument("--input", help="input file (default: dayN.txt of the day)")
+    run.add_argument("--repeat", type=int, default=10, help="timed runs per phase")
+    run.add_argument("--warmup", type=int, default=1, help="untimed runs per phase")
+    run.add_argument("--format", choices=("text", "json"), default="text")
+    run.add_argument("--import-report", action="store_true",
+                     help="print the import time of the day modules first")
+    run.add_argument("--parse-cache", action="store_true",
+                     help="load parsed inputs from dayN.txt.parsed next to the input")
+    run.add_argument("--profile", action="store_true",
+                     help="profile the parts of one day instead of timing them")
+    run.add_argument("--profile-dir", default=".",
+                     help="where to write the .pstats and .collapsed files (default: .)")
+    run.add_argument("--memory", action="store_true",
+                     help="report peak memory and allocation sites instead of timings")
+    run.add_argument("--counters", action="store_true",
+                     help="count the hot path work of the days with probes "
+                          "in an extra instrumented run")
+    _add_history_arguments(run)
+    run.set_defaults(func=_cmd_run)
+
+    run_all = subparsers.add_parser("all", help="solve every day on a process pool")
+    run_all.add_argument("--day", type=int, action="append", choices=days.DAYS,
+                         help="day to run, can be repeated (default: all days)")
+    run_all.add_argument("--part", type=int, action="append", choices=days.PARTS,
+                         help="part to run, can be repeated (default: both)")
+    run_all.add_argument("--input-dir", help="directory of the dayN.txt inputs "
+                                             "(default: the day directories)")
+    run_all.add_argument("--jobs", type=int, help="worker processes (default: CPU count)")
+    run_all.add_argument("--repeat", type=int, default=1, help="timed runs per phase")
+    run_all.add_argument("--warmup", type=int, default=0, help="untimed runs per phase")
+    run_all.add_argument("--format", choices=("text", "json"), default="text")
+    run_all.set_defaults(func=_cmd_all)
+
+    solve = subparsers.add_parser("solve", help="print answers, reusing cached ones")
+    solve.add_argument("--day", type=int, action="append", choices=days.DAYS,
+                       help="day to solve, can be repeated (default: all days)")
+    solve.add_argument("--part", type=int, action="append", choices=days.PARTS,
+                       help="part to solve, can be repeated (default: both)")
+    solve.add_argument("--input", help="input file (default: dayN.txt of the day)")
+    solve.add_argument("--cache-dir", default=cache.DEFAULT_DIR)
+    solve.add_argument("--cache-size", type=int, default=cache.DEFAULT_MAX_BYTES,
+                       help="size cap of the cache directory in bytes")
+    solve.add_argument("--no-cache", action="store_true", help="always solve")
+    solve.add_argument("--clear-cache", action="store_true", help="empty the cache first")
+    solve.add_argument("--parse-cache", action="store_true",
+                       help="load parsed inputs from dayN.txt.parsed next to the input")
+    _add_budget_arguments(solve)
+    solve.set_defaults(func=_cmd_solve)
+
+    batch_parser = subparsers.add_parser("batch", help="solve many inputs of a day on a process pool")
+    batch_parser.add_argument("--day", type=int, required=True, choices=days.DAYS)
+    batch_parser.add_argument("--part", type=int, action="append", choices=days.PARTS,
+                              help="part to solve, can be repeated (default: both)")
+    batch_parser.add_argument("--jobs", type=int, help="worker processes (default: CPU count)")
+    batch_parser.add_argument("inputs", nargs="+",
+                              help="input files, directories or glob patterns")
+    _add_budget_arguments(batch_parser)
+    batch_parser.set_defaults(func=_cmd_batch)
+
+    stream = subparsers.add_parser("stream", help="solve a day reading its input incrementally")
+    stream.add_argument("--day", type=int, required=True, choices=streaming.DAYS)
+    stream.add_argument("--part", type=int, action="append", choices=days.PARTS,
+                        help="part to solve, can be repeated (default: both, "
+                             "only one from standard input)")
+    stream.add_argument("--input", help="input file (default: standard input)")
+    stream.set_defaults(func=_cmd_stream)
+
+    generate = subparsers.add_parser("generate", help="write a synthetic input")
+    generate.add_argument("--day", type=int, required=True, choices=sorted(generators.GENERATORS))
+    generate.add_argument("--size", type=int,
+                          help="size of the input, its meaning depends on the day")
+    generate.add_argument("--scale", type=float, default=1,
+                          help="multiple of the puzzle input, used without --size: of its "
+                               "lines or items, of its cells for the grids of days "
+                               + ", ".join(map(str, generators.GRID_DAYS))
+                               + " (their side grows by the square root)")
+    generate.add_argument("--seed", type=int, default=0)
+    generate.add_argument("--variant", choices=sorted(generators.VARIANTS),
+                          help="adversarial input instead of a random one")
+    generate.add_argument("--output", help="file to write (default: stdout)")
+    generate.set_defaults(func=_cmd_generate)
+
+    gate = subparsers.add_parser("gate", help="compare timings on large inputs with a baseline")
+    gate.add_argument("--day", type=int, action="append", choices=sorted(regression.SUITE),
+                      help="day to check, can be repeated (default: all days)")
+    gate.add_argument("--baseline", default=regression.DEFAULT_BASELINE)
+    gate.add_argument("--update", action="store_true", help="write the baseline instead")
+    gate.add_argument("--threshold", type=float, default=0.25,
+                      help="allowed slowdown as a fraction of the baseline (default: 0.25)")
+    gate.add_argument("--noise-floor", type=float,
+                      default=regression.NOISE_FLOOR_NS / 1e6,
+                      help="smallest slowdown that fails, in milliseconds (default: 1)")
+    gate.add_argument("--stat", choices=("min", "median", "p95"), default="min")
+    gate.add_argument("--repeat", type=int, default=3, help="timed runs per phase")
+    gate.add_argument("--warmup", type=int, default=1, help="untimed runs per phase")
+    _add_history_arguments(gate)
+    gate.set_defaults(func=_cmd_gate)
+
+    trends = subparsers.add_parser("history", help="report the trends of the benchmark history")
+    trends.add_argument("--day", type=int, action="append", choices=days.DAYS,
+                        help="day to report, can be repeated (default: all days)")
+    trends.add_argument("--history", default=history.DEFAULT_HISTORY,
+                        help="benchmark history file")
+    trends.add_argument("--window", type=int, default=history.WINDOW,
+                        help="latest entries compared with the ones before them")
+    trends.add_argument("--reference", type=int, default=history.REFERENCE,
+                        help="earlier entries they are compared with")
+    trends.add_argument("--alpha", type=float, default=history.ALPHA,
+                        help="significance level of the test")
+    trends.add_argument("--min-effect", type=float, default=history.MIN_EFFECT,
+                        help="smallest median slowdown flagged, as a fraction")
+    trends.add_argument("--format", choices=("text", "json"), default="text")
+    trends.set_defaults(func=_cmd_history)
+
+    compare = subparsers.add_parser("modes", help="time the parallel parts serially, on "
+                                                  "threads and on processes")
+    compare.add_argument("--day", type=int, action="append", choices=sorted(modes.PARALLEL_PARTS),
+                         help="day to run, can be repeated (default: all of them)")
+    compare.add_argument("--part", type=int, action="append", choices=days.PARTS,
+                         help="part to run, can be repeated (default: the parallel ones)")
+    compare.add_argument("--input", help="input file (default: dayN.txt of the day)")
+    compare.add_argument("--workers", type=int,
+                         help="threads or processes (default: AOC2023_WORKERS or CPU count)")
+    compare.add_argument("--repeat", type=int, default=5, help="timed runs per mode")
+    compare.add_argument("--warmup", type=int, default=1, help="untimed runs per mode")
+    compare.add_argument("--format", choices=("text", "json"), default="text")
+    compare.set_defaults(func=_cmd_modes)
+
+    scaling = subparsers.add_parser("complexity",
+                                    help="fit the scaling exponent of the solvers")
+    scaling.add_argument("--day", type=int, action="append", choices=sorted(generators.GENERATORS),
+                         help="day to measure, can be repeated (default: all days)")
+    scaling.add_argument("--part", type=int, action="append", choices=days.PARTS,
+                         help="part to measure, can be repeated (default: both)")
+    scaling.add_argument("--start", type=float, default=complexity.DEFAULT_START,
+                         help="first input size as a fraction of the puzzle size (default: 1/8)")
+    scaling.add_argument("--steps", type=int, default=complexity.DEFAULT_STEPS,
+                         help="number of input sizes, doubling every step")
+    scaling.add_argument("--repeat", type=int, default=3, help="timed runs per size")
+    scaling.add_argument("--budget", type=float, default=complexity.DEFAULT_BUDGET,
+                         help="seconds a single run may take before the series stops")
+    scaling.add_argument("--no-variants", action="store_true",
+                         help="skip the adversarial inputs, such as presorted hands")
+    scaling.add_argument("--format", choices=("text", "json"), default="text")
+    scaling.set_defaults(func=_cmd_complexity)
+
+    fuzzer = subparsers.add_parser("fuzz", help="compare the solvers with their reference "
+                                                "implementations on random inputs")
+    fuzzer.add_argument("--day", type=int, action="append",
+                        choices=sorted({pair.day for pair in fuzz.PAIRS}),
+                        help="day to fuzz, can be repeated (default: all pairs)")
+    fuzzer.add_argument("--runs", type=int, default=200, help="random inputs per pair")
+    fuzzer.add_argument("--seed", type=int, default=0)
+    fuzzer.add_argument("--no-shrink", action="store_true",
+                        help="report the failing input as generated")
+    fuzzer.set_defaults(func=_cmd_fuzz)
+
+    watcher = subparsers.add_parser("watch", help="solve a day again whenever its input "
+                                                  "or its code changes")
+    watcher.add_argument("--day", type=int, action="append", choices=days.DAYS,
+                         help="day to watch, can be repeated (default: all days)")
+    watcher.add_argument("--part", type=int, action="append", choices=days.PARTS,
+                         help="part to solve, can be repeated (default: both)")
+    watcher.add_argument("--interval", type=float, default=watch.DEFAULT_INTERVAL,
+                         help="seconds between two polls of the files")
+    watcher.add_argument("--no-initial", action="store_true",
+                         help="wait for a change before solving anything")
+    watcher.set_defaults(func=_cmd_watch)
+
+    tracer = subparsers.add_parser("trace", help="record the phases of a run as a Chrome trace")
+    tracer.add_argument("--day", type=int, action="append", choices=days.DAYS,
+                        help="day to run, can be repeated (default: all days)")
+    tracer.add_argument("--part", type=int, action="append", choices=days.PARTS,
+                        help="part to run, can be repeated (default: both)")
+    tracer.add_argument("--input", help="input file (default: dayN.txt of the day)")
+    tracer.add_argument("--output", default="trace.json",
+                        help="trace file to write (default: trace.json)")
+    tracer.set_defaults(func=_cmd_trace)
+
+    serve = subparsers.add_parser("serve", help="answer solve requests on warm worker processes")
+    _add_address_arguments(serve)
+    serve.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    _add_budget_arguments(serve)
+    serve.set_defaults(func=_cmd_serve)
+
+    load = subparsers.add_parser("load", help="load-test a running server")
+    _add_address_arguments(load)
+    load.add_argument("--day", type=int, required=True, choices=days.DAYS)
+    load.add_argument("--part", type=int, default=1, choices=days.PARTS)
+    load.add_argument("--input", help="input file (default: dayN.txt of the day)")
+    load.add_argument("--requests", type=int, default=100, help="number of requests")
+    load.add_argument("--concurrency", type=int, default=4,
+                      help="concurrent connections, one request in flight each")
+    load.add_argument("--format", choices=("text", "json"), default="text")
+    load.set_defaults(func=_cmd_load)
+    return parser
+
+def main(argv=None):
+    """
+    Runs the command line interface.
+
+    Args:
+    argv (list): Command line arguments. Defaults to sys.argv[1:].
+    """
+    args = build_parser().parse_args(argv)
+    sys.exit(args.func(args))
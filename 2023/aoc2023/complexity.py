@@ -0,0 +1,194 @@
+"""
+Empirical complexity of the solvers.
+
+Each part runs on a geometric series of generated inputs (a fraction of the
+puzzle size, doubled at every step) and the exponent k of ``time ~ n**k``
+is fitted by least squares on the logarithms, n being the size of the input
+in bytes. The exponent is also fitted against the size unit of the day's
+generator (galaxies for day 11, hands for day 7...), which reads directly
+as the complexity of the solver: day 11 grows like G**2 with the number of
+galaxies G, as distancer compares every pair of them.
+
+An exponent above SUPER_LINEAR is flagged, unless the largest input runs
+in less than NOISE_FLOOR_NS where timings are mostly noise, and the report is sorted so that
+the solvers that will break first as the inputs grow come first. Adversarial
+inputs can be measured with the variants of the generators, such as the
+presorted hands on which the first-element pivot quicksort of day 7 turns
+quadratic and eventually overflows the recursion limit.
+
+A series stops early when the next run is projected to take more than the
+time budget (from the growth between the last two runs), or when a run
+fails, which is reported.
+"""
+import json
+import math
+
+from aoc2023 import bench, days, generators
+
+SUPER_LINEAR = 1.2
+NOISE_FLOOR_NS = 1_000_000
+DEFAULT_STEPS = 5
+DEFAULT_START = 1 / 8
+DEFAULT_BUDGET = 2.0
+
+def sizes(day, start=DEFAULT_START, steps=DEFAULT_STEPS, factor=2):
+    """
+    Geometric series of generator sizes around the puzzle size of a day.
+
+    Args:
+    day (int): The day number.
+    start (float): First size, as a fraction of the puzzle size.
+    steps (int): Number of sizes.
+    factor (float): Ratio between consecutive sizes.
+
+    Returns:
+    list: The distinct sizes, increasing.
+    """
+    series = []
+    for step in range(steps):
+        size = max(1, round(generators.PUZZLE_SIZES[day] * start * factor ** step))
+        if size not in series:
+            series.append(size)
+    return series
+
+def fit(xs, ys):
+    """
+    Least squares fit of ``y = c * x**k`` on the logarithms.
+
+    Args:
+    xs (list): Positive abscissas.
+    ys (list): Positive ordinates.
+
+    Returns:
+    tuple: The exponent k and the coefficient of determination r² of the
+    fit, or (None, None) with fewer than two distinct abscissas.
+    """
+    if len(set(xs)) < 2:
+        return None, None
+    log_x = [math.log(x) for x in xs]
+    log_y = [math.log(max(y, 1)) for y in ys]
+    mean_x = sum(log_x) / len(log_x)
+    mean_y = sum(log_y) / len(log_y)
+    sxx = sum((x - mean_x) ** 2 for x in log_x)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(log_x, log_y))
+    syy = sum((y - mean_y) ** 2 for y in log_y)
+    slope = sxy / sxx
+    r_squared = sxy * sxy / (sxx * syy) if syy else 1.0
+    return slope, r_squared
+
+def scale_part(day, part, series, variant=None, seed=0, repeat=3, budget=DEFAULT_BUDGET):
+    """
+    Times one part of a day on a series of generated inputs and fits its
+    scaling exponent.
+
+    Args:
+    day (int): The day number.
+    part (int): The part number.
+    series (list): Increasing generator sizes.
+    variant (str): Variant of the generator (see generators.VARIANTS).
+    seed (int): Seed of the generator.
+    repeat (int): Timed runs per size, the fastest one is kept.
+    budget (float): Seconds a single run may be projected to take.
+
+    Returns:
+    dict: The day, the part, the variant, the points (size, bytes and
+    nanoseconds of every input measured), the exponents against the bytes
+    and the generator size, the r² of the first one, whether it is
+    super-linear and the error that stopped the series, if any.
+    """
+    module = days.import_day(day)
+    solve = days.solver(module, part)
+    points = []
+    error = None
+    for size in series:
+        if len(points) >= 2:
+            growth = points[-1]["ns"] / max(points[-2]["ns"], 1)
+            if points[-1]["ns"] * growth > budget * 1e9:
+                break
+        text = generators.generate(day, size=size, seed=seed, variant=variant)
+        try:
+            _, samples = bench.measure(solve, lambda: (module.parse_input(text),),
+                                       warmup=0, repeat=repeat)
+        except Exception as exc:
+            error = f"{type(exc).__name__} at size {size}"
+            break
+        points.append(dict(size=size, bytes=len(text), ns=min(samples)))
+        if min(samples) > budget * 1e9:
+            break
+
+    exponent, r_squared = fit([p["bytes"] for p in points], [p["ns"] for p in points])
+    size_exponent, _ = fit([p["size"] for p in points], [p["ns"] for p in points])
+    measurable = bool(points) and points[-1]["ns"] >= NOISE_FLOOR_NS
+    return dict(day=day, part=part, variant=variant, points=points, exponent=exponent,
+                size_exponent=size_exponent, r_squared=r_squared,
+                super_linear=error is not None or (measurable and (exponent or 0) > SUPER_LINEAR),
+                error=error)
+
+def complexity_report(report_days=None, parts=days.PARTS, variants=True, start=DEFAULT_START,
+                      steps=DEFAULT_STEPS, repeat=3, budget=DEFAULT_BUDGET):
+    """
+    Fits the scaling exponent of the parts of several days.
+
+    Args:
+    report_days (list): Days to measure. Defaults to every day with a generator.
+    parts (tuple): The parts to measure.
+    variants (bool): Also measure the adversarial variants of the generators.
+    start (float): First size, as a fraction of the puzzle size.
+    steps (int): Number of sizes of every series.
+    repeat (int): Timed runs per size.
+    budget (float): Seconds a single run may be projected to take.
+
+    Returns:
+    list: The rows of scale_part, those that will break first first: failed
+    series, then by decreasing exponent.
+    """
+    rows = []
+    for day in report_days or sorted(generators.GENERATORS):
+        series = sizes(day, start, steps)
+        names = [None]
+        if variants:
+            names += [name for name, by_day in generators.VARIANTS.items() if day in by_day]
+        for variant in names:
+            for part in parts:
+                rows.append(scale_part(day, part, series, variant, repeat=repeat, budget=budget))
+    rows.sort(key=lambda row: (row["error"] is None, -(row["exponent"] or 0)))
+    return rows
+
+def format_text(rows):
+    """
+    Formats a complexity report as an aligned table, with the fitted
+    exponents and the time of the largest input measured.
+
+    Args:
+    rows (list): Rows as returned by complexity_report.
+
+    Returns:
+    str: The table.
+    """
+    lines = [f"{'day':>3}  {'part':>4}  {'variant':<10}  {'sizes':>12}  {'largest ms':>10}  "
+             f"{'O(bytes^k)':>10}  {'O(size^k)':>9}  {'r2':>5}  flag"]
+    for row in rows:
+        points = row["points"]
+        span = f"{points[0]['size']}-{points[-1]['size']}" if points else "-"
+        largest = f"{points[-1]['ns'] / 1e6:.3f}" if points else "-"
+        exponent = "-" if row["exponent"] is None else f"{row['exponent']:.2f}"
+        size_exponent = "-" if row["size_exponent"] is None else f"{row['size_exponent']:.2f}"
+        r_squared = "-" if row["r_squared"] is None else f"{row['r_squared']:.2f}"
+        flag = "super-linear" if row["super_linear"] else ""
+        if row["error"]:
+            flag = f"fails: {row['error']}"
+        lines.append(f"{row['day']:>3}  {row['part']:>4}  {row['variant'] or '':<10}  {span:>12}  "
+                     f"{largest:>10}  {exponent:>10}  {size_exponent:>9}  {r_squared:>5}  {flag}")
+    return "\n".join(lines)
+
+def format_json(rows):
+    """
+    Formats a complexity report as JSON.
+
+    Args:
+    rows (list): Rows as returned by complexity_report.
+
+    Returns:
+    str: The JSON document.
+    """
+    return json.dumps(rows, indent=2, default=str)
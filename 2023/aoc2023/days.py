@@ -0,0 +1,118 @@
+"""
+Registry of the 2023 day modules.
+
+Every day module exposes ``parse_input(text)``, ``part1(data)`` and
+``part2(data)`` on top of its own solver functions. The helpers in this
+module locate, import and feed those modules. Importing a day module has
+no side effect: inputs are only read when read_input or map_input is
+called.
+"""
+import importlib
+import os
+import sys
+
+from aoc2023 import reader
+
+YEAR_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAYS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 17, 18)
+PARTS = (1, 2)
+
+if YEAR_DIR not in sys.path:
+    sys.path.insert(0, YEAR_DIR)
+
+def day_dir(day):
+    """
+    Directory holding the files of a day.
+
+    Args:
+    day (int): The day number.
+
+    Returns:
+    str: The absolute path of the day directory.
+    """
+    return os.path.join(YEAR_DIR, f"day_{day:02d}")
+
+def input_path(day):
+    """
+    Default location of the puzzle input of a day.
+
+    Args:
+    day (int): The day number.
+
+    Returns:
+    str: The absolute path of dayN.txt inside the day directory.
+    """
+    return os.path.join(day_dir(day), f"day{day}.txt")
+
+def module_name(day):
+    """
+    Importable name of the solution module of a day.
+
+    Args:
+    day (int): The day number.
+
+    Returns:
+    str: The name, e.g. 'day_01.day1'.
+    """
+    return f"day_{day:02d}.day{day}"
+
+def import_day(day):
+    """
+    Imports the solution module of a day.
+
+    Args:
+    day (int): The day number.
+
+    Returns:
+    module: The dayN module.
+    """
+    if day not in DAYS:
+        raise ValueError(f"There is no solution for day {day}")
+    return importlib.import_module(module_name(day))
+
+def read_input(day, path=None):
+    """
+    Reads the raw puzzle input of a day.
+
+    Args:
+    day (int): The day number.
+    path (str): Input file to read. Defaults to dayN.txt in the day directory.
+
+    Returns:
+    str: The content of the input file.
+    """
+    if path is None:
+        path = input_path(day)
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+def map_input(day, path=None):
+    """
+    Memory-maps the puzzle input of a day, without reading it.
+
+    Args:
+    day (int): The day number.
+    path (str): Input file to map. Defaults to dayN.txt in the day directory.
+
+    Returns:
+    reader.MappedInput: The mapped input, whose buffer can be given to the
+    parse_input function of the day. It must be closed after use.
+    """
+    if path is None:
+        path = input_path(day)
+    return reader.MappedInput(path)
+
+def solver(module, part):
+    """
+    Returns the function solving one part of a day module.
+
+    Args:
+    module (module): The dayN module.
+    part (int): The part number, 1 or 2.
+
+    Returns:
+    function: The part1 or part2 function of the module.
+    """
+    if part not in PARTS:
+        raise ValueError(f"There is no part {part}")
+    return getattr(module, f"part{part}")
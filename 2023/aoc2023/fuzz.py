@@ -0,0 +1,332 @@
+"""
+Differential fuzzing of the solvers against their reference implementations.
+
+Some days keep a slow or draft implementation next to the solution
+(``day3_draft.py``, ``day4_draft.py``, ``day5_part2_inneficient.py``).
+For each such pair, random small inputs are generated and the answers of
+the reference and of the runner interface of the day (parse_input and the
+parts) are compared. On a mismatch the input is shrunk to a minimal one
+that still shows it: chunks of lines (and of columns, for grids) are
+removed, numbers are made smaller and, in grids, symbols are blanked, as
+long as the reference still accepts the input and the answers still differ.
+
+A new fast path only needs a pair here to be checked against the code it
+replaces.
+"""
+import importlib
+import random
+import re
+from collections import namedtuple
+
+from aoc2023 import days, generators
+
+Pair = namedtuple('Pair', ['day', 'name', 'parts', 'reference', 'generate', 'valid', 'blank'])
+Pair.__doc__ = """
+Reference implementation of some parts of a day.
+
+Fields:
+day (int): The day number.
+name (str): The reference, as module:function.
+parts (tuple): The parts it answers.
+reference (function): Takes the input text, returns the answers of the parts.
+generate (function): Takes a random.Random, returns a small input text.
+valid (function): Whether the reference accepts an input text (it may
+loop forever or give meaningless answers on others).
+blank (str): Background character of grid inputs, None for other inputs.
+"""
+
+NUMBER = re.compile(r"\d+")
+
+def _draft(module, function):
+    return getattr(importlib.import_module(module), function)
+
+def _lines(text):
+    return text.strip().split("\n")
+
+def _day3_reference(text):
+    return (_draft("day_03.day3_draft", "read_num")(_lines(text))[0],)
+
+def _day4_reference(text):
+    cards = [line.split(':')[1].split("|") for line in _lines(text)]
+    return _draft("day_04.day4_draft", "scratchcards_draft")(cards)
+
+def _parse_almanac(text):
+    """
+    Parses an almanac the way the inefficient script does, without the day 5
+    parser under test, with the maps from the last one to the first one.
+    """
+    blocks = text.strip().split("\n\n")
+    seeds = [int(x) for x in blocks[0].split(": ")[1].split(" ")]
+    dict_maps = {}
+    for block in blocks[:0:-1]:
+        name, ranges = block.split(":\n")
+        dict_maps[name] = [x.split(" ") for x in ranges.split("\n")]
+    return seeds, dict_maps
+
+def _day5_reference(text):
+    seeds, dict_maps = _parse_almanac(text)
+    # The reference walks the maps backwards, from the locations to the seeds
+    finder = _draft("day_05.day5_part2_inneficient", "reverse_finding")
+    return (finder(dict_maps, seeds, list(dict_maps), start=0),)
+
+def _small_almanac(rng):
+    """
+    Almanac with small numbers, so that the reference search stays short.
+    Every map permutes the segments of one block of numbers, so that it can
+    be walked backwards.
+    """
+    seeds = []
+    for _ in range(rng.randint(1, 3)):
+        seeds += [rng.randint(1, 50), rng.randint(1, 10)]
+    blocks = ["seeds: " + " ".join(map(str, seeds))]
+    for name in generators.MAP_NAMES:
+        start = rng.randrange(50)
+        cuts = sorted(rng.sample(range(1, 20), rng.randint(0, 2)))
+        lengths = [end - begin for begin, end in zip([0] + cuts, cuts + [20])]
+        order = list(range(len(lengths)))
+        rng.shuffle(order)
+        sources = [start + sum(lengths[:i]) for i in range(len(lengths))]
+        targets = [0] * len(lengths)
+        target = start
+        for i in order:
+            targets[i] = target
+            target += lengths[i]
+        ranges = [f"{targets[i]} {sources[i]} {lengths[i]}" for i in range(len(lengths))]
+        rng.shuffle(ranges)
+        blocks.append(f"{name}:\n" + "\n".join(ranges))
+    return "\n\n".join(blocks) + "\n"
+
+def _cover(spans):
+    """
+    Union of half-open spans, as sorted disjoint spans, or None if they overlap.
+    """
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start < merged[-1][1]:
+            return None
+        if merged and start == merged[-1][1]:
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+def _valid_almanac(text):
+    try:
+        seeds, dict_maps = _parse_almanac(text)
+        if len(dict_maps) != len(generators.MAP_NAMES) or len(seeds) % 2:
+            return False
+        for ranges in dict_maps.values():
+            values = [[int(x) for x in value] for value in ranges]
+            if any(len(value) != 3 or value[2] < 1 for value in values):
+                return False
+            # The reference only ends on maps that are bijections
+            targets = _cover([(d, d + n) for d, _, n in values])
+            if targets is None or targets != _cover([(s, s + n) for _, s, n in values]):
+                return False
+    except (ValueError, IndexError, StopIteration):
+        return False
+    # The reference takes a seed 0 for no seed
+    return any(seeds[1::2]) and min(seeds[::2]) > 0
+
+def _valid_grid(text):
+    lines = _lines(text)
+    return bool(text.strip()) and len(set(map(len, lines))) == 1
+
+def _any(_):
+    return True
+
+PAIRS = [
+    Pair(3, "day3_draft:read_num", (1,), _day3_reference,
+         lambda rng: "".join(generators.day3(rng.randint(1, 10),
+                                                 rng.randrange(2**32))), _valid_grid, '.'),
+    Pair(4, "day4_draft:scratchcards_draft", (1, 2), _day4_reference,
+         lambda rng: "".join(generators.day4(rng.randint(1, 12),
+                                                 rng.randrange(2**32))), _any, None),
+    Pair(5, "day5_part2_inneficient:reverse_finding", (2,), _day5_reference,
+         _small_almanac, _valid_almanac, None),
+]
+
+def solve(day, parts, text):
+    """
+    Answers parts of a day on an input with its runner interface.
+
+    Args:
+    day (int): The day number.
+    parts (tuple): The parts.
+    text (str): The input.
+
+    Returns:
+    tuple: The answers, in the order of the parts.
+    """
+    module = days.import_day(day)
+    return tuple(days.solver(module, part)(module.parse_input(text)) for part in parts)
+
+def compare(pair, text):
+    """
+    Runs both implementations of a pair on an input.
+
+    Args:
+    pair (Pair): The pair.
+    text (str): The input.
+
+    Returns:
+    tuple: Whether the answers differ, the reference answers and the
+    answers of the solver (or the error it raised). The answers never
+    differ on an input the reference rejects.
+    """
+    if not pair.valid(text):
+        return False, None, None
+    try:
+        expected = tuple(pair.reference(text))
+    except Exception:
+        return False, None, None
+    try:
+        actual = solve(pair.day, pair.parts, text)
+    except Exception as exc:
+        actual = f"{type(exc).__name__}: {exc}"
+    return actual != expected, expected, actual
+
+def _transpose(lines):
+    return ["".join(column) for column in zip(*lines)]
+
+def _remove_chunks(lines, fails):
+    chunk = max(len(lines) // 2, 1)
+    while chunk >= 1:
+        index = 0
+        removed = False
+        while index < len(lines):
+            candidate = lines[:index] + lines[index + chunk:]
+            if candidate and fails(candidate):
+                lines = candidate
+                removed = True
+            else:
+                index += chunk
+        if not removed:
+            chunk //= 2
+    return lines
+
+def _simpler_atoms(line, blank):
+    """
+    Variants of a line with one number made smaller or one symbol blanked.
+    """
+    for match in NUMBER.finditer(line):
+        value = int(match.group())
+        for smaller in sorted({0, 1, value // 2, value - 1}):
+            if 0 <= smaller < value and len(str(smaller)) <= len(match.group()):
+                replacement = str(smaller)
+                if blank is not None:
+                    # Keep the width of the grid
+                    replacement = replacement.rjust(len(match.group()), blank)
+                yield line[:match.start()] + replacement + line[match.end():]
+    if blank is not None:
+        for index, char in enumerate(line):
+            if char != blank:
+                yield line[:index] + blank + line[index + 1:]
+
+def shrink(pair, text, max_checks=5000):
+    """
+    Shrinks an input on which the implementations of a pair differ.
+
+    Args:
+    pair (Pair): The pair.
+    text (str): The failing input.
+    max_checks (int): Number of candidate inputs tried at most.
+
+    Returns:
+    str: A smaller input on which they still differ.
+    """
+    checks = 0
+
+    def fails(lines):
+        nonlocal checks
+        if checks >= max_checks:
+            return False
+        checks += 1
+        return compare(pair, "\n".join(lines) + "\n")[0]
+
+    lines = _lines(text)
+    while True:
+        before = list(lines)
+        lines = _remove_chunks(lines, fails)
+        if pair.blank is not None:
+            lines = _transpose(_remove_chunks(_transpose(lines),
+                                              lambda columns: fails(_transpose(columns))))
+        for index in range(len(lines)):
+            for candidate in _simpler_atoms(lines[index], pair.blank):
+                if fails(lines[:index] + [candidate] + lines[index + 1:]):
+                    lines[index] = candidate
+                    break
+        if lines == before or checks >= max_checks:
+            return "\n".join(lines) + "\n"
+
+def fuzz_pair(pair, runs=200, seed=0, minimize=True):
+    """
+    Compares both implementations of a pair on random small inputs.
+
+    Args:
+    pair (Pair): The pair.
+    runs (int): Number of inputs.
+    seed (int): Seed of the random inputs.
+    minimize (bool): Shrink the first failing input.
+
+    Returns:
+    dict: The day, the reference, the parts, the number of inputs run and
+    of those the reference rejected and, on the first mismatch, the
+    failing input (shrunk if asked) with both answers on it. 'failure' is
+    None when they always agreed.
+    """
+    rng = random.Random(seed)
+    rejected = 0
+    for run in range(runs):
+        text = pair.generate(rng)
+        if not pair.valid(text):
+            rejected += 1
+            continue
+        differ, _, _ = compare(pair, text)
+        if differ:
+            if minimize:
+                text = shrink(pair, text)
+            _, expected, actual = compare(pair, text)
+            return dict(day=pair.day, reference=pair.name, parts=pair.parts, runs=run + 1,
+                        rejected=rejected,
+                        failure=dict(input=text, expected=expected, actual=actual))
+    return dict(day=pair.day, reference=pair.name, parts=pair.parts, runs=runs,
+                rejected=rejected, failure=None)
+
+def fuzz(fuzz_days=None, runs=200, seed=0, minimize=True):
+    """
+    Fuzzes every pair of the requested days.
+
+    Args:
+    fuzz_days (list): Days to fuzz. Defaults to every day with a pair.
+    runs (int): Number of inputs per pair.
+    seed (int): Seed of the random inputs.
+    minimize (bool): Shrink the failing inputs.
+
+    Returns:
+    list: The results of fuzz_pair.
+    """
+    return [fuzz_pair(pair, runs, seed, minimize) for pair in PAIRS
+            if fuzz_days is None or pair.day in fuzz_days]
+
+def format_results(results):
+    """
+    Formats fuzzing results, with the minimal failing inputs.
+
+    Args:
+    results (list): Results as returned by fuzz.
+
+    Returns:
+    str: The report.
+    """
+    lines = []
+    for result in results:
+        parts = "+".join(map(str, result["parts"]))
+        status = "ok" if result["failure"] is None else "MISMATCH"
+        lines.append(f"day {result['day']} part {parts} vs {result['reference']}: "
+                     f"{result['runs']} inputs, {result['rejected']} rejected, {status}")
+        if result["failure"] is not None:
+            lines.append(f"  expected {result['failure']['expected']}, "
+                         f"got {result['failure']['actual']} on:")
+            lines.extend("    " + line for line in result["failure"]["input"].splitlines())
+    return "\n".join(lines)
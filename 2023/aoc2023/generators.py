@@ -0,0 +1,598 @@
+"""
+Seeded, size-parameterised generators of synthetic puzzle inputs.
+
+There is one generator per day, ``dayN(size, seed)``, yielding the lines
+of an input file that the day's ``parse_input`` accepts, so that a big input
+can be written as it is generated. The meaning of ``size`` depends on the
+day (lines, hands, galaxies, side of a grid...) and PUZZLE_SIZES holds the
+value that matches the size of a real puzzle input. ``scale`` multiplies
+the amount of input: ``generate(day, scale=100)`` gives an input about 100
+times bigger, so the side of the square grids of GRID_DAYS grows by the
+square root of the scale. The same (day, size, seed) always gives the same
+text.
+"""
+import itertools
+import math
+import random
+import string
+from collections import Counter, defaultdict
+
+# Value of `size` that gives an input as big as the real puzzle input.
+PUZZLE_SIZES = {
+    1: 1000,   # lines
+    2: 100,    # games
+    3: 140,    # side of the schematic
+    4: 200,    # cards
+    5: 30,     # ranges per map
+    6: 4,      # races
+    7: 1000,   # hands
+    8: 750,    # nodes
+    9: 200,    # reports
+    10: 140,   # side of the grid
+    11: 440,   # galaxies
+    13: 100,   # patterns
+    14: 100,   # side of the platform
+    15: 4000,  # steps of the initialization sequence
+    16: 110,   # side of the contraption
+    17: 141,   # side of the city map
+    18: 700,   # instructions of the dig plan (approximately)
+}
+
+# Days whose size is the side of a square grid
+GRID_DAYS = (3, 10, 14, 16, 17)
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+CARDS = "AKQJT98765432"
+SYMBOLS = "*#+$/@=%&-"
+MAP_NAMES = [
+    "seed-to-soil map",
+    "soil-to-fertilizer map",
+    "fertilizer-to-water map",
+    "water-to-light map",
+    "light-to-temperature map",
+    "temperature-to-humidity map",
+    "humidity-to-location map"
+]
+# Pipe shapes by the set of (dx, dy) directions they connect.
+PIPES = {
+    frozenset([(-1, 0), (1, 0)]): '|',
+    frozenset([(0, -1), (0, 1)]): '-',
+    frozenset([(-1, 0), (0, 1)]): 'L',
+    frozenset([(-1, 0), (0, -1)]): 'J',
+    frozenset([(1, 0), (0, -1)]): '7',
+    frozenset([(1, 0), (0, 1)]): 'F',
+}
+# Dig plan directions: (letter of part 1, digit of part 2) by (dx, dy).
+DIG_DIRECTIONS = {(0, 1): ('R', 0), (1, 0): ('D', 1), (0, -1): ('L', 2), (-1, 0): ('U', 3)}
+
+
+def _primes_below(limit):
+    """
+    Lists the primes lower or equal than limit, in decreasing order.
+
+    Args:
+    limit (int): The upper bound.
+
+    Returns:
+    list: The primes, biggest first.
+    """
+    primes = []
+    for candidate in range(2, limit + 1):
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+    return primes[::-1]
+
+def _random_loop(rng, rows, cols, cells):
+    """
+    Builds a closed path of tiles that never crosses itself.
+
+    A region of `cells` coarse cells is grown at random inside a rows x cols
+    coarse grid, joined by a spanning tree. Every coarse cell is split in
+    2x2 tiles and the path walks around the tree, visiting every tile of the
+    region exactly once.
+
+    Args:
+    rng (random.Random): The random generator.
+    rows (int): Rows of the coarse grid.
+    cols (int): Columns of the coarse grid.
+    cells (int): Number of coarse cells of the region.
+
+    Returns:
+    list: The (x, y) tiles of the path in order, in a 2*rows x 2*cols grid.
+    The last tile is adjacent to the first one.
+    """
+    start = (rows // 2, cols // 2)
+    region = {start}
+    tree = set()
+    frontier = [(start, (start[0] + dx, start[1] + dy)) for dx, dy in DIG_DIRECTIONS]
+    while len(region) < cells and frontier:
+        index = rng.randrange(len(frontier))
+        frontier[index], frontier[-1] = frontier[-1], frontier[index]
+        parent, child = frontier.pop()
+        if child in region or not (0 <= child[0] < rows and 0 <= child[1] < cols):
+            continue
+        region.add(child)
+        tree.add((parent, child))
+        tree.add((child, parent))
+        frontier.extend((child, (child[0] + dx, child[1] + dy)) for dx, dy in DIG_DIRECTIONS)
+
+    links = defaultdict(list)
+
+    def link(a, b):
+        links[a].append(b)
+        links[b].append(a)
+
+    for i, j in region:
+        top_left, top_right = (2 * i, 2 * j), (2 * i, 2 * j + 1)
+        bottom_left, bottom_right = (2 * i + 1, 2 * j), (2 * i + 1, 2 * j + 1)
+        if ((i, j), (i - 1, j)) not in tree:
+            link(top_left, top_right)
+        if ((i, j), (i, j - 1)) not in tree:
+            link(top_left, bottom_left)
+        if ((i, j), (i, j + 1)) in tree:
+            link(top_right, (2 * i, 2 * j + 2))
+            link(bottom_right, (2 * i + 1, 2 * j + 2))
+        else:
+            link(top_right, bottom_right)
+        if ((i, j), (i + 1, j)) in tree:
+            link(bottom_left, (2 * i + 2, 2 * j))
+            link(bottom_right, (2 * i + 2, 2 * j + 1))
+        else:
+            link(bottom_left, bottom_right)
+
+    first = (2 * start[0], 2 * start[1])
+    path = [first]
+    previous, current = None, first
+    while True:
+        following = links[current][0] if links[current][0] != previous else links[current][1]
+        if following == first:
+            return path
+        path.append(following)
+        previous, current = current, following
+
+# Generators
+
+def day1(size, seed=0):
+    """
+    Calibration document with `size` lines mixing letters, digits and
+    spelled-out digits. Every line has at least one numeric digit.
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        pieces = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 8)):
+            choice = rng.random()
+            if choice < 0.5:
+                pieces.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 4))))
+            elif choice < 0.8:
+                pieces.append(rng.choice(DIGIT_WORDS))
+            else:
+                pieces.append(str(rng.randint(1, 9)))
+        rng.shuffle(pieces)
+        yield "".join(pieces) + "\n"
+
+def day2(size, seed=0):
+    """
+    Record of `size` games, each with one to six sets of red, green and blue cubes.
+    """
+    rng = random.Random(seed)
+    for game in range(1, size + 1):
+        sets = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            sets.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        yield f"Game {game}: " + "; ".join(sets) + "\n"
+
+def day3(size, seed=0):
+    """
+    Engine schematic of `size` x `size` with numbers of one to three digits,
+    symbols and gears.
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            choice = rng.random()
+            if choice < 0.12:
+                row.extend(str(rng.randint(1, 999)))
+                row.append('.')
+            elif choice < 0.16:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append('.')
+        yield "".join(row[:size]) + "\n"
+
+def day4(size, seed=0):
+    """
+    Pile of `size` scratchcards with 10 winning numbers and 25 numbers you have.
+    The matches of a card never win copies past the last card.
+    """
+    rng = random.Random(seed)
+    width = len(str(size))
+    for card in range(1, size + 1):
+        winning = rng.sample(range(1, 100), 10)
+        matches = min(rng.choice([0, 0, 0, 0, 1, 1, 2, 3, 4, 10]), size - card)
+        have = rng.sample(winning, matches)
+        have += rng.sample([x for x in range(1, 100) if x not in winning], 25 - matches)
+        rng.shuffle(have)
+        yield (f"Card {card:>{width}}: " + " ".join(f"{x:>2}" for x in winning)
+               + " | " + " ".join(f"{x:>2}" for x in have) + "\n")
+
+def day5(size, seed=0):
+    """
+    Almanac whose seven maps have `size` ranges each, with max(10, size // 4)
+    seed ranges. Source ranges never overlap inside a map.
+    """
+    rng = random.Random(seed)
+    limit = 2 ** 32
+    seeds = []
+    for _ in range(max(10, size // 4)):
+        start = rng.randrange(limit - 10 ** 8)
+        seeds += [start, rng.randint(1, 10 ** 8)]
+    yield "seeds: " + " ".join(map(str, seeds)) + "\n"
+    for name in MAP_NAMES:
+        bounds = sorted(rng.sample(range(limit), 2 * size))
+        ranges = []
+        for start, end in zip(bounds[::2], bounds[1::2]):
+            length = end - start
+            ranges.append(f"{rng.randrange(limit - length)} {start} {length}")
+        rng.shuffle(ranges)
+        yield f"\n{name}:\n"
+        for line in ranges:
+            yield line + "\n"
+
+def day6(size, seed=0):
+    """
+    Sheet of `size` races with times between 7 and 99.
+    Part 2 reads all the times as a single number, so its work grows
+    exponentially with `size`.
+    """
+    rng = random.Random(seed)
+    times = [rng.randint(7, 99) for _ in range(size)]
+    distances = [rng.randint(1, t * t // 4 - 1) for t in times]
+    yield "Time:    " + " ".join(f"{t:>4}" for t in times) + "\n"
+    yield "Distance:" + " ".join(f"{d:>4}" for d in distances) + "\n"
+
+def day7(size, seed=0):
+    """
+    List of `size` hands with bids between 1 and 1000.
+
+    The hands are distinct up to the 13**5 hands there are. Past that, hands
+    already listed are repeated with their bid. day7.quicksort keeps the
+    equal hands next to each other, and as they have the same bid their
+    order doesn't change the total winnings.
+    """
+    rng = random.Random(seed)
+    distinct = len(CARDS) ** 5
+    if size < distinct:
+        hands = set()
+        lines = []
+        while len(lines) < size:
+            hand = "".join(rng.choices(CARDS, k=5))
+            if hand not in hands:
+                hands.add(hand)
+                lines.append(f"{hand} {rng.randint(1, 1000)}\n")
+    else:
+        lines = [f"{''.join(hand)} {rng.randint(1, 1000)}\n"
+                 for hand in itertools.product(CARDS, repeat=5)]
+        rng.shuffle(lines)
+    yield from lines
+    for _ in range(size - len(lines)):
+        yield rng.choice(lines)
+
+def _hand_strength(hand):
+    """
+    Sort key of a hand in the order of part 1 of day 7, weakest first.
+    """
+    shape = sorted(Counter(hand).values(), reverse=True)
+    return shape, [-CARDS.index(card) for card in hand]
+
+def day7_presorted(size, seed=0):
+    """
+    The hands of day7(size, seed) listed from the weakest to the strongest,
+    the worst case of a quicksort that takes its first element as pivot.
+    """
+    lines = list(day7(size, seed))
+    lines.sort(key=lambda line: _hand_strength(line.split(" ")[0]))
+    yield from lines
+
+def _name(number, width, alphabet=string.ascii_uppercase + string.digits):
+    """
+    Writes a number in base len(alphabet) with `width` letters of the alphabet.
+    """
+    letters = []
+    for _ in range(width):
+        number, digit = divmod(number, len(alphabet))
+        letters.append(alphabet[digit])
+    return "".join(reversed(letters))
+
+def day8(size, seed=0):
+    """
+    Network of about `size` nodes made of independent cycles.
+
+    Every cycle starts at a node ending with 'A' (the first one is 'AAA') and
+    reaches its node ending with 'Z' (the first one is 'ZZZ') after a prime
+    number of passes over the instructions, so both parts have an answer.
+    Node names have three characters as in the puzzle, or more when there
+    are too many nodes to name them with three.
+    """
+    rng = random.Random(seed)
+    alphabet = string.ascii_uppercase + string.digits
+    ghosts = max(1, min(6, size // 20))
+    per_ghost = max(4, size // ghosts)
+    length = _primes_below(max(2, math.isqrt(per_ghost) // 2))[0]
+    passes = [p for p in _primes_below(max(2, per_ghost // length)) if p != length][:ghosts]
+    if not passes:
+        passes = [1]
+    needed = sum(p * length - 1 for p in passes)
+    # The other nodes end with neither 'A' nor 'Z'
+    inner_count = len(alphabet) ** 2 * (len(alphabet) - 2)
+    if needed <= inner_count:
+        inner = [a + b + c for a in alphabet for b in alphabet for c in alphabet if c not in "AZ"]
+        names = iter(rng.sample(inner, needed))
+        prefixes = rng.sample([a + b for a in alphabet for b in alphabet
+                               if a + b not in ("AA", "ZZ")], len(passes) - 1)
+    else:
+        width = 4
+        while len(alphabet) ** (width - 1) * (len(alphabet) - 2) < needed:
+            width += 1
+        endings = alphabet.replace("A", "").replace("Z", "")
+        names = (_name(number // len(endings), width - 1) + endings[number % len(endings)]
+                 for number in rng.sample(range(len(alphabet) ** (width - 1) * len(endings)),
+                                          needed))
+        prefixes = [_name(number, width - 1)
+                    for number in rng.sample(range(len(alphabet) ** (width - 1)), len(passes) - 1)]
+    starts = ["AAA"] + [prefix + "A" for prefix in prefixes]
+    ends = ["ZZZ"] + [prefix + "Z" for prefix in prefixes]
+
+    instructions = "".join(rng.choice("LR") for _ in range(length))
+    nodes = {}
+    for start, end, cycle in zip(starts, ends, passes):
+        chain = [start] + [next(names) for _ in range(cycle * length - 1)] + [end]
+        for i, node in enumerate(chain[:-1]):
+            following = chain[i + 1]
+            other = rng.choice(chain[1:])
+            nodes[node] = (following, other) if instructions[i % length] == 'L' else (other, following)
+        nodes[end] = nodes[start]
+    lines = [f"{node} = ({left}, {right})\n" for node, (left, right) in nodes.items()]
+    rng.shuffle(lines)
+    yield instructions + "\n\n"
+    yield from lines
+
+def day9(size, seed=0):
+    """
+    OASIS report of `size` histories of 21 values, each following a
+    polynomial of degree up to 6 with small integer coefficients.
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 7))]
+        values = [sum(c * x ** k for k, c in enumerate(coefficients)) for x in range(21)]
+        yield " ".join(map(str, values)) + "\n"
+
+def day10(size, seed=0):
+    """
+    Field of `size` x `size` tiles with one main loop through 'S' and junk
+    pipes everywhere else, including the tiles enclosed by the loop.
+    """
+    if size < 6:
+        raise ValueError("The field needs at least 6 x 6 tiles")
+    rng = random.Random(seed)
+    coarse = (size - 2) // 4
+    loop = _random_loop(rng, coarse, coarse, max(1, coarse * coarse * 3 // 5))
+    # The loop visits every tile of its region: doubling it leaves tiles inside.
+    path = []
+    for k, (x, y) in enumerate(loop):
+        nx, ny = loop[(k + 1) % len(loop)]
+        path += [(2 * x, 2 * y), (x + nx, y + ny)]
+    grid = [[rng.choice("|-LJ7F..") for _ in range(size)] for _ in range(size)]
+    for k, (x, y) in enumerate(path):
+        neighbours = (path[k - 1], path[(k + 1) % len(path)])
+        grid[x + 1][y + 1] = PIPES[frozenset((nx - x, ny - y) for nx, ny in neighbours)]
+    x, y = rng.choice(path)
+    x, y = x + 1, y + 1
+    grid[x][y] = 'S'
+    path_tiles = {(px + 1, py + 1) for px, py in path}
+    for dx, dy in DIG_DIRECTIONS:
+        if (x + dx, y + dy) not in path_tiles:
+            grid[x + dx][y + dy] = '.'
+    for row in (0, size - 1):
+        grid[row] = ['.'] * size
+    for row in grid:
+        row[0] = row[-1] = '.'
+    for row in grid:
+        yield "".join(row) + "\n"
+
+def day11(size, seed=0):
+    """
+    Image of a universe with `size` galaxies, as dense as the puzzle input.
+    """
+    rng = random.Random(seed)
+    side = max(2, math.ceil(math.sqrt(size / 0.022)))
+    galaxies = sorted(rng.sample(range(side * side), min(size, side * side)), reverse=True)
+    for start in range(0, side * side, side):
+        row = ['.'] * side
+        while galaxies and galaxies[-1] < start + side:
+            row[galaxies.pop() - start] = '#'
+        yield "".join(row) + "\n"
+
+def day13(size, seed=0):
+    """
+    Notes with `size` patterns of 5 to 17 rows and columns. Every pattern is
+    mirrored around one random line; half of them get one smudge inside the
+    mirrored part, which turns that line into a part 2 reflection.
+    """
+    rng = random.Random(seed)
+    for number in range(size):
+        rows, cols = rng.randint(5, 17), rng.randint(5, 17)
+        axis = rng.randint(0, rows - 2)
+        grid = [[rng.choice("#.") for _ in range(cols)] for _ in range(rows)]
+        for offset in range(min(axis + 1, rows - axis - 1)):
+            grid[axis + 1 + offset] = list(grid[axis - offset])
+        if rng.random() < 0.5:
+            row = axis - rng.randrange(min(axis + 1, rows - axis - 1))
+            col = rng.randrange(cols)
+            grid[row][col] = '#' if grid[row][col] == '.' else '.'
+        pattern = ["".join(row) for row in grid]
+        if rng.random() < 0.5:
+            pattern = ["".join(column) for column in zip(*pattern)]
+        if number:
+            yield "\n"
+        for line in pattern:
+            yield line + "\n"
+
+def day14(size, seed=0):
+    """
+    Platform of `size` x `size` with rounded rocks ('O') and cube rocks ('#').
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield "".join(rng.choices(".O#", weights=(62, 20, 18), k=size)) + "\n"
+
+def day15(size, seed=0):
+    """
+    Initialization sequence of `size` steps over about size // 4 labels.
+    """
+    rng = random.Random(seed)
+    labels = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+              for _ in range(max(1, size // 4))]
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        if rng.random() < 0.7:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+        else:
+            steps.append(f"{label}-")
+    for k, step in enumerate(steps):
+        yield ("," if k else "") + step
+    yield "\n"
+
+def day16(size, seed=0, width=None):
+    """
+    Contraption of `size` rows and `width` columns (default: square) with
+    about 10% of mirrors and splitters.
+    """
+    rng = random.Random(seed)
+    width = size if width is None else width
+    for _ in range(size):
+        yield "".join(rng.choices(".\\/|-", weights=(90, 2.5, 2.5, 2.5, 2.5), k=width)) + "\n"
+
+def day17(size, seed=0):
+    """
+    City map of `size` x `size` blocks with heat losses between 1 and 9.
+    """
+    if size < 5:
+        raise ValueError("The ultra crucible needs a map of at least 5 x 5")
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield "".join(rng.choices("123456789", k=size)) + "\n"
+
+def day18(size, seed=0):
+    """
+    Dig plan of about `size` instructions describing a lagoon that never
+    crosses itself. The steps of part 1 are short, the ones encoded in the
+    colors are up to a few thousand meters, as long as every step fits in
+    the five hexadecimal digits of a color.
+    """
+    rng = random.Random(seed)
+    cells = max(1, size // 2)
+    side = math.isqrt(2 * cells) + 2
+    path = _random_loop(rng, side, side, cells)
+    # Stretching the rows and columns keeps the lagoon from crossing itself.
+    long_step = max(1, min(5000, 0xFFFFF // (2 * side)))
+    short = [0]
+    long_ = [0]
+    for _ in range(2 * side):
+        short.append(short[-1] + rng.randint(1, 9))
+        long_.append(long_[-1] + rng.randint(1, long_step))
+
+    turns = []
+    for k, (x, y) in enumerate(path):
+        nx, ny = path[(k + 1) % len(path)]
+        direction = (nx - x, ny - y)
+        if turns and turns[-1][0] == direction:
+            turns[-1][2] = (nx, ny)
+        else:
+            turns.append([direction, (x, y), (nx, ny)])
+    if len(turns) > 1 and turns[0][0] == turns[-1][0]:
+        turns[0][1] = turns.pop()[1]
+
+    for direction, (x0, y0), (x1, y1) in turns:
+        letter, digit = DIG_DIRECTIONS[direction]
+        if direction[0]:
+            steps, steps2 = abs(short[x1] - short[x0]), abs(long_[x1] - long_[x0])
+        else:
+            steps, steps2 = abs(short[y1] - short[y0]), abs(long_[y1] - long_[y0])
+        yield f"{letter} {steps} (#{steps2:05x}{digit})\n"
+
+GENERATORS = {
+    1: day1, 2: day2, 3: day3, 4: day4, 5: day5, 6: day6, 7: day7, 8: day8,
+    9: day9, 10: day10, 11: day11, 13: day13, 14: day14, 15: day15, 16: day16,
+    17: day17, 18: day18,
+}
+
+# Generators of adversarial inputs, by variant name and day.
+VARIANTS = {
+    "presorted": {7: day7_presorted},
+}
+
+def scaled_size(day, scale):
+    """
+    Size of an input about `scale` times bigger than the puzzle input.
+
+    Args:
+    day (int): The day number.
+    scale (float): Multiplier of the amount of input. For the square grids
+    of GRID_DAYS, it multiplies the cells, so the side grows by its square
+    root.
+
+    Returns:
+    int: The size, for the day's generator.
+    """
+    if day in GRID_DAYS:
+        scale = math.sqrt(scale)
+    return max(1, round(PUZZLE_SIZES[day] * scale))
+
+def generate_lines(day, size=None, seed=0, scale=1, variant=None):
+    """
+    Generates the lines of a synthetic input, without holding the whole text.
+
+    Args:
+    day (int): The day number.
+    size (int): Size of the input, with the meaning of that day's generator.
+    Defaults to scaled_size(day, scale).
+    seed (int): Seed of the random generator.
+    scale (float): Multiplier of the amount of input (see scaled_size),
+    used when size is None.
+    variant (str): Name of an adversarial variant of VARIANTS, e.g.
+    'presorted'. Defaults to the random input.
+
+    Returns:
+    iterator: The pieces of the input file, mostly whole lines.
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"There is no generator for day {day}")
+    if variant is not None and day not in VARIANTS.get(variant, {}):
+        raise ValueError(f"There is no {variant} variant for day {day}")
+    if size is None:
+        size = scaled_size(day, scale)
+    return (VARIANTS[variant][day] if variant else GENERATORS[day])(size, seed)
+
+def generate(day, size=None, seed=0, scale=1, variant=None):
+    """
+    Generates the text of a synthetic input.
+
+    Args:
+    day (int): The day number.
+    size (int): Size of the input, with the meaning of that day's generator.
+    Defaults to scaled_size(day, scale).
+    seed (int): Seed of the random generator.
+    scale (float): Multiplier of the amount of input (see scaled_size),
+    used when size is None.
+    variant (str): Name of an adversarial variant of VARIANTS, e.g.
+    'presorted'. Defaults to the random input.
+
+    Returns:
+    str: The content of the input file.
+    """
+    return "".join(generate_lines(day, size, seed, scale, variant))
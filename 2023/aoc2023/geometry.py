@@ -0,0 +1,127 @@
+"""
+Exact integer geometry of lattice polygons, shared by days 10 and 18.
+
+The shoelace formula is evaluated on integers and returns twice the area,
+which is always an integer for a polygon with integer vertices, so the
+results stay exact however big the polygon is. Pick's theorem then gives
+the number of interior lattice points from twice the area and the number of
+boundary points.
+
+The functions take any iterable of (x, y) vertices and consume it in one
+pass, without building a list. twice_area_batch is a vectorised variant
+for vertices already stored in two sequences, such as the columns of day
+18; it uses NumPy when it is installed and the coordinates are small enough
+for int64 to be exact. NumPy is only imported by its first call, so that
+importing the module stays cheap.
+"""
+import math
+
+_INT64_MAX = 2 ** 63 - 1
+
+def measure(vertices):
+    """
+    Twice the area and the number of boundary points of a polygon.
+
+    Args:
+    vertices (iterable): The (x, y) integer vertices, in order along the
+    boundary. The first one may be repeated at the end.
+
+    Returns:
+    tuple: Twice the area and the number of lattice points on the boundary.
+    """
+    iterator = iter(vertices)
+    first = next(iterator, None)
+    if first is None:
+        return 0, 0
+    x_0, y_0 = first
+    x_prev, y_prev = first
+    cross = 0
+    boundary = 0
+    for x, y in iterator:
+        cross += x_prev * y - x * y_prev
+        boundary += math.gcd(x - x_prev, y - y_prev)
+        x_prev, y_prev = x, y
+    cross += x_prev * y_0 - x_0 * y_prev
+    boundary += math.gcd(x_0 - x_prev, y_0 - y_prev)
+    return abs(cross), boundary
+
+def twice_area(vertices):
+    """
+    Twice the area of a polygon, with the shoelace formula.
+
+    Args:
+    vertices (iterable): The (x, y) integer vertices, in order along the boundary.
+
+    Returns:
+    int: Twice the area.
+    """
+    return measure(vertices)[0]
+
+def boundary_points(vertices):
+    """
+    Number of lattice points on the boundary of a polygon.
+
+    Args:
+    vertices (iterable): The (x, y) integer vertices, in order along the boundary.
+
+    Returns:
+    int: The number of boundary points.
+    """
+    return measure(vertices)[1]
+
+def interior_points(double_area, boundary):
+    """
+    Number of interior lattice points of a polygon, with Pick's theorem.
+
+    Args:
+    double_area (int): Twice the area of the polygon.
+    boundary (int): The number of lattice points on its boundary.
+
+    Returns:
+    int: The number of interior points.
+    """
+    return (double_area - boundary + 2) // 2
+
+def lattice_points(vertices):
+    """
+    Number of lattice points inside or on the boundary of a polygon.
+
+    Args:
+    vertices (iterable): The (x, y) integer vertices, in order along the boundary.
+
+    Returns:
+    int: The number of interior and boundary points.
+    """
+    double_area, boundary = measure(vertices)
+    return boundary + interior_points(double_area, boundary)
+
+def twice_area_batch(xs, ys):
+    """
+    Twice the area of a polygon whose coordinates are stored in two sequences.
+
+    NumPy is used when it is installed and the products of the coordinates
+    can't overflow int64; otherwise the sum is done on Python integers.
+
+    Args:
+    xs (sequence): The x coordinates of the vertices, in order.
+    ys (sequence): The y coordinates of the vertices, in the same order.
+
+    Returns:
+    int: Twice the area.
+    """
+    size = len(xs)
+    if size == 0:
+        return 0
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is not None:
+        largest = max(max(map(abs, xs)), max(map(abs, ys)))
+        # Both dot products below sum size products of two coordinates
+        if 2 * size * largest * largest <= _INT64_MAX:
+            x = numpy.asarray(xs, dtype=numpy.int64)
+            y = numpy.asarray(ys, dtype=numpy.int64)
+            cross = numpy.dot(x, numpy.roll(y, -1)) - numpy.dot(numpy.roll(x, -1), y)
+            return abs(int(cross))
+    return twice_area(zip(xs, ys))
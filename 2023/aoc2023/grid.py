@@ -0,0 +1,255 @@
+"""
+Compact two-dimensional grid shared by the grid days (3, 10, 11, 13, 14, 16
+and 17).
+
+A Grid keeps its cells row by row in one flat buffer: a ``bytearray`` of the
+characters of the input, or an ``array('b')`` of small integers such as the
+digits of day 17. Every row is surrounded by a border of sentinel cells, so
+a cell is addressed by a single index, ``(x + 1) * stride + (y + 1)``, and a
+step in any direction is the addition of an offset (see ``offset`` and
+``neighbours``). A walk that leaves the grid lands on a border cell instead
+of raising or wrapping around, which removes the bounds checks from the
+inner loops of the solvers.
+"""
+from array import array
+
+# Translates the ASCII digits to their values, for Grid.from_digits.
+_DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+def _padded(rows, pad):
+    """
+    Lays rows of bytes out in one buffer surrounded by a border.
+
+    Args:
+    rows (list of bytes): The rows, all of the same length.
+    pad (int): The byte of the border cells.
+
+    Returns:
+    tuple: The height, the width and the bytearray of the cells.
+    """
+    width = len(rows[0]) if rows else 0
+    stride = width + 2
+    edge = bytes((pad,))
+    cells = bytearray(edge * stride)
+    for row in rows:
+        if len(row) != width:
+            raise ValueError("All the rows of a grid must have the same length")
+        cells += edge
+        cells += row
+        cells += edge
+    cells += edge * stride
+    return len(rows), width, cells
+
+def _row_bytes(line):
+    return line.encode() if isinstance(line, str) else bytes(line)
+
+class Grid:
+    """
+    Rectangular grid stored in one flat buffer with a sentinel border.
+
+    Attributes:
+    height (int): Number of rows.
+    width (int): Number of columns.
+    stride (int): Distance between the indices of two vertically adjacent
+    cells, i.e. width + 2.
+    cells (bytearray or array): The cells, border included.
+    border (int): Value of the border cells.
+    neighbours (tuple): Offsets of the north, east, south and west neighbours.
+    """
+    __slots__ = ("height", "width", "stride", "cells", "border", "neighbours")
+
+    def __init__(self, height, width, cells, border):
+        self.height = height
+        self.width = width
+        self.stride = width + 2
+        self.cells = cells
+        self.border = border
+        self.neighbours = (-self.stride, 1, self.stride, -1)
+
+    @classmethod
+    def from_lines(cls, lines, border=" "):
+        """
+        Builds a grid of characters.
+
+        Args:
+        lines (iterable): The rows, as str or bytes-like, e.g. the lines
+        yielded by reader.lines.
+        border (str): The character of the border cells. It should not
+        appear in the grid when it is used to detect the edges.
+
+        Returns:
+        Grid: The grid, whose cells hold the byte value of every character.
+        """
+        pad = ord(border)
+        return cls(*_padded([_row_bytes(line) for line in lines], pad), pad)
+
+    @classmethod
+    def from_digits(cls, lines, border=-1):
+        """
+        Builds a grid of single digit numbers.
+
+        Args:
+        lines (iterable): The rows, as str or bytes-like, made of digits.
+        border (int): The value of the border cells, between -128 and 127.
+
+        Returns:
+        Grid: The grid, whose cells are an array('b') of the digit values.
+        """
+        rows = [_row_bytes(line).translate(_DIGIT_VALUES) for line in lines]
+        height, width, cells = _padded(rows, border & 0xFF)
+        return cls(height, width, array('b', bytes(cells)), border)
+
+    def index(self, x, y):
+        """
+        Flat index of a cell.
+
+        Args:
+        x (int): The row, from -1 (border) to height (border).
+        y (int): The column, from -1 (border) to width (border).
+
+        Returns:
+        int: The index of the cell in cells.
+        """
+        return (x + 1) * self.stride + y + 1
+
+    def position(self, index):
+        """
+        Row and column of a flat index.
+
+        Args:
+        index (int): The index of a cell in cells.
+
+        Returns:
+        tuple: The (x, y) position of the cell.
+        """
+        x, y = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def offset(self, dx, dy):
+        """
+        Difference between the indices of two cells.
+
+        Args:
+        dx (int): Number of rows to move down.
+        dy (int): Number of columns to move right.
+
+        Returns:
+        int: The number to add to an index to make the move.
+        """
+        return dx * self.stride + dy
+
+    def inside(self, index):
+        """
+        Tells whether a flat index is a cell of the grid and not of its border.
+
+        Args:
+        index (int): The index.
+
+        Returns:
+        bool: True if the index is inside the grid.
+        """
+        x, y = self.position(index)
+        return 0 <= x < self.height and 0 <= y < self.width
+
+    def find(self, value, start=0):
+        """
+        Finds the first cell holding a value.
+
+        Args:
+        value (str or int): The character (grids of characters) or number.
+        start (int): Index to start searching from.
+
+        Returns:
+        int: The index of the cell, or -1 if there is none.
+        """
+        if isinstance(value, str):
+            value = ord(value)
+        if isinstance(self.cells, bytearray):
+            return self.cells.find(value, start)
+        try:
+            return self.cells.index(value, start)
+        except ValueError:
+            return -1
+
+    def row(self, x):
+        """
+        View of a row, without its border. It doesn't copy the cells.
+
+        Args:
+        x (int): The row.
+
+        Returns:
+        memoryview: The cells of the row.
+        """
+        start = self.index(x, 0)
+        return memoryview(self.cells)[start:start + self.width]
+
+    def column(self, y):
+        """
+        View of a column, without its border. It doesn't copy the cells.
+
+        Args:
+        y (int): The column.
+
+        Returns:
+        memoryview: The cells of the column.
+        """
+        start = self.index(0, y)
+        return memoryview(self.cells)[start:start + self.height * self.stride:self.stride]
+
+    def rows(self, copy=False):
+        """
+        Views of all the rows, from top to bottom.
+
+        Args:
+        copy (bool): Return copies (bytearray or array) instead of views.
+        They are faster to compare with each other.
+
+        Returns:
+        list of memoryview: The rows.
+        """
+        cells = self.cells if copy else memoryview(self.cells)
+        first = self.stride + 1
+        return [cells[start:start + self.width]
+                for start in range(first, first + self.height * self.stride, self.stride)]
+
+    def columns(self, copy=False):
+        """
+        Views of all the columns, from left to right.
+
+        Args:
+        copy (bool): Return copies (bytearray or array) instead of views.
+        They are faster to compare with each other.
+
+        Returns:
+        list of memoryview: The columns.
+        """
+        cells = self.cells if copy else memoryview(self.cells)
+        first = self.stride + 1
+        end = first + self.height * self.stride
+        return [cells[start:end:self.stride] for start in range(first, first + self.width)]
+
+    def copy(self):
+        """
+        Copy of the grid that doesn't share its cells.
+
+        Returns:
+        Grid: The copy.
+        """
+        return Grid(self.height, self.width, self.cells[:], self.border)
+
+    def __getitem__(self, position):
+        x, y = position
+        return self.cells[(x + 1) * self.stride + y + 1]
+
+    def __setitem__(self, position, value):
+        x, y = position
+        self.cells[(x + 1) * self.stride + y + 1] = value
+
+    def __str__(self):
+        if isinstance(self.cells, bytearray):
+            return "\n".join(row.tobytes().decode('latin-1') for row in self.rows())
+        return "\n".join("".join(map(str, row)) for row in self.rows())
+
+    def __repr__(self):
+        return f"Grid(height={self.height}, width={self.width})"
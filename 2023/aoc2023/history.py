@@ -0,0 +1,283 @@
+"""
+History of the benchmark results, and their trends.
+
+Every benchmark row of ``run`` and ``gate`` is appended as a JSON line to
+a history file, with the time, the machine, the Python version and the git
+revision it was measured on, and an identifier of its input (the name and
+hash of the input file, or the size and seed of a generated one).
+
+The trend report groups the entries into series: the same phase of the
+same day, on the same input, machine and Python version. The latest WINDOW entries of a
+series are compared with the REFERENCE entries before them with a one-sided
+Mann-Whitney U test on their fastest timings. It makes no assumption on
+the distribution of the timings, which are skewed by noise. A phase is
+flagged as slower when the test is significant and the median slowdown is
+above the minimal effect, so that small significant drifts don't flag.
+"""
+import datetime
+import functools
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+
+from aoc2023 import days
+
+DEFAULT_HISTORY = os.path.join(days.YEAR_DIR, "benchmarks", "history.jsonl")
+WINDOW = 3
+REFERENCE = 20
+ALPHA = 0.05
+MIN_EFFECT = 0.05
+SPARKS = "▁▂▃▄▅▆▇█"
+
+def _git(*args):
+    try:
+        result = subprocess.run(("git",) + args, cwd=days.YEAR_DIR, capture_output=True,
+                                text=True, timeout=10, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+@functools.lru_cache(maxsize=None)
+def environment():
+    """
+    Description of where the benchmarks run.
+
+    Returns:
+    dict: The machine (host name, architecture, processor, CPU count and
+    operating system), the Python implementation and version, and the git
+    revision with whether the working tree had uncommitted changes.
+    """
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return dict(host=platform.node(), arch=platform.machine(), processor=platform.processor(),
+                cpus=os.cpu_count(), system=platform.platform(),
+                python=f"{platform.python_implementation()} {platform.python_version()}",
+                revision=_git("rev-parse", "--short=12", "HEAD"),
+                dirty=bool(status) if status is not None else None)
+
+def input_id(day, path=None):
+    """
+    Identifier of the input file of a day: its name and the start of its hash.
+
+    Args:
+    day (int): The day number.
+    path (str): Input file. Defaults to dayN.txt in the day directory.
+
+    Returns:
+    str: The identifier.
+    """
+    path = path or days.input_path(day)
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return f"{os.path.basename(path)}:{digest[:12]}"
+
+def record(rows, source, path=DEFAULT_HISTORY, input_path=None):
+    """
+    Appends benchmark rows to the history.
+
+    Args:
+    rows (list): Rows of bench.bench_day or regression.run_suite.
+    source (str): The command that measured them, e.g. 'run' or 'gate'.
+    path (str): The history file.
+    input_path (str): Input file of the rows of bench.bench_day. Defaults to
+    dayN.txt of each day. Rows with a size and a seed were generated.
+
+    Returns:
+    int: Number of entries written.
+    """
+    stamp = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+    env = environment()
+    inputs = {}
+    lines = []
+    for row in rows:
+        if "size" in row:
+            source_input = f"generated:{row['size']}:{row['seed']}"
+        else:
+            if row["day"] not in inputs:
+                inputs[row["day"]] = input_id(row["day"], input_path)
+            source_input = inputs[row["day"]]
+        entry = dict(time=stamp, source=source, input=source_input, **env,
+                     day=row["day"], phase=row["phase"], answer=row["answer"],
+                     runs=row["runs"], min_ns=row["min_ns"], median_ns=row["median_ns"],
+                     p95_ns=row["p95_ns"])
+        lines.append(json.dumps(entry, default=str) + "\n")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.writelines(lines)
+    return len(lines)
+
+def load(path=DEFAULT_HISTORY):
+    """
+    Reads the history, skipping the lines that can't be parsed.
+
+    Args:
+    path (str): The history file.
+
+    Returns:
+    list: The entries, oldest first.
+    """
+    entries = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+    return entries
+
+@functools.lru_cache(maxsize=None)
+def _u_counts(m, n):
+    """
+    Number of orderings of m and n values giving each U statistic.
+    """
+    if m == 0 or n == 0:
+        return (1,)
+    # The largest value belongs to the first sample (adding n to U) or not
+    with_first = _u_counts(m - 1, n)
+    without = _u_counts(m, n - 1)
+    counts = [0] * (m * n + 1)
+    for u, count in enumerate(with_first):
+        counts[u + n] += count
+    for u, count in enumerate(without):
+        counts[u] += count
+    return tuple(counts)
+
+def mann_whitney_greater(sample, reference):
+    """
+    One-sided Mann-Whitney U test that the values of a sample tend to be
+    greater than those of a reference sample.
+
+    Args:
+    sample (list): The values tested, e.g. the latest timings.
+    reference (list): The values before them.
+
+    Returns:
+    float: The exact p-value (ties count half), 1.0 if a sample is empty.
+    """
+    if not sample or not reference:
+        return 1.0
+    u = sum(1.0 if x > y else 0.5 if x == y else 0.0 for x in sample for y in reference)
+    counts = _u_counts(len(sample), len(reference))
+    return sum(counts[int(u + 0.5):]) / sum(counts)
+
+def series(entries):
+    """
+    Groups history entries into series of the same phase, input, machine and
+    Python version.
+
+    Args:
+    entries (list): Entries as returned by load.
+
+    Returns:
+    dict: The entries of every series, oldest first, by (day, phase, input,
+    host, arch, python) key.
+    """
+    grouped = {}
+    for entry in entries:
+        key = (entry["day"], entry["phase"], entry["input"], entry["host"], entry["arch"],
+               entry.get("python"))
+        grouped.setdefault(key, []).append(entry)
+    return grouped
+
+def _sparkline(values):
+    low, high = min(values), max(values)
+    if high == low:
+        return SPARKS[0] * len(values)
+    return "".join(SPARKS[round((value - low) / (high - low) * (len(SPARKS) - 1))]
+                   for value in values)
+
+def trend(history, window=WINDOW, alpha=ALPHA, min_effect=MIN_EFFECT, width=30,
+          reference=REFERENCE):
+    """
+    Trend of one series: its latest window against the entries before it.
+
+    Args:
+    history (list): The entries of the series, oldest first.
+    window (int): Number of latest entries compared with the earlier ones.
+    alpha (float): Significance level of the test.
+    min_effect (float): Smallest median slowdown flagged, as a fraction.
+    width (int): Number of latest entries in the sparkline.
+    reference (int): Number of earlier entries they are compared with.
+
+    Returns:
+    dict: The day, the phase, the input, the number of entries, the first
+    and last times, the revisions of the last entry and of the first one of
+    the window, the sparkline of the fastest timings, the latest timing and
+    the median ones of both windows, their ratio, the p-value and a status:
+    'slower', 'faster', 'ok', or 'short' when there are too few entries for
+    the test to be significant.
+    """
+    timings = [entry["min_ns"] for entry in history]
+    recent, earlier = timings[-window:], timings[-window - reference:-window]
+    last = history[-1]
+    result = dict(day=last["day"], phase=last["phase"], input=last["input"],
+                  entries=len(history), first=history[0]["time"], last=last["time"],
+                  window_revision=history[-len(recent)].get("revision"),
+                  revision=last.get("revision"), python=last.get("python"),
+                  sparkline=_sparkline(timings[-width:]), latest_ns=timings[-1],
+                  recent_ns=statistics.median(recent), earlier_ns=None, ratio=None,
+                  p_value=None, status="short")
+    # The smallest p-value of the test is one over the number of orderings
+    if earlier and math.comb(len(recent) + len(earlier), len(recent)) * alpha > 1:
+        result["earlier_ns"] = statistics.median(earlier)
+        result["ratio"] = result["recent_ns"] / max(result["earlier_ns"], 1)
+        slower = mann_whitney_greater(recent, earlier)
+        faster = mann_whitney_greater([-t for t in recent], [-t for t in earlier])
+        result["p_value"] = min(slower, faster)
+        if slower < alpha and result["ratio"] > 1 + min_effect:
+            result["status"] = "slower"
+        elif faster < alpha and result["ratio"] < 1 / (1 + min_effect):
+            result["status"] = "faster"
+        else:
+            result["status"] = "ok"
+    return result
+
+def trend_report(entries, report_days=None, window=WINDOW, alpha=ALPHA, min_effect=MIN_EFFECT,
+                 reference=REFERENCE):
+    """
+    Trends of every series of the history.
+
+    Args:
+    entries (list): Entries as returned by load.
+    report_days (list): Days to report. Defaults to every day in the history.
+    window (int): Number of latest entries compared with the earlier ones.
+    alpha (float): Significance level of the test.
+    min_effect (float): Smallest median slowdown flagged, as a fraction.
+    reference (int): Number of earlier entries they are compared with.
+
+    Returns:
+    list: The trends, slowdowns first, then by day and phase.
+    """
+    trends = [trend(history, window, alpha, min_effect, reference=reference)
+              for key, history in series(entries).items()
+              if report_days is None or key[0] in report_days]
+    trends.sort(key=lambda row: (row["status"] != "slower", row["day"], row["phase"],
+                                 row["input"], row["python"] or ""))
+    return trends
+
+def format_text(trends):
+    """
+    Formats a trend report as an aligned table with timings in milliseconds.
+
+    Args:
+    trends (list): Trends as returned by trend_report.
+
+    Returns:
+    str: The table.
+    """
+    lines = [f"{'day':>3}  {'phase':<6}  {'input':<28}  {'python':<16}  {'n':>4}  {'trend':<30}  "
+             f"{'before ms':>10}  {'recent ms':>10}  {'ratio':>6}  {'p':>6}  status"]
+    for row in trends:
+        earlier = "" if row["earlier_ns"] is None else f"{row['earlier_ns'] / 1e6:.3f}"
+        ratio = "" if row["ratio"] is None else f"{row['ratio']:.2f}"
+        p_value = "" if row["p_value"] is None else f"{row['p_value']:.3f}"
+        status = row["status"]
+        if status == "slower":
+            status = f"SLOWER since {row['window_revision']}"
+        lines.append(f"{row['day']:>3}  {row['phase']:<6}  {row['input'][:28]:<28}  "
+                     f"{(row['python'] or '')[:16]:<16}  {row['entries']:>4}  {row['sparkline']:<30}  {earlier:>10}  "
+                     f"{row['recent_ns'] / 1e6:>10.3f}  {ratio:>6}  {p_value:>6}  {status}")
+    return "\n".join(lines)
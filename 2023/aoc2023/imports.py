@@ -0,0 +1,105 @@
+"""
+Import-time report of the day modules.
+
+The modules are imported in a fresh interpreter started with
+``-X importtime``, so the timings are those of a cold start, and an audit
+hook records every file other than Python sources that gets opened while
+importing them. A day module should import in a few milliseconds and read
+no file at all.
+"""
+import json
+import subprocess
+import sys
+
+from aoc2023 import days
+
+_CHILD = """
+import json
+import sys
+
+from aoc2023 import days
+
+opened = []
+
+def hook(event, args):
+    if event == "open" and isinstance(args[0], str) and not args[0].endswith((".py", ".pyc")):
+        opened.append(args[0])
+
+sys.addaudithook(hook)
+for day in {days!r}:
+    # __import__ goes through the instrumented import path, import_module does not.
+    __import__(days.module_name(day))
+print(json.dumps(opened))
+"""
+
+def parse_importtime(stderr):
+    """
+    Parses the output of ``python -X importtime``.
+
+    Args:
+    stderr (str): What the interpreter wrote on its standard error.
+
+    Returns:
+    list: One (module, self_us, cumulative_us) tuple per imported module,
+    in the order printed by the interpreter.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        entries.append((module.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+def import_report(report_days=days.DAYS):
+    """
+    Imports day modules in a fresh interpreter and measures them.
+
+    Args:
+    report_days (tuple): The days whose modules are imported.
+
+    Returns:
+    dict: 'modules' maps every module imported by the day modules (directly
+    or not) to its (self_us, cumulative_us) timings and 'opened' lists the
+    non-source files opened during the imports.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c",
+                             _CHILD.format(days=tuple(report_days))],
+                            cwd=days.YEAR_DIR, capture_output=True, text=True, check=True)
+    entries = parse_importtime(result.stderr)
+    # Everything printed up to aoc2023.days belongs to the interpreter startup.
+    names = [module for module, _, _ in entries]
+    first = names.index("aoc2023.days") + 1 if "aoc2023.days" in names else 0
+    modules = {module: (self_us, cumulative_us)
+               for module, self_us, cumulative_us in entries[first:]}
+    return {"modules": modules, "opened": json.loads(result.stdout)}
+
+def format_report(report, report_days=days.DAYS, top=5):
+    """
+    Formats an import report as text.
+
+    Args:
+    report (dict): Report as returned by import_report.
+    report_days (tuple): The days whose modules were imported.
+    top (int): Number of slowest dependencies to list.
+
+    Returns:
+    str: Cumulative import time of every day module, the slowest
+    dependencies by self time and the files opened during the imports.
+    """
+    modules = report["modules"]
+    lines = [f"{'module':<24}  {'cumulative ms':>13}"]
+    for day in report_days:
+        name = days.module_name(day)
+        if name in modules:
+            lines.append(f"{name:<24}  {modules[name][1] / 1e3:>13.3f}")
+    day_names = {days.module_name(day) for day in report_days}
+    slowest = sorted((item for item in modules.items() if item[0] not in day_names),
+                     key=lambda item: item[1][0], reverse=True)[:top]
+    lines.append("")
+    lines.append(f"{'slowest dependencies':<24}  {'self ms':>13}")
+    for name, (self_us, _) in slowest:
+        lines.append(f"{name:<24}  {self_us / 1e3:>13.3f}")
+    lines.append("")
+    lines.append("files read during import: " + (", ".join(report["opened"]) or "none"))
+    return "\n".join(lines)
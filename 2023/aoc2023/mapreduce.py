@@ -0,0 +1,230 @@
+"""
+Chunked map-reduce over the lines (or any items) of an input.
+
+map_red_lines keeps the call shape of the serial
+``reduce(red_function, map(map_function, list_))`` of days 1 and 2, but on
+large inputs it splits the list into a few chunks per worker, maps and
+reduces each chunk in a process pool and combines the partial results in
+chunk order. The reduce function must therefore be associative (such as
+operator.add), but need not be commutative.
+
+It stays serial, with no pool to start, when:
+
+- the input is shorter than MIN_PARALLEL items or is not a sequence (an
+  iterator is consumed lazily, in constant memory);
+- only one worker is available, or the call already runs in a worker
+  process (a batch or orchestrator job), so pools are never nested;
+- the functions can't be sent to a worker, such as lambdas.
+
+The number of workers defaults to the number of CPUs and can be set with
+the AOC2023_WORKERS environment variable.
+
+map_tasks is for the other kind of parallel loop: a few hundred expensive
+and independent items (the beams of day 16, the ghosts of day 8, the
+patterns of day 13), whose arguments are too costly to send to a process
+pool. It runs them in one of MODES: on a thread pool, which shares them, on
+a process pool, or serially. Threads only run Python code in parallel on a
+free-threaded (no GIL) CPython build, so the default mode is 'thread' on
+such a build and 'serial' otherwise, where threads would only add their
+overhead. MODE, or the AOC2023_MODE environment variable, forces a mode.
+
+Every day module imports this one, so multiprocessing, pickle and the
+executors of concurrent.futures (tens of milliseconds of logging, socket and
+pickle imports) are only imported by the calls that run in parallel.
+"""
+import functools
+import os
+import sys
+from collections.abc import Sequence
+
+MIN_PARALLEL = 100_000
+CHUNKS_PER_WORKER = 4
+MODES = ("serial", "thread", "process")
+# Mode of map_tasks, None for AOC2023_MODE or the default of the interpreter
+MODE = None
+
+_MISSING = object()
+
+def workers_available():
+    """
+    Number of worker processes a map-reduce may use.
+
+    Returns:
+    int: AOC2023_WORKERS if set, else the number of CPUs; 1 in a worker
+    process.
+    """
+    import multiprocessing
+    if multiprocessing.parent_process() is not None:
+        return 1
+    try:
+        return max(int(os.environ["AOC2023_WORKERS"]), 1)
+    except (KeyError, ValueError):
+        return os.cpu_count() or 1
+
+def chunks(list_, count):
+    """
+    Splits a sequence into contiguous slices of nearly equal length.
+
+    Args:
+    list_ (Sequence): The sequence.
+    count (int): The number of slices wanted.
+
+    Returns:
+    list: At most count non-empty slices, in order.
+    """
+    size = max(-(-len(list_) // max(count, 1)), 1)
+    return [list_[start:start + size] for start in range(0, len(list_), size)]
+
+def _picklable(*functions):
+    import pickle
+    try:
+        pickle.dumps(functions)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+def _parallel(list_, workers, functions, min_parallel):
+    """
+    Number of workers to use for a call, 1 meaning serial.
+    """
+    if min_parallel is None:
+        min_parallel = MIN_PARALLEL
+    if not isinstance(list_, Sequence) or len(list_) < min_parallel:
+        return 1
+    workers = workers or workers_available()
+    if workers > 1 and not _picklable(*functions):
+        return 1
+    return workers
+
+def _reduce_chunk(map_function, red_function, chunk):
+    return functools.reduce(red_function, map(map_function, chunk))
+
+def _map_chunk(map_function, chunk):
+    return list(map(map_function, chunk))
+
+def map_red_lines(list_, map_function, red_function, initial=_MISSING,
+                  workers=None, min_parallel=None):
+    """
+    Applies a map function to each element in a list and then reduces the result
+    using a reduce function, in parallel chunks on large lists.
+
+    Args:
+    list_ (Iterable): The input list to be processed.
+    map_function (function): A function to be applied to each element in the list.
+    red_function (function): An associative function used to reduce the
+    mapped results.
+    initial (object): Optional start value of the reduction, returned for an
+    empty list.
+    workers (int): Number of worker processes. Defaults to workers_available().
+    min_parallel (int): Lists shorter than this are processed serially.
+    Defaults to MIN_PARALLEL.
+
+    Returns:
+    The result of applying the reduce function to the mapped elements of the list.
+    """
+    workers = _parallel(list_, workers, (map_function, red_function), min_parallel)
+    if workers == 1:
+        if initial is _MISSING:
+            return functools.reduce(red_function, map(map_function, list_))
+        return functools.reduce(red_function, map(map_function, list_), initial)
+
+    from concurrent.futures import ProcessPoolExecutor
+    task = functools.partial(_reduce_chunk, map_function, red_function)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partials = pool.map(task, chunks(list_, workers * CHUNKS_PER_WORKER))
+        if initial is _MISSING:
+            return functools.reduce(red_function, partials)
+        return functools.reduce(red_function, partials, initial)
+
+def map_lines(list_, map_function, workers=None, min_parallel=None):
+    """
+    Applies a function to each element in a list, in parallel chunks on large
+    lists.
+
+    Args:
+    list_ (Iterable): The input list to be processed.
+    map_function (function): A function to be applied to each element in the list.
+    workers (int): Number of worker processes. Defaults to workers_available().
+    min_parallel (int): Lists shorter than this are processed serially.
+    Defaults to MIN_PARALLEL.
+
+    Returns:
+    list: The mapped elements, in the order of the input. An iterator when
+    the input is not a sequence, so that it is still consumed lazily.
+    """
+    if not isinstance(list_, Sequence):
+        return map(map_function, list_)
+    workers = _parallel(list_, workers, (map_function,), min_parallel)
+    if workers == 1:
+        return list(map(map_function, list_))
+
+    from concurrent.futures import ProcessPoolExecutor
+    task = functools.partial(_map_chunk, map_function)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        mapped = []
+        for part in pool.map(task, chunks(list_, workers * CHUNKS_PER_WORKER)):
+            mapped.extend(part)
+        return mapped
+
+def free_threaded():
+    """
+    Tells whether the interpreter runs Python threads in parallel.
+
+    Returns:
+    bool: True on a free-threaded CPython build with the GIL disabled.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+def default_mode():
+    """
+    Mode of map_tasks when none is given.
+
+    Returns:
+    str: MODE if set, else AOC2023_MODE if valid, else 'thread' on a
+    free-threaded build and 'serial' otherwise.
+    """
+    if MODE is not None:
+        return MODE
+    mode = os.environ.get("AOC2023_MODE")
+    if mode in MODES:
+        return mode
+    return "thread" if free_threaded() else "serial"
+
+def map_tasks(items, function, mode=None, workers=None):
+    """
+    Applies a function to independent and expensive items, on a pool of
+    threads or of processes.
+
+    Args:
+    items (Iterable): The items.
+    function (function): The function, called once per item. In 'thread'
+    mode it must be thread-safe; in 'process' mode it must be picklable, or
+    the items are mapped on threads instead.
+    mode (str): One of MODES. Defaults to default_mode().
+    workers (int): Number of threads or processes. Defaults to
+    workers_available().
+
+    Returns:
+    list: The results, in the order of the items.
+    """
+    items = list(items)
+    mode = mode or default_mode()
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode {mode!r}, expected one of {', '.join(MODES)}")
+    if mode == "serial":
+        return list(map(function, items))
+    workers = min(workers or workers_available(), len(items))
+    if workers <= 1:
+        return list(map(function, items))
+    if mode == "process" and not _picklable(function):
+        mode = "thread"
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    executor = ThreadPoolExecutor if mode == "thread" else ProcessPoolExecutor
+    task = functools.partial(_map_chunk, function)
+    with executor(max_workers=workers) as pool:
+        mapped = []
+        for part in pool.map(task, chunks(items, workers * CHUNKS_PER_WORKER)):
+            mapped.extend(part)
+        return mapped
@@ -0,0 +1,205 @@
+"""
+Peak memory of the parse step and the parts of each day.
+
+Every phase runs twice on a freshly parsed input:
+
+- without tracing, while a sampler thread reads the resident set size
+  (RSS) of the process every few milliseconds, which gives the peak RSS and
+  how much it grew during the phase;
+- under tracemalloc, which gives the peak of the memory allocated by
+  Python. The sampler takes a snapshot whenever the traced memory passes its
+  last high by 10%, so the allocation sites reported are those of the
+  largest state seen while the phase ran (such as the ``seen`` dictionary of
+  day 17), not what is left once it returned.
+"""
+import json
+import os
+import threading
+import tracemalloc
+
+from aoc2023 import days
+
+SAMPLE_INTERVAL = 0.005
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+def rss_bytes(pid=None):
+    """
+    Current resident set size of a process.
+
+    Args:
+    pid (int): The process. Defaults to the current one.
+
+    Returns:
+    int: The RSS in bytes. Where it can't be read (outside Linux), the peak
+    RSS so far for the current process, or 0 if neither is available.
+    """
+    try:
+        with open(f"/proc/{pid or 'self'}/statm", encoding='ascii') as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None or pid is not None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+class _Sampler(threading.Thread):
+    """
+    Thread sampling the RSS and, when tracing, snapshotting the traced
+    memory at its highs.
+    """
+
+    def __init__(self, snapshots):
+        super().__init__(daemon=True)
+        self.snapshots = snapshots
+        self.rss_peak = rss_bytes()
+        self.snapshot = None
+        self._snapshot_size = 0
+        self._done = threading.Event()
+
+    def sample(self):
+        self.rss_peak = max(self.rss_peak, rss_bytes())
+        if self.snapshots:
+            current = tracemalloc.get_traced_memory()[0]
+            if current > 1.1 * self._snapshot_size:
+                self.snapshot = tracemalloc.take_snapshot()
+                self._snapshot_size = current
+
+    def run(self):
+        while not self._done.wait(SAMPLE_INTERVAL):
+            self.sample()
+
+    def stop(self):
+        self._done.set()
+        self.join()
+        self.sample()
+
+def _sites(snapshot, top):
+    """
+    Largest allocation sites of a snapshot, without those of this module.
+    """
+    if snapshot is None:
+        return []
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, "*/_weakrefset.py"),
+        tracemalloc.Filter(False, __file__),
+    ])
+    return [dict(site=f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+                 size_bytes=stat.size, count=stat.count)
+            for stat in snapshot.statistics("lineno")[:top]]
+
+def measure_memory(func, prepare, top=5):
+    """
+    Measures the memory used by a call of a function.
+
+    Args:
+    func (function): The function to measure.
+    prepare (function): Called before each of the two runs, returns the
+    tuple of arguments passed to func. Its memory is not counted.
+    top (int): Number of allocation sites to report.
+
+    Returns:
+    tuple: The result of the call and a dict with the peak traced memory,
+    the peak RSS, the growth of the RSS during the call (all in bytes) and
+    the largest allocation sites near the traced peak.
+    """
+    args = prepare()
+    rss_before = rss_bytes()
+    sampler = _Sampler(snapshots=False)
+    sampler.start()
+    try:
+        result = func(*args)
+    finally:
+        sampler.stop()
+    del args
+
+    args = prepare()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    tracer = _Sampler(snapshots=True)
+    tracer.start()
+    try:
+        func(*args)
+    finally:
+        tracer.stop()
+        peak = tracemalloc.get_traced_memory()[1] - start
+        if not tracing:
+            tracemalloc.stop()
+
+    return result, dict(peak_bytes=peak, rss_peak_bytes=sampler.rss_peak,
+                        rss_growth_bytes=max(sampler.rss_peak - rss_before, 0),
+                        sites=_sites(tracer.snapshot, top))
+
+def memory_day(day, text=None, parts=days.PARTS, path=None, top=5):
+    """
+    Measures the memory of the parse step and the requested parts of a day.
+
+    Args:
+    day (int): The day number.
+    text (str or bytes-like): The raw puzzle input. Defaults to the memory
+    mapped content of the input file.
+    parts (tuple): The parts to run.
+    path (str): Input file used when no text is given. Defaults to dayN.txt.
+    top (int): Number of allocation sites to report per phase.
+
+    Returns:
+    list: One dict per phase ('parse', 'part1', 'part2') with the day, the
+    phase, the answer (None for 'parse') and the measures of measure_memory.
+    """
+    if text is None:
+        with days.map_input(day, path) as mapped:
+            return memory_day(day, mapped.buffer, parts, top=top)
+
+    module = days.import_day(day)
+    _, measures = measure_memory(module.parse_input, lambda: (text,), top)
+    rows = [dict(day=day, phase="parse", answer=None, **measures)]
+    for part in parts:
+        answer, measures = measure_memory(days.solver(module, part),
+                                          lambda: (module.parse_input(text),), top)
+        rows.append(dict(day=day, phase=f"part{part}", answer=answer, **measures))
+    return rows
+
+def format_text(rows):
+    """
+    Formats memory rows as an aligned table in megabytes, each phase followed
+    by its allocation sites.
+
+    Args:
+    rows (list): Rows as returned by memory_day.
+
+    Returns:
+    str: The table.
+    """
+    lines = [f"{'day':>3}  {'phase':<6}  {'answer':>20}  {'peak MB':>10}  "
+             f"{'RSS MB':>10}  {'RSS +MB':>10}"]
+    for row in rows:
+        answer = "" if row["answer"] is None else str(row["answer"])
+        lines.append(f"{row['day']:>3}  {row['phase']:<6}  {answer:>20}  "
+                     f"{row['peak_bytes'] / 2**20:>10.3f}  {row['rss_peak_bytes'] / 2**20:>10.3f}  "
+                     f"{row['rss_growth_bytes'] / 2**20:>10.3f}")
+        for site in row["sites"]:
+            lines.append(f"{'':>35}{site['size_bytes'] / 2**20:>10.3f} MB  "
+                         f"{site['count']:>9} blocks  {site['site']}")
+    return "\n".join(lines)
+
+def format_json(rows):
+    """
+    Formats memory rows as JSON.
+
+    Args:
+    rows (list): Rows as returned by memory_day.
+
+    Returns:
+    str: The JSON document.
+    """
+    return json.dumps(rows, indent=2, default=str)
@@ -0,0 +1,179 @@
+"""
+Counters of the work done by the hot paths of the solvers.
+
+The timings say how long a part takes, not whether it is slow because it
+does a lot of work (heap operations, beam steps...) or because each step
+costs a lot in the interpreter. The probes of this module count that work
+for the days where it matters:
+
+- day 5: the seeds looked up (part 1) and the interval fragments mapped
+  (part 2) in each stage of the almanac,
+- day 14: the spin cycles performed before the cycle is detected,
+- day 16: the beam steps and the splits,
+- day 17: the heap pushes and pops, the states expanded and the stale pops.
+
+A probe is only installed for an instrumented run. It swaps the module
+functions or methods the hot loop calls, or the objects it iterates, for
+counting ones and puts them back afterwards, so the solvers are left
+untouched and cost nothing when counting is off. Instrumented runs are slower, which is
+why they are separate from the timed ones. They are also serial, whatever
+mapreduce.MODE: the probes only patch the current process, and the counters
+are not thread-safe.
+"""
+import contextlib
+import types
+from collections import Counter
+
+from aoc2023 import days, mapreduce
+
+class _CountingTuple(tuple):
+    """
+    Tuple counting the times it is iterated.
+    """
+
+    def __new__(cls, items, counters, name):
+        instance = super().__new__(cls, items)
+        instance.counters = counters
+        instance.name = name
+        return instance
+
+    def __iter__(self):
+        self.counters[self.name] += 1
+        return super().__iter__()
+
+@contextlib.contextmanager
+def _patched(module, **replacements):
+    originals = {name: getattr(module, name) for name in replacements}
+    for name, value in replacements.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(module, name, value)
+
+@contextlib.contextmanager
+def _day5_probe(module, data, counters):
+    # Every map is scanned once per seed (part 1) or fragment (part 2) going through its stage
+    _, dict_maps = data
+    stages = {id(ranges): name.removesuffix(" map") for name, ranges in dict_maps.items()}
+    range_map = module.RangeMap
+
+    def counting(scan, label):
+        def scanned(ranges, *args):
+            counters[f"{stages[id(ranges)]} {label}"] += 1
+            return scan(ranges, *args)
+        return scanned
+
+    with _patched(range_map, convert=counting(range_map.convert, "lookups"),
+                  overlap=counting(range_map.overlap, "fragments")):
+        yield
+
+@contextlib.contextmanager
+def _day14_probe(module, data, counters):
+    roll_all_directions = module.roll_all_directions
+
+    def counting(grid, n, m):
+        counters["spin cycles"] += 1
+        return roll_all_directions(grid, n, m)
+
+    with _patched(module, roll_all_directions=counting):
+        yield
+
+@contextlib.contextmanager
+def _day16_probe(module, data, counters):
+    calculate_next = module.calculate_next
+
+    def counting(point_dir, grid, table):
+        counters["beam steps"] += 1
+        step = calculate_next(point_dir, grid, table)
+        if step[1] is not None:
+            counters["splits"] += 1
+        return step
+
+    with _patched(module, calculate_next=counting):
+        yield
+
+@contextlib.contextmanager
+def _day17_probe(module, data, counters):
+    heapq = module.heapq
+
+    def heappush(queue, item):
+        counters["heap pushes"] += 1
+        heapq.heappush(queue, item)
+
+    def heappop(queue):
+        counters["heap pops"] += 1
+        return heapq.heappop(queue)
+
+    # The neighbour offsets are iterated once per expanded state
+    data.neighbours = _CountingTuple(data.neighbours, counters, "expanded")
+    with _patched(module, heapq=types.SimpleNamespace(heappush=heappush, heappop=heappop)):
+        yield
+    # The other pops are the stale ones, and the one reaching the end
+    counters["stale pops"] = max(counters["heap pops"] - counters["expanded"] - 1, 0)
+
+PROBES = {5: _day5_probe, 14: _day14_probe, 16: _day16_probe, 17: _day17_probe}
+
+def count_part(day, part, text):
+    """
+    Runs one part of a day with its probe installed, serially.
+
+    Args:
+    day (int): The day number, one of PROBES.
+    part (int): The part number.
+    text (str or bytes-like): The raw puzzle input.
+
+    Returns:
+    tuple: The answer and the counters, as a dict.
+    """
+    module = days.import_day(day)
+    data = module.parse_input(text)
+    counters = Counter()
+    # The work map_tasks sends to other processes or threads would be lost or miscounted
+    previous, mapreduce.MODE = mapreduce.MODE, "serial"
+    try:
+        with PROBES[day](module, data, counters):
+            answer = days.solver(module, part)(data)
+    finally:
+        mapreduce.MODE = previous
+    return answer, dict(counters)
+
+def add_counters(rows, path=None):
+    """
+    Adds the counters of an instrumented run to benchmark rows.
+
+    Args:
+    rows (list): Rows as returned by bench.bench_day. The part rows of the
+    days with a probe get a 'counters' dict, the others None.
+    path (str): Input file. Defaults to dayN.txt of each day.
+
+    Returns:
+    list: The rows.
+    """
+    for row in rows:
+        if not row["phase"].startswith("part"):
+            continue
+        row["counters"] = None
+        if row["day"] in PROBES:
+            with days.map_input(row["day"], path) as mapped:
+                _, row["counters"] = count_part(row["day"], int(row["phase"][4:]),
+                                                mapped.buffer)
+    return rows
+
+def format_text(rows):
+    """
+    Formats the counters of benchmark rows as one line per part.
+
+    Args:
+    rows (list): Rows as returned by add_counters.
+
+    Returns:
+    str: The lines.
+    """
+    lines = []
+    for row in rows:
+        if row.get("counters"):
+            counts = ", ".join(f"{name} {value}" for name, value in row["counters"].items())
+            lines.append(f"day {row['day']} {row['phase']}: {counts}")
+    return "\n".join(lines)
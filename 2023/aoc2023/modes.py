@@ -0,0 +1,98 @@
+"""
+Benchmark of the execution modes of the parts looping with map_tasks.
+
+Every such part is timed in each of mapreduce.MODES: serially, on a thread
+pool and on a process pool. The speedup of the thread mode over the serial
+one is the point of a free-threaded build; with the GIL the threads take
+turns and the thread mode is about as fast as the serial one, or slower,
+while the process mode pays for starting its pool and pickling its
+arguments.
+"""
+import platform
+
+from aoc2023 import bench, days, mapreduce
+
+# The parts whose loops go through map_tasks
+PARALLEL_PARTS = {8: (2,), 13: (1, 2), 16: (2,)}
+
+def compare_modes(day, part, text, modes=mapreduce.MODES, warmup=1, repeat=5):
+    """
+    Times one part of a day in several modes.
+
+    Args:
+    day (int): The day number.
+    part (int): The part number.
+    text (str or bytes-like): The raw puzzle input.
+    modes (tuple): The modes, among mapreduce.MODES.
+    warmup (int): Number of untimed runs per mode.
+    repeat (int): Number of timed runs per mode.
+
+    Returns:
+    list: One dict per mode with the day, the part, the mode, the number
+    of workers, whether the mode fell back to a serial run for lack of
+    workers, the answer, the statistics of bench.summarize and the speedup
+    over the serial mode (None if it was not timed or the mode fell back).
+    """
+    module = days.import_day(day)
+    rows = []
+    for mode in modes:
+        previous, mapreduce.MODE = mapreduce.MODE, mode
+        try:
+            answer, samples = bench.measure(days.solver(module, part),
+                                            lambda: (module.parse_input(text),),
+                                            warmup, repeat)
+        finally:
+            mapreduce.MODE = previous
+        workers = 1 if mode == "serial" else mapreduce.workers_available()
+        # map_tasks runs serially with a single worker, whatever the mode
+        rows.append(dict(day=day, part=part, mode=mode, workers=workers,
+                         serial_fallback=mode != "serial" and workers <= 1, answer=answer,
+                         **bench.summarize(samples)))
+    serial = next((row["min_ns"] for row in rows if row["mode"] == "serial"), None)
+    for row in rows:
+        row["speedup"] = (None if serial is None or row["serial_fallback"]
+                          else serial / max(row["min_ns"], 1))
+    return rows
+
+def interpreter():
+    """
+    Returns:
+    str: The Python version and whether it runs with the GIL.
+    """
+    gil = "free-threaded" if mapreduce.free_threaded() else "GIL"
+    return f"{platform.python_implementation()} {platform.python_version()} ({gil})"
+
+def format_text(rows):
+    """
+    Formats the mode comparison as an aligned table with timings in milliseconds.
+
+    Args:
+    rows (list): Rows as returned by compare_modes.
+
+    Returns:
+    str: The table, with the interpreter first and a note on the modes that
+    fell back to a serial run.
+    """
+    lines = [interpreter(),
+             f"{'day':>3}  {'part':>4}  {'mode':<8}  {'workers':>7}  {'answer':>16}  "
+             f"{'min ms':>10}  {'median ms':>10}  speedup"]
+    for row in rows:
+        if row["serial_fallback"]:
+            speedup = "serial"
+        else:
+            speedup = "" if row["speedup"] is None else f"{row['speedup']:.2f}x"
+        lines.append(f"{row['day']:>3}  {row['part']:>4}  {row['mode']:<8}  {row['workers']:>7}  "
+                     f"{str(row['answer']):>16}  {row['min_ns'] / 1e6:>10.3f}  "
+                     f"{row['median_ns'] / 1e6:>10.3f}  {speedup}")
+    answers = {}
+    for row in rows:
+        answers.setdefault((row["day"], row["part"]), set()).add(str(row["answer"]))
+    for (day, part), found in sorted(answers.items()):
+        if len(found) > 1:
+            lines.append(f"day {day} part {part}: the modes gave different answers")
+    fallbacks = [mode for mode in mapreduce.MODES
+                 if any(row["mode"] == mode and row["serial_fallback"] for row in rows)]
+    if fallbacks:
+        lines.append(f"{' and '.join(fallbacks)} ran serially: a single worker is available "
+                     f"(more CPUs or --workers N > 1 are needed to compare the modes)")
+    return "\n".join(lines)
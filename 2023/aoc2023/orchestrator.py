@@ -0,0 +1,118 @@
+"""
+Runs every day and part on a pool of processes and gathers one report.
+
+Every (day, part) pair is a job benchmarked by bench.bench_day in a worker
+process; the parse step of a day is timed with its first part. The pool
+takes the jobs in order, so the longest ones (EXPENSIVE) are submitted
+first: a long job started last would keep one core busy while the others
+sit idle. A job that fails doesn't stop the others: it is reported with
+its error instead of its rows.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc2023 import bench, days
+
+# Slowest jobs on puzzle-sized inputs, from the slowest: the brute force race
+# of day 6, dijkstra2 of day 17, max_energizer of day 16, detect_cycle of day 14,
+# dijkstra of day 17 and distancer of day 11.
+EXPENSIVE = ((6, 2), (17, 2), (16, 2), (14, 2), (17, 1), (11, 2), (11, 1))
+
+def schedule(run_days=days.DAYS, parts=days.PARTS):
+    """
+    Lists the jobs in the order they are submitted.
+
+    Args:
+    run_days (tuple): The days to run.
+    parts (tuple): The parts to run.
+
+    Returns:
+    list: The (day, part) jobs, the expensive ones first and the others by day.
+    """
+    jobs = [(day, part) for day in run_days for part in parts]
+    first = [job for job in EXPENSIVE if job in jobs]
+    return first + [job for job in jobs if job not in first]
+
+def run_job(day, part, path=None, warmup=0, repeat=1, parse=False):
+    """
+    Benchmarks one part of a day. Runs in a worker process.
+
+    Args:
+    day (int): The day number.
+    part (int): The part number.
+    path (str): Input file. Defaults to dayN.txt in the day directory.
+    warmup (int): Number of untimed runs of every phase.
+    repeat (int): Number of timed runs of every phase.
+    parse (bool): Whether to time the parse step too.
+
+    Returns:
+    tuple: The rows of bench.bench_day and the wall time of the job in nanoseconds.
+    """
+    start = time.perf_counter_ns()
+    rows = bench.bench_day(day, path=path, parts=(part,), warmup=warmup,
+                           repeat=repeat, parse=parse)
+    return rows, time.perf_counter_ns() - start
+
+def run_all(run_days=None, parts=None, input_dir=None, workers=None, warmup=0, repeat=1):
+    """
+    Runs the jobs of the requested days and parts on a process pool.
+
+    Args:
+    run_days (list): The days to run. Defaults to every day.
+    parts (list): The parts to run. Defaults to both.
+    input_dir (str): Directory holding the dayN.txt inputs. Defaults to the
+    day directories.
+    workers (int): Number of worker processes. Defaults to the number of CPUs.
+    warmup (int): Number of untimed runs of every phase.
+    repeat (int): Number of timed runs of every phase.
+
+    Returns:
+    dict: The rows of every job sorted by day and phase, the failed jobs
+    (dicts with the day, the part and the error), the number of workers, the
+    wall time of the whole run and the sum of the wall times of the jobs, in
+    nanoseconds.
+    """
+    parts = tuple(sorted(parts or days.PARTS))
+    jobs = schedule(tuple(run_days or days.DAYS), parts)
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter_ns()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for day, part in jobs:
+            path = None if input_dir is None else os.path.join(input_dir, f"day{day}.txt")
+            futures.append(pool.submit(run_job, day, part, path, warmup, repeat,
+                                       parse=part == parts[0]))
+        results, errors = [], []
+        for (day, part), future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                errors.append(dict(day=day, part=part, error=f"{type(exc).__name__}: {exc}"))
+    wall_ns = time.perf_counter_ns() - start
+
+    rows = sorted((row for job_rows, _ in results for row in job_rows),
+                  key=lambda row: (row["day"], row["phase"]))
+    errors.sort(key=lambda error: (error["day"], error["part"]))
+    return dict(rows=rows, errors=errors, workers=workers, wall_ns=wall_ns,
+                busy_ns=sum(elapsed for _, elapsed in results))
+
+def format_report(report):
+    """
+    Formats a report of run_all as the table of bench.format_text, the
+    failed jobs, then the wall time and the speedup over running the jobs
+    one by one.
+
+    Args:
+    report (dict): Report as returned by run_all.
+
+    Returns:
+    str: The report.
+    """
+    speedup = report["busy_ns"] / max(report["wall_ns"], 1)
+    failures = "".join(f"day {error['day']} part {error['part']} failed: {error['error']}\n"
+                       for error in report["errors"])
+    return (f"{bench.format_text(report['rows'])}\n\n{failures}"
+            f"{len(report['rows'])} phases on {report['workers']} workers in "
+            f"{report['wall_ns'] / 1e9:.2f} s (jobs took {report['busy_ns'] / 1e9:.2f} s, "
+            f"speedup {speedup:.1f}x)")
@@ -0,0 +1,247 @@
+"""
+Opt-in binary cache of parsed inputs.
+
+The structure returned by the parse_input function of a day is written
+next to the input file (``dayN.txt.parsed``) in ``marshal`` format, the
+compact binary serialisation of the interpreter, behind a header holding
+the SHA-256 of the input and of the parsing code: the fingerprint of
+parse_input and of what it uses in the day module (parser_fingerprint, also
+used by the watcher) and the source of the aoc2023 modules it relies on.
+Editing a part therefore keeps the cache. Later runs memory-map that file
+and load the structure from it instead of parsing the text, as long as
+both hashes still match; otherwise the input is parsed again and the file
+rewritten.
+
+marshal handles the builtin types the parsers return (lists, tuples, dicts,
+strings and integers). A Grid is stored as a tagged tuple holding its raw
+cells, which are copied back in one block, and a records.Record as a tagged
+tuple holding its class and its fields, its arrays as raw bytes. A structure
+holding anything else is simply not cached.
+"""
+import hashlib
+import importlib
+import marshal
+import sys
+import types
+from array import array
+
+from aoc2023 import cache, reader
+from aoc2023.grid import Grid
+from aoc2023.records import Record
+
+MAGIC = b"AOCP" + bytes((sys.version_info.major, sys.version_info.minor, marshal.version, 0))
+_DIGEST = 32
+_HEADER = len(MAGIC) + 2 * _DIGEST + 1
+_GRID_TAG = "aoc2023.grid.Grid"
+_RECORD_TAG = "aoc2023.records.Record"
+_ARRAY_TAG = "array.array"
+# Class attributes set by the interpreter, copy.deepcopy (__slotnames__) included
+_CLASS_BOOKKEEPING = ("__dict__", "__doc__", "__module__", "__qualname__", "__slotnames__",
+                      "__weakref__")
+
+def _code_digest(code, digest, names):
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    names.extend(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _code_digest(const, digest, names)
+        else:
+            digest.update(repr(const).encode())
+
+def _value_digest(value, digest):
+    """
+    Adds a constant of a module to a digest. Returns False for the values
+    that are not plain data, such as modules or objects of other modules.
+    """
+    if isinstance(value, (set, frozenset)):
+        # The order of a set of strings changes from one interpreter to the next
+        items = sorted(value, key=repr)
+        digest.update(type(value).__name__.encode())
+        return all(_value_digest(item, digest) for item in items)
+    if isinstance(value, dict):
+        digest.update(b"dict")
+        return all(_value_digest(key, digest) and _value_digest(item, digest)
+                   for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        digest.update(type(value).__name__.encode())
+        return all(_value_digest(item, digest) for item in value)
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        digest.update(repr(value).encode())
+        return True
+    return False
+
+def parser_fingerprint(module):
+    """
+    Fingerprint of the parsing code of a day module.
+
+    It covers the bytecode of parse_input and of what it uses from the
+    module, directly or not: its functions, its classes (the bytecode of
+    their methods, their ``__slots__`` and their other attributes) and its
+    constants, but not the line numbers, so that editing another function
+    keeps it.
+
+    Args:
+    module (module): The dayN module.
+
+    Returns:
+    str: The hexadecimal SHA-256.
+    """
+    digest = hashlib.sha256()
+    seen = set()
+    pending = ["parse_input"]
+    while pending:
+        name = pending.pop()
+        if name in seen or name not in vars(module):
+            continue
+        seen.add(name)
+        value = vars(module)[name]
+        if isinstance(value, types.FunctionType):
+            if value.__module__ == module.__name__:
+                digest.update(b"function " + name.encode())
+                _code_digest(value.__code__, digest, pending)
+        elif isinstance(value, type):
+            if value.__module__ == module.__name__:
+                digest.update(b"class " + name.encode())
+                pending.extend(base.__name__ for base in value.__bases__)
+                for attribute, member in sorted(vars(value).items()):
+                    if attribute in _CLASS_BOOKKEEPING:
+                        continue
+                    function = getattr(member, "__func__", member)
+                    if isinstance(member, property):
+                        function = member.fget
+                    digest.update(attribute.encode())
+                    if isinstance(function, types.FunctionType):
+                        _code_digest(function.__code__, digest, pending)
+                    else:
+                        _value_digest(member, digest)
+        elif not isinstance(value, types.ModuleType):
+            constant = hashlib.sha256()
+            if _value_digest(value, constant):
+                digest.update(b"constant " + name.encode() + constant.digest())
+    return digest.hexdigest()
+
+def code_hash(module):
+    """
+    Hash of the code a cached parse depends on: the parser_fingerprint of
+    the day module and the source of the aoc2023 modules it uses (see
+    cache.source_hash).
+
+    Args:
+    module (module): The dayN module.
+
+    Returns:
+    bytes: The SHA-256.
+    """
+    digest = hashlib.sha256(parser_fingerprint(module).encode())
+    for path in cache.helper_files(module):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.digest()
+
+def cache_path(path):
+    """
+    Location of the parse cache of an input file.
+
+    Args:
+    path (str): The input file.
+
+    Returns:
+    str: The path of the cache file.
+    """
+    return path + ".parsed"
+
+def _encode(data):
+    """
+    Replaces the grids, records and arrays of a structure by tuples marshal
+    can write.
+
+    Returns:
+    tuple: The encoded structure and whether it held any of them.
+    """
+    if isinstance(data, Grid):
+        typecode = "B" if isinstance(data.cells, bytearray) else data.cells.typecode
+        cells = bytes(data.cells) if typecode == "B" else data.cells.tobytes()
+        return (_GRID_TAG, data.height, data.width, typecode, cells, data.border), True
+    if isinstance(data, Record):
+        fields, _ = _encode(data.fields())
+        return (_RECORD_TAG, type(data).__module__, type(data).__qualname__, fields), True
+    if isinstance(data, array):
+        return (_ARRAY_TAG, data.typecode, data.tobytes()), True
+    if isinstance(data, dict):
+        items = {key: _encode(value) for key, value in data.items()}
+        return ({key: value for key, (value, _) in items.items()},
+                any(found for _, found in items.values()))
+    if isinstance(data, (list, tuple)):
+        items = [_encode(item) for item in data]
+        encoded = [item for item, _ in items]
+        return (encoded if isinstance(data, list) else tuple(encoded),
+                any(found for _, found in items))
+    return data, False
+
+def _decode(data):
+    """
+    Rebuilds the grids, records and arrays of a structure encoded by _encode.
+    """
+    if isinstance(data, tuple) and len(data) == 6 and data[0] == _GRID_TAG:
+        _, height, width, typecode, cells, border = data
+        if typecode == "B":
+            return Grid(height, width, bytearray(cells), border)
+        values = array(typecode)
+        values.frombytes(cells)
+        return Grid(height, width, values, border)
+    if isinstance(data, tuple) and len(data) == 4 and data[0] == _RECORD_TAG:
+        _, module, name, fields = data
+        return getattr(importlib.import_module(module), name)(*_decode(fields))
+    if isinstance(data, tuple) and len(data) == 3 and data[0] == _ARRAY_TAG:
+        values = array(data[1])
+        values.frombytes(data[2])
+        return values
+    if isinstance(data, dict):
+        return {key: _decode(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_decode(item) for item in data]
+    if isinstance(data, tuple):
+        return tuple(_decode(item) for item in data)
+    return data
+
+def _header(data_hash, code_hash, tagged):
+    return MAGIC + data_hash + code_hash + bytes((tagged,))
+
+def load(module, buffer, path):
+    """
+    Parses an input, through the cache file next to it.
+
+    Args:
+    module (module): The dayN module, whose parse_input is used on a miss.
+    buffer (bytes-like): The raw input, e.g. the buffer of a reader.MappedInput.
+    path (str): The input file, next to which the cache file lives.
+
+    Returns:
+    object: The parsed input, as returned by parse_input.
+    """
+    data_hash = hashlib.sha256(buffer).digest()
+    code = code_hash(module)
+    expected = _header(data_hash, code, 0)[:-1]
+    try:
+        with reader.MappedInput(cache_path(path)) as mapped, memoryview(mapped.buffer) as view:
+            if view[:_HEADER - 1] == expected:
+                with view[_HEADER:] as payload:
+                    data = marshal.loads(payload)
+                return _decode(data) if view[_HEADER - 1] else data
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+
+    data = module.parse_input(buffer)
+    encoded, tagged = _encode(data)
+    try:
+        payload = marshal.dumps(encoded)
+    except ValueError:
+        return data
+    try:
+        with open(cache_path(path), 'wb') as f:
+            f.write(_header(data_hash, code, tagged))
+            f.write(payload)
+    except OSError:
+        pass
+    return data
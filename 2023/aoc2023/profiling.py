@@ -0,0 +1,162 @@
+"""
+Profiling of one part of a day.
+
+The part runs twice on freshly parsed inputs. The first run uses cProfile;
+its statistics are written to a ``.pstats`` file (readable with pstats,
+snakeviz...) and summarised as the functions with the highest own time.
+cProfile only keeps caller/callee pairs, so the second run records whole
+call stacks with ``sys.setprofile`` and writes them in the collapsed format
+of flamegraph.pl and speedscope: one ``frame;frame;frame microseconds``
+line per distinct stack, counting the time spent in the last frame.
+"""
+import cProfile
+import os
+import pstats
+import sys
+import time
+from collections import Counter
+
+from aoc2023 import days
+
+def _code_label(frame):
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?").rsplit(".", 1)[-1]
+    return f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+
+def _builtin_label(function):
+    module = getattr(function, "__module__", None)
+    name = getattr(function, "__qualname__", repr(function))
+    return f"{module}:{name}" if module else name
+
+class StackCollector:
+    """
+    Profile function for sys.setprofile that adds up the own time of every
+    distinct call stack.
+
+    Attributes:
+    stacks (Counter): Own time in nanoseconds by stack, the frames of a
+    stack being joined with ';' from the outermost.
+    """
+
+    def __init__(self):
+        self.stacks = Counter()
+        self._labels = []
+        self._starts = []
+        self._children = []
+
+    def __call__(self, frame, event, arg):
+        now = time.perf_counter_ns()
+        if event == "call" or event == "c_call":
+            self._labels.append(_code_label(frame) if event == "call" else _builtin_label(arg))
+            self._starts.append(now)
+            self._children.append(0)
+        elif event in ("return", "c_return", "c_exception") and self._labels:
+            elapsed = now - self._starts.pop()
+            self.stacks[";".join(self._labels)] += elapsed - self._children.pop()
+            self._labels.pop()
+            if self._children:
+                self._children[-1] += elapsed
+
+    def run(self, func, *args):
+        """
+        Calls a function while recording its call stacks.
+
+        Args:
+        func (function): The function.
+        *args: Its arguments.
+
+        Returns:
+        object: What the function returned.
+        """
+        sys.setprofile(self)
+        try:
+            return func(*args)
+        finally:
+            sys.setprofile(None)
+
+    def write(self, path):
+        """
+        Writes the stacks in collapsed format, with times in microseconds.
+
+        Args:
+        path (str): The file to write.
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, elapsed in sorted(self.stacks.items()):
+                if elapsed >= 1000:
+                    f.write(f"{stack} {elapsed // 1000}\n")
+
+def hotspots(stats, top=15):
+    """
+    Functions with the highest own time in cProfile statistics.
+
+    Args:
+    stats (pstats.Stats): The statistics.
+    top (int): Number of functions to keep.
+
+    Returns:
+    list: One dict per function with its label, number of calls, own and
+    cumulative time in nanoseconds and share of the total time.
+    """
+    total = max(stats.total_tt, 1e-9)
+    rows = []
+    for (filename, line, name), (_, calls, own, cumulative, _) in stats.stats.items():
+        if filename == "~":
+            label = name.strip("<>")
+        else:
+            label = f"{os.path.basename(filename)}:{line}:{name}"
+        rows.append(dict(function=label, calls=calls, own_ns=int(own * 1e9),
+                         cumulative_ns=int(cumulative * 1e9), share=own / total))
+    rows.sort(key=lambda row: row["own_ns"], reverse=True)
+    return rows[:top]
+
+def profile_part(day, part, path=None, output_dir=".", top=15):
+    """
+    Profiles one part of a day and writes the .pstats and collapsed stack files.
+
+    Args:
+    day (int): The day number.
+    part (int): The part number.
+    path (str): Input file. Defaults to dayN.txt in the day directory.
+    output_dir (str): Directory of the dayN_partP.pstats and
+    dayN_partP.collapsed files.
+    top (int): Number of hotspots to report.
+
+    Returns:
+    dict: The day, the part, the answer, the paths of both files and the
+    hotspots.
+    """
+    module = days.import_day(day)
+    solve = days.solver(module, part)
+    os.makedirs(output_dir, exist_ok=True)
+    base = os.path.join(output_dir, f"day{day}_part{part}")
+
+    with days.map_input(day, path) as mapped:
+        profiler = cProfile.Profile()
+        answer = profiler.runcall(solve, module.parse_input(mapped.buffer))
+        collector = StackCollector()
+        collector.run(solve, module.parse_input(mapped.buffer))
+
+    profiler.dump_stats(base + ".pstats")
+    collector.write(base + ".collapsed")
+    return dict(day=day, part=part, answer=answer, pstats=base + ".pstats",
+                collapsed=base + ".collapsed",
+                hotspots=hotspots(pstats.Stats(profiler), top))
+
+def format_report(report):
+    """
+    Formats a profile as the list of hotspots with timings in milliseconds.
+
+    Args:
+    report (dict): Report as returned by profile_part.
+
+    Returns:
+    str: The report.
+    """
+    lines = [f"day {report['day']} part {report['part']}: {report['answer']}",
+             f"{'own ms':>10}  {'cum ms':>10}  {'own %':>6}  {'calls':>9}  function"]
+    for row in report["hotspots"]:
+        lines.append(f"{row['own_ns'] / 1e6:>10.3f}  {row['cumulative_ns'] / 1e6:>10.3f}  "
+                     f"{100 * row['share']:>6.1f}  {row['calls']:>9}  {row['function']}")
+    lines.append(f"Statistics written to {report['pstats']}, stacks to {report['collapsed']}")
+    return "\n".join(lines)
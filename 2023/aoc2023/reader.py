@@ -0,0 +1,275 @@
+"""
+Shared reader of puzzle inputs.
+
+MappedInput memory-maps an input file. The iterators below split a buffer
+into lines, blank-line separated blocks or separator-separated tokens by
+searching it in place: on a mapped file (or any bytes-like buffer) they
+yield ``memoryview`` slices of it and on a ``str`` they yield ``str`` slices,
+so the same parser works on both. No list of pieces is built and nothing
+is copied until a piece is decoded with ``text`` or converted to a number.
+
+Leading and trailing whitespace of the whole input is ignored, like
+``str.strip`` does, and a '\\r' before a line break is dropped.
+
+stream_lines and stream_tokens read a file object (such as ``sys.stdin``)
+incrementally instead, for the days whose answer is a fold over
+independent lines or tokens: they hold one line, or one read chunk, at a
+time, so the memory used does not depend on the size of the input.
+"""
+import codecs
+import mmap
+
+WHITESPACE = " \t\r\n"
+_WHITESPACE_BYTES = b" \t\r\n"
+
+def _separator(buffer, separator):
+    return separator if isinstance(buffer, str) else separator.encode()
+
+def _is_space(buffer, index):
+    if isinstance(buffer, str):
+        return buffer[index] in WHITESPACE
+    return buffer[index] in _WHITESPACE_BYTES
+
+def _is_carriage_return(buffer, index):
+    return buffer[index] in ("\r", 13)
+
+def stripped(buffer, start=0, end=None):
+    """
+    Span of a buffer without its leading and trailing whitespace.
+
+    Args:
+    buffer (str or bytes-like): The input.
+    start (int): Start of the span to strip.
+    end (int): End of the span to strip. Defaults to the end of the buffer.
+
+    Returns:
+    tuple: The (start, end) offsets of the stripped span.
+    """
+    end = len(buffer) if end is None else end
+    while start < end and _is_space(buffer, start):
+        start += 1
+    while end > start and _is_space(buffer, end - 1):
+        end -= 1
+    return start, end
+
+def view(buffer, start, end):
+    """
+    Slice of a buffer that doesn't copy bytes-like buffers.
+
+    Args:
+    buffer (str or bytes-like): The input.
+    start (int): Start offset.
+    end (int): End offset.
+
+    Returns:
+    str or memoryview: The slice.
+    """
+    if isinstance(buffer, str):
+        return buffer[start:end]
+    return memoryview(buffer)[start:end]
+
+def text(piece):
+    """
+    Decodes a piece yielded by the iterators of this module.
+
+    Args:
+    piece (str or memoryview): The piece.
+
+    Returns:
+    str: The piece as a string.
+    """
+    return piece if isinstance(piece, str) else str(piece, "utf-8")
+
+def spans(buffer, separator, start=0, end=None):
+    """
+    Spans of the pieces of a buffer between separators.
+
+    Args:
+    buffer (str or bytes-like): The input. Must support find(sub, start, end),
+    like str, bytes and mmap do.
+    separator (str): The separator.
+    start (int): Start of the part of the buffer to split.
+    end (int): End of the part of the buffer to split. Defaults to its end.
+
+    Returns:
+    generator: The (start, end) offsets of every piece, in order. The span
+    is stripped first, so there is no empty piece at its ends.
+    """
+    start, end = stripped(buffer, start, end)
+    if start == end:
+        return
+    sep = _separator(buffer, separator)
+    while True:
+        found = buffer.find(sep, start, end)
+        if found == -1:
+            yield start, end
+            return
+        yield start, found
+        start = found + len(sep)
+
+def lines(buffer, start=0, end=None):
+    """
+    Lines of a buffer (or of a span of it), without line breaks.
+
+    Args:
+    buffer (str or bytes-like): The input.
+    start (int): Start of the span.
+    end (int): End of the span. Defaults to the end of the buffer.
+
+    Returns:
+    generator: The lines, as slices of the buffer.
+    """
+    for line_start, line_end in spans(buffer, "\n", start, end):
+        if line_end > line_start and _is_carriage_return(buffer, line_end - 1):
+            line_end -= 1
+        yield view(buffer, line_start, line_end)
+
+def block_spans(buffer):
+    """
+    Spans of the blocks of a buffer separated by blank lines.
+
+    Args:
+    buffer (str or bytes-like): The input.
+
+    Returns:
+    generator: The (start, end) offsets of every block, for lines(buffer, start, end).
+    Several blank lines in a row separate two blocks as one does.
+    """
+    start, end = stripped(buffer)
+    # A blank line is "\n\n", or "\n\r\n" with Windows line breaks
+    separators = [_separator(buffer, separator) for separator in ("\n\n", "\n\r\n")]
+    found = [buffer.find(separator, start, end) for separator in separators]
+    while start < end:
+        candidates = [(position, len(separator)) for position, separator in zip(found, separators)
+                      if position != -1]
+        if not candidates:
+            yield stripped(buffer, start, end)
+            return
+        position, size = min(candidates)
+        block_start, block_end = stripped(buffer, start, position)
+        if block_start < block_end:
+            yield block_start, block_end
+        start = position + size
+        found = [position if position == -1 or position >= start
+                 else buffer.find(separator, start, end)
+                 for position, separator in zip(found, separators)]
+
+def blocks(buffer):
+    """
+    Blocks of a buffer separated by blank lines.
+
+    Args:
+    buffer (str or bytes-like): The input.
+
+    Returns:
+    generator: The blocks, as slices of the buffer.
+    """
+    for block_start, block_end in block_spans(buffer):
+        yield view(buffer, block_start, block_end)
+
+def tokens(buffer, separator=","):
+    """
+    Tokens of a buffer separated by a separator, e.g. a comma.
+
+    Args:
+    buffer (str or bytes-like): The input.
+    separator (str): The separator.
+
+    Returns:
+    generator: The tokens, as slices of the buffer.
+    """
+    for token_start, token_end in spans(buffer, separator):
+        yield view(buffer, token_start, token_end)
+
+STREAM_CHUNK = 1 << 16
+
+def _decoded(stream):
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    while True:
+        chunk = stream.read(STREAM_CHUNK)
+        if not chunk:
+            break
+        yield chunk if isinstance(chunk, str) else decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+def stream_lines(stream):
+    """
+    Lines of a file object read one at a time, without line breaks.
+
+    Args:
+    stream (file): A text or binary file object, e.g. sys.stdin.
+
+    Returns:
+    generator: The lines as strings. Blank lines are skipped.
+    """
+    for line in stream:
+        if not isinstance(line, str):
+            line = str(line, "utf-8")
+        line = line.rstrip("\r\n")
+        if line.strip(WHITESPACE):
+            yield line
+
+def stream_tokens(stream, separator=","):
+    """
+    Tokens of a file object separated by a separator, read in chunks.
+
+    Args:
+    stream (file): A text or binary file object, e.g. sys.stdin.
+    separator (str): The separator.
+
+    Returns:
+    generator: The tokens as strings, stripped of whitespace. Empty tokens
+    are skipped.
+    """
+    rest = ""
+    for chunk in _decoded(stream):
+        pieces = (rest + chunk).split(separator)
+        rest = pieces.pop()
+        for piece in pieces:
+            piece = piece.strip(WHITESPACE)
+            if piece:
+                yield piece
+    rest = rest.strip(WHITESPACE)
+    if rest:
+        yield rest
+
+class MappedInput:
+    """
+    Read-only memory map of an input file, usable as a context manager.
+
+    The ``buffer`` attribute can be given to the iterators of this module or
+    to the parse_input function of a day. Slices of it must be released (or
+    decoded) before closing the map.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            size = self._file.seek(0, 2)
+            self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        except Exception:
+            self._file.close()
+            raise
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def close(self):
+        """
+        Closes the memory map and the file.
+        """
+        if isinstance(self.buffer, mmap.mmap):
+            try:
+                self.buffer.close()
+            except BufferError:
+                # A slice is still alive, e.g. in the traceback of a parser
+                # that failed: the map is released with it.
+                pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,54 @@
+"""
+Compact records for parsed inputs.
+
+A parsed input made of many small tuples or lists of strings costs an
+object per field and per record, and the solvers convert the strings to
+numbers again on every use. A Record instead holds its fields in
+``__slots__`` and, for inputs of many records, stores them as columns: one
+``array('q')`` of native integers per numeric field, a string or a list
+for the others. The numbers are converted once, by the parser.
+
+The parse cache (see parsecache) stores records too, the arrays as raw
+bytes.
+"""
+from array import array
+
+class Record:
+    """
+    Base of the record types of the parsed inputs. A subclass lists its
+    fields in ``__slots__`` and is built with their values, in that order.
+    """
+    __slots__ = ()
+
+    def __init__(self, *values):
+        if len(values) != len(self.__slots__):
+            raise TypeError(f"{type(self).__name__} takes {len(self.__slots__)} fields")
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def fields(self):
+        """
+        Returns:
+        tuple: The values of the fields, in the order of ``__slots__``.
+        """
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.fields() == other.fields()
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={value!r}" for name, value in zip(self.__slots__,
+                                                                       self.fields()))
+        return f"{type(self).__name__}({values})"
+
+def column(values=()):
+    """
+    Column of 64-bit signed integers.
+
+    Args:
+    values (iterable): The integers.
+
+    Returns:
+    array: The column.
+    """
+    return array('q', values)
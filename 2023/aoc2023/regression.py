@@ -0,0 +1,155 @@
+"""
+Performance regression gate.
+
+Every day is benchmarked on a generated input bigger than the puzzle one
+(see SUITE) and the timings are compared with a baseline JSON written by a
+previous run. A phase fails when it is slower than the baseline by more
+than the threshold and by more than NOISE_FLOOR_NS, or when its answer
+changed. The floor keeps the phases that take microseconds, whose timings
+are mostly noise, from failing the gate on a few microseconds of jitter.
+"""
+import json
+import os
+
+from aoc2023 import bench, days, generators
+
+# Size given to the generator of every day. The hot spots (distancer in day 11,
+# detect_cycle in day 14, max_energizer in day 16 and dijkstra2 in day 17) get
+# inputs as big as a run of a few seconds allows.
+SUITE = {
+    1: 10000,
+    2: 5000,
+    3: 400,
+    4: 5000,
+    5: 100,
+    6: 3,
+    7: 5000,
+    8: 30000,
+    9: 2000,
+    10: 400,
+    11: 600,
+    13: 5000,
+    14: 100,
+    15: 40000,
+    16: 80,
+    17: 80,
+    18: 50000,
+}
+SEED = 0
+NOISE_FLOOR_NS = 1_000_000
+DEFAULT_BASELINE = os.path.join(days.YEAR_DIR, "benchmarks", "baseline.json")
+
+def run_suite(suite_days=None, warmup=1, repeat=3):
+    """
+    Benchmarks the suite.
+
+    Args:
+    suite_days (list): Days to run. Defaults to every day of SUITE.
+    warmup (int): Number of untimed runs of every phase.
+    repeat (int): Number of timed runs of every phase.
+
+    Returns:
+    list: The rows of bench.bench_day, with the size and seed of the input.
+    """
+    rows = []
+    for day in suite_days or sorted(SUITE):
+        text = generators.generate(day, size=SUITE[day], seed=SEED)
+        for row in bench.bench_day(day, text=text, warmup=warmup, repeat=repeat):
+            rows.append(dict(row, size=SUITE[day], seed=SEED))
+    return rows
+
+def _key(row):
+    return f"{row['day']}.{row['phase']}"
+
+def save_baseline(rows, path=DEFAULT_BASELINE):
+    """
+    Writes benchmark rows into the baseline, replacing the entries of the
+    same day and phase and keeping the others.
+
+    Args:
+    rows (list): Rows as returned by run_suite.
+    path (str): The baseline file.
+    """
+    baseline = load_baseline(path) if os.path.exists(path) else {}
+    baseline.update({_key(row): row for row in rows})
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, default=str)
+
+def load_baseline(path=DEFAULT_BASELINE):
+    """
+    Reads a baseline written by save_baseline.
+
+    Args:
+    path (str): The baseline file.
+
+    Returns:
+    dict: The baseline rows by 'day.phase' key.
+    """
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def compare(rows, baseline, threshold=0.25, stat="min_ns", noise_floor_ns=NOISE_FLOOR_NS):
+    """
+    Compares benchmark rows with a baseline.
+
+    Args:
+    rows (list): Rows as returned by run_suite.
+    baseline (dict): Baseline as returned by load_baseline.
+    threshold (float): Allowed slowdown, as a fraction of the baseline timing.
+    stat (str): Statistic to compare: 'min_ns', 'median_ns' or 'p95_ns'.
+    noise_floor_ns (int): Smallest slowdown flagged, in nanoseconds, whatever
+    the ratio.
+
+    Returns:
+    list: One dict per row with the day, phase, baseline and current timings,
+    their ratio and a status: 'ok', 'slower', 'answer changed' or 'new'.
+    """
+    results = []
+    for row in rows:
+        reference = baseline.get(_key(row))
+        result = dict(day=row["day"], phase=row["phase"], current_ns=row[stat],
+                      baseline_ns=None, ratio=None, status="new")
+        if reference is not None and reference.get("size") == row["size"]:
+            result["baseline_ns"] = reference[stat]
+            result["ratio"] = row[stat] / max(reference[stat], 1)
+            if str(reference["answer"]) != str(row["answer"]) and row["answer"] is not None:
+                result["status"] = "answer changed"
+            elif (result["ratio"] > 1 + threshold
+                  and row[stat] - reference[stat] > noise_floor_ns):
+                result["status"] = "slower"
+            else:
+                result["status"] = "ok"
+        results.append(result)
+    return results
+
+def failed(results):
+    """
+    Tells whether any compared phase got slower or changed its answer.
+
+    Args:
+    results (list): Results as returned by compare.
+
+    Returns:
+    bool: True if the gate fails.
+    """
+    return any(result["status"] in ("slower", "answer changed") for result in results)
+
+def format_results(results):
+    """
+    Formats the comparison as an aligned table with timings in milliseconds.
+
+    Args:
+    results (list): Results as returned by compare.
+
+    Returns:
+    str: The table.
+    """
+    lines = [f"{'day':>3}  {'phase':<6}  {'baseline ms':>12}  {'current ms':>12}  "
+             f"{'ratio':>6}  status"]
+    for result in results:
+        baseline = "" if result["baseline_ns"] is None else f"{result['baseline_ns'] / 1e6:.3f}"
+        ratio = "" if result["ratio"] is None else f"{result['ratio']:.2f}"
+        lines.append(f"{result['day']:>3}  {result['phase']:<6}  {baseline:>12}  "
+                     f"{result['current_ns'] / 1e6:>12.3f}  {ratio:>6}  {result['status']}")
+    return "\n".join(lines)
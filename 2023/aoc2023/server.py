@@ -0,0 +1,318 @@
+"""
+Warm solver server, and a client to load-test it.
+
+Calling the solvers from another process pays the interpreter startup and
+the import of the modules every time. The server is started once and keeps
+a pool of worker processes that import every day module at start, so a
+request only pays its parse and its part.
+
+It listens on localhost TCP, or on a Unix socket, for JSON lines:
+
+    {"day": 16, "part": 2, "input": "...", "id": "optional"}
+
+and answers every request with one JSON line, in the order of the requests
+of the connection:
+
+    {"id": ..., "day": 16, "part": 2, "answer": 8185, "parse_ns": ..., "elapsed_ns": ...,
+     "wall_ns": ..., "error": null}
+
+where elapsed_ns is the time of the part and wall_ns the time the request
+spent in the server, waiting for a worker included. Connections are served
+concurrently; a client wanting several requests in flight opens several
+connections, as the load test does.
+
+A worker can't be stopped in the middle of a request, and one that dies
+(killed, or out of memory) breaks the whole pool. Either way the server
+answers the request with an error, kills what is left of the pool and
+starts a new one; the requests that were running on the old pool are sent
+again to the new one, once. With a time budget, a request running longer
+is stopped that way, as a day 8 map whose end node can't be reached would
+otherwise hold its worker forever. A memory budget limits the address
+space of every worker to what it uses once warm plus the budget, so that
+a request going over it fails with a MemoryError (on Linux).
+"""
+import asyncio
+import json
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from aoc2023 import bench, days
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8023
+# Longest request line, which holds a whole input
+LINE_LIMIT = 2**28
+
+def _warm():
+    for day in days.DAYS:
+        days.import_day(day)
+
+def _limit_memory(memory_bytes):
+    try:
+        import resource
+        with open("/proc/self/statm", encoding='ascii') as f:
+            size = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (ImportError, OSError, ValueError):
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = size + memory_bytes
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+def _init_worker(memory_bytes=None):
+    # Ctrl-C stops the server, which then stops its workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _warm()
+    if memory_bytes is not None:
+        _limit_memory(memory_bytes)
+
+def _solve(day, part, text):
+    try:
+        module = days.import_day(day)
+        solve = days.solver(module, part)
+        start = time.perf_counter_ns()
+        data = module.parse_input(text)
+        parsed = time.perf_counter_ns()
+        answer = solve(data)
+        return dict(answer=answer, parse_ns=parsed - start,
+                    elapsed_ns=time.perf_counter_ns() - parsed, error=None)
+    except Exception as exc:
+        return dict(answer=None, parse_ns=None, elapsed_ns=None,
+                    error=f"{type(exc).__name__}: {exc}")
+
+class SolverServer:
+    """
+    Server answering solve requests on a pool of warm worker processes.
+
+    Attributes:
+    workers (int): Number of worker processes.
+    seconds (float): Wall-clock budget of a request, None for no limit.
+    memory_bytes (int): Memory budget of a worker, None for no limit.
+    pool (ProcessPoolExecutor): The workers, each with every day imported.
+    served (int): Number of requests answered.
+    restarts (int): Number of times the pool was replaced.
+    """
+
+    def __init__(self, workers=None, seconds=None, memory_bytes=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.seconds = seconds
+        self.memory_bytes = memory_bytes
+        self.pool = self._start_pool()
+        self.served = 0
+        self.restarts = 0
+
+    def _start_pool(self):
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   initargs=(self.memory_bytes,))
+
+    def restart(self, broken):
+        """
+        Replaces a pool that broke or holds a runaway request, unless it
+        already was.
+
+        Args:
+        broken (ProcessPoolExecutor): The pool.
+        """
+        if broken is not self.pool:
+            return
+        # The running workers can't be cancelled: kill them
+        for process in list((broken._processes or {}).values()):
+            process.kill()
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.pool = self._start_pool()
+        self.restarts += 1
+
+    async def _run(self, day, part, text):
+        """
+        Runs a request on the pool within the time budget, on a new pool
+        if the one it ran on broke because of another request.
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            pool = self.pool
+            try:
+                return await asyncio.wait_for(loop.run_in_executor(pool, _solve, day, part, text),
+                                              self.seconds)
+            except asyncio.TimeoutError:
+                self.restart(pool)
+                return dict(answer=None, parse_ns=None, elapsed_ns=None,
+                            error=f"Time budget of {self.seconds:g} s exceeded")
+            except BrokenProcessPool:
+                replaced = pool is not self.pool
+                self.restart(pool)
+                if not replaced or attempt:
+                    return dict(answer=None, parse_ns=None, elapsed_ns=None,
+                                error="Worker died (killed or out of memory)")
+
+    async def answer(self, line):
+        """
+        Answers one request line.
+
+        Args:
+        line (bytes): The JSON request.
+
+        Returns:
+        dict: The response.
+        """
+        start = time.perf_counter_ns()
+        try:
+            request = json.loads(line)
+            day, part, text = int(request["day"]), int(request["part"]), request["input"]
+        except (ValueError, KeyError, TypeError) as exc:
+            return dict(id=None, error=f"Bad request: {type(exc).__name__}: {exc}")
+        result = await self._run(day, part, text)
+        self.served += 1
+        return dict(id=request.get("id"), day=day, part=part, **result,
+                    wall_ns=time.perf_counter_ns() - start)
+
+    async def handle(self, reader, writer):
+        """
+        Serves one connection until the client closes it.
+        """
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    response = await self.answer(line)
+                    writer.write(json.dumps(response, default=str).encode() + b"\n")
+                    await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, ready=None):
+        """
+        Listens until cancelled.
+
+        Args:
+        host (str): TCP host.
+        port (int): TCP port.
+        socket_path (str): Unix socket to listen on instead of TCP.
+        ready (function): Called with the listening address once the
+        workers are warm.
+        """
+        # Start (and so warm) the workers before accepting requests. A new
+        # pool after a restart warms up on its first requests instead.
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.pool, _warm)
+                               for _ in range(self.workers)))
+        if socket_path:
+            server = await asyncio.start_unix_server(self.handle, socket_path, limit=LINE_LIMIT)
+            address = socket_path
+        else:
+            server = await asyncio.start_server(self.handle, host, port, limit=LINE_LIMIT)
+            address = "%s:%d" % server.sockets[0].getsockname()[:2]
+        if ready is not None:
+            ready(address)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        """
+        Stops the workers.
+        """
+        self.pool.shutdown(cancel_futures=True)
+
+def run_server(host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, workers=None,
+               ready=None, seconds=None, memory_bytes=None):
+    """
+    Runs a server until interrupted.
+
+    Args:
+    host (str): TCP host.
+    port (int): TCP port.
+    socket_path (str): Unix socket to listen on instead of TCP.
+    workers (int): Worker processes. Defaults to the CPU count.
+    ready (function): Called with the listening address once it is ready.
+    seconds (float): Wall-clock budget of a request. None for no limit.
+    memory_bytes (int): Memory budget of a worker. None for no limit.
+    """
+    server = SolverServer(workers, seconds, memory_bytes)
+    try:
+        asyncio.run(server.serve(host, port, socket_path, ready))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+async def _connect(host, port, socket_path):
+    if socket_path:
+        return await asyncio.open_unix_connection(socket_path, limit=LINE_LIMIT)
+    return await asyncio.open_connection(host, port, limit=LINE_LIMIT)
+
+async def _client(host, port, socket_path, requests, latencies, responses):
+    reader, writer = await _connect(host, port, socket_path)
+    try:
+        while requests:
+            request = requests.pop()
+            start = time.perf_counter_ns()
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter_ns() - start)
+            responses.append(response)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+async def load_test(day, part, text, total=100, concurrency=4, host=DEFAULT_HOST,
+                    port=DEFAULT_PORT, socket_path=None):
+    """
+    Sends the same request many times over concurrent connections.
+
+    Args:
+    day (int): The day number.
+    part (int): The part number.
+    text (str): The input.
+    total (int): Number of requests.
+    concurrency (int): Number of connections, each with one request in flight.
+    host (str): TCP host of the server.
+    port (int): TCP port of the server.
+    socket_path (str): Unix socket of the server instead of TCP.
+
+    Returns:
+    dict: The number of requests, of errors and of distinct answers, the
+    throughput, and the statistics of bench.summarize of the round-trip
+    latencies and of the part time reported by the server.
+    """
+    requests = [dict(id=i, day=day, part=part, input=text) for i in range(total)]
+    latencies, responses = [], []
+    start = time.perf_counter_ns()
+    await asyncio.gather(*(_client(host, port, socket_path, requests, latencies, responses)
+                           for _ in range(concurrency)))
+    wall_ns = time.perf_counter_ns() - start
+    solved = [response for response in responses if response["error"] is None]
+    return dict(requests=len(responses), errors=len(responses) - len(solved),
+                answers=sorted({str(response["answer"]) for response in solved}),
+                wall_ns=wall_ns, requests_per_second=len(responses) / (wall_ns / 1e9),
+                latency=bench.summarize(latencies),
+                part=bench.summarize([response["elapsed_ns"] for response in solved])
+                if solved else None)
+
+def format_load(report):
+    """
+    Formats a load test report.
+
+    Args:
+    report (dict): Report as returned by load_test.
+
+    Returns:
+    str: The lines.
+    """
+    latency = report["latency"]
+    lines = [f"{report['requests']} requests, {report['errors']} errors, "
+             f"{report['requests_per_second']:.1f} requests/s",
+             f"answers: {', '.join(report['answers']) or '-'}",
+             f"round trip ms: min {latency['min_ns'] / 1e6:.3f}  "
+             f"median {latency['median_ns'] / 1e6:.3f}  p95 {latency['p95_ns'] / 1e6:.3f}"]
+    if report["part"] is not None:
+        lines.append(f"part ms:       min {report['part']['min_ns'] / 1e6:.3f}  "
+                     f"median {report['part']['median_ns'] / 1e6:.3f}  "
+                     f"p95 {report['part']['p95_ns'] / 1e6:.3f}")
+    return "\n".join(lines)
@@ -0,0 +1,74 @@
+"""
+Streaming mode of the days whose answer is a fold over independent lines
+or tokens.
+
+Their modules have a parse_stream function turning a file object into an
+iterator of parsed lines, which their parts consume as they go (through
+map_red_lines, which stays lazy on iterators). The input is never held
+whole in memory, so it can be arbitrarily large or piped from a generator:
+
+    python -m aoc2023 generate --day 1 --scale 1000 | python -m aoc2023 stream --day 1 --part 2
+
+A stream can only be read once, so each part of a file is a separate pass
+and standard input answers a single part.
+"""
+import sys
+import time
+
+from aoc2023 import days
+
+DAYS = (1, 2, 4, 9, 15)
+
+def solve_stream(day, part, stream):
+    """
+    Answers one part of a day reading its input incrementally.
+
+    Args:
+    day (int): The day number, one of DAYS.
+    part (int): The part number.
+    stream (file): Text or binary file object holding the input.
+
+    Returns:
+    dict: The day, the part, the answer and the time taken in nanoseconds.
+    """
+    module = days.import_day(day)
+    if not hasattr(module, "parse_stream"):
+        raise ValueError(f"Day {day} has no streaming mode")
+    start = time.perf_counter_ns()
+    answer = days.solver(module, part)(module.parse_stream(stream))
+    return dict(day=day, part=part, answer=answer, elapsed_ns=time.perf_counter_ns() - start)
+
+def solve(day, parts=days.PARTS, path=None):
+    """
+    Answers parts of a day reading a file, or standard input, incrementally.
+
+    Args:
+    day (int): The day number, one of DAYS.
+    parts (tuple): The parts to answer. Only one for standard input.
+    path (str): Input file. None or '-' reads standard input.
+
+    Returns:
+    list: One dict per part, as returned by solve_stream.
+    """
+    if path in (None, "-"):
+        if len(parts) != 1:
+            raise ValueError("Standard input can only be read once: choose one part")
+        return [solve_stream(day, parts[0], sys.stdin.buffer)]
+    rows = []
+    for part in parts:
+        with open(path, 'rb') as f:
+            rows.append(solve_stream(day, part, f))
+    return rows
+
+def format_rows(rows):
+    """
+    Formats the rows of solve as one line per part with timings in milliseconds.
+
+    Args:
+    rows (list): Rows as returned by solve.
+
+    Returns:
+    str: The lines.
+    """
+    return "\n".join(f"day {row['day']} part {row['part']}: {row['answer']} "
+                     f"({row['elapsed_ns'] / 1e6:.3f} ms)" for row in rows)
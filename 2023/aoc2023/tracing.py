@@ -0,0 +1,150 @@
+"""
+Trace of where the wall time of a run goes, in the Chrome trace-event format.
+
+Every phase of every day is recorded as a span: the import of its module,
+the read of its input file, the parse and the call of each part (on its own
+parse, as the parts modify their input). The functions of NESTED are
+wrapped for the run, so that their calls show as spans inside the part
+calling them. The trace is a JSON document that chrome://tracing, Perfetto
+(ui.perfetto.dev) or speedscope open as a timeline.
+"""
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+from aoc2023 import days
+
+# Functions called by the parts, traced as nested spans
+NESTED = {
+    3: ("read_numbers",),
+    11: ("galaxier", "distancer"),
+    15: ("initializator", "lens_power"),
+}
+
+class Tracer:
+    """
+    Recorder of the spans of a run.
+
+    Attributes:
+    events (list): The trace events, as dicts.
+    """
+
+    def __init__(self):
+        self.events = [dict(name="process_name", ph="M", pid=os.getpid(), tid=0,
+                            args=dict(name="aoc2023"))]
+        self._origin = time.perf_counter_ns()
+
+    @contextlib.contextmanager
+    def span(self, name, category="phase", **args):
+        """
+        Records the time spent in the block as a complete event.
+
+        Args:
+        name (str): Name of the span.
+        category (str): Category of the span, to filter them in the viewer.
+        **args: Values shown with the span. The block can add some to the
+        dict it receives.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield args
+        finally:
+            end = time.perf_counter_ns()
+            self.events.append(dict(name=name, cat=category, ph="X",
+                                    ts=(start - self._origin) / 1e3, dur=(end - start) / 1e3,
+                                    pid=os.getpid(), tid=threading.get_native_id(),
+                                    args={key: str(value) for key, value in args.items()}))
+
+    def wrap(self, function, name):
+        """
+        Wraps a function so that each of its calls is recorded as a span.
+
+        Args:
+        function (function): The function.
+        name (str): Name of its spans.
+
+        Returns:
+        function: The wrapper.
+        """
+        @functools.wraps(function)
+        def traced(*args, **kwargs):
+            with self.span(name, "call"):
+                return function(*args, **kwargs)
+        return traced
+
+    def document(self):
+        """
+        Returns:
+        dict: The trace, in the JSON object format of the trace-event format.
+        """
+        return dict(traceEvents=self.events, displayTimeUnit="ms")
+
+@contextlib.contextmanager
+def _nested(tracer, module, day):
+    names = NESTED.get(day, ())
+    originals = {name: getattr(module, name) for name in names}
+    for name, function in originals.items():
+        setattr(module, name, tracer.wrap(function, f"day{day}.{name}"))
+    try:
+        yield
+    finally:
+        for name, function in originals.items():
+            setattr(module, name, function)
+
+def trace_day(tracer, day, parts=days.PARTS, path=None):
+    """
+    Runs the parts of a day, recording their phases.
+
+    Args:
+    tracer (Tracer): The recorder.
+    day (int): The day number.
+    parts (tuple): The parts to run.
+    path (str): Input file. Defaults to dayN.txt in the day directory.
+
+    Returns:
+    dict: The answer of every part, by part.
+    """
+    answers = {}
+    with tracer.span(f"day {day}", "day"):
+        with tracer.span("import", day=day):
+            module = days.import_day(day)
+        with tracer.span("read", day=day, path=path or days.input_path(day)) as args:
+            text = days.read_input(day, path)
+            args["bytes"] = len(text)
+        with _nested(tracer, module, day):
+            for part in parts:
+                with tracer.span("parse", day=day, part=part):
+                    data = module.parse_input(text)
+                with tracer.span(f"part{part}", day=day) as args:
+                    answers[part] = args["answer"] = days.solver(module, part)(data)
+    return answers
+
+def trace_run(run_days=days.DAYS, parts=days.PARTS, path=None):
+    """
+    Runs several days one after the other, recording their phases.
+
+    Args:
+    run_days (tuple): The days to run.
+    parts (tuple): The parts to run.
+    path (str): Input file, for a single day. Defaults to dayN.txt of each day.
+
+    Returns:
+    tuple: The Tracer and the answers, by day and part.
+    """
+    tracer = Tracer()
+    answers = {day: trace_day(tracer, day, parts, path) for day in run_days}
+    return tracer, answers
+
+def write(tracer, path):
+    """
+    Writes a trace to a JSON file.
+
+    Args:
+    tracer (Tracer): The recorder.
+    path (str): The file.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(tracer.document(), f)
@@ -0,0 +1,183 @@
+"""
+Watcher re-solving a day whenever its input or its code changes.
+
+An asyncio task polls the modification times of the ``dayN.py`` and
+``dayN.txt`` files of the 2023 tree. When some change, only the days they
+belong to are solved again, in a worker thread so that the watching goes
+on, and the time of the parse and of every part is printed.
+
+The day modules stay imported between runs: a changed module is reloaded
+in place, the others (and the aoc2023 helpers) are not touched. The parsed
+input of every day is kept too, under the hash of the input and a
+fingerprint of the bytecode of parse_input and of the module functions,
+classes and constants it uses (see parsecache.parser_fingerprint), so that
+editing a part reuses it while
+editing the parser or the input parses again. The parts modify their input
+on several days, so each one gets a deep copy.
+
+Changes to the aoc2023 helpers (grid, reader...) need a restart.
+"""
+import asyncio
+import copy
+import hashlib
+import importlib
+import os
+import time
+import traceback
+
+from aoc2023 import days, parsecache
+
+DEFAULT_INTERVAL = 0.5
+
+def watched_files(watch_days=days.DAYS):
+    """
+    Files whose changes trigger a new run.
+
+    Args:
+    watch_days (tuple): The days to watch.
+
+    Returns:
+    dict: The day of every watched file (its code and its input), by path.
+    """
+    files = {}
+    for day in watch_days:
+        files[os.path.join(days.day_dir(day), f"day{day}.py")] = day
+        files[days.input_path(day)] = day
+    return files
+
+def _mtimes(files):
+    stamps = {}
+    for path in files:
+        try:
+            stamps[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            stamps[path] = None
+    return stamps
+
+class Watcher:
+    """
+    State kept between the runs: the imported modules and the parsed inputs.
+    """
+
+    def __init__(self, watch_days=days.DAYS, parts=days.PARTS, output=print):
+        self.days = tuple(watch_days)
+        self.parts = tuple(parts)
+        self.output = output
+        self.files = watched_files(self.days)
+        self.modules = {}
+        self.parses = {}
+
+    def _module(self, day, reload):
+        module = self.modules.get(day)
+        if module is None:
+            module = days.import_day(day)
+        elif reload:
+            module = importlib.reload(module)
+        self.modules[day] = module
+        return module
+
+    def solve(self, day, code_changed=True):
+        """
+        Solves a day, reusing its module and, if possible, its parsed input.
+
+        Args:
+        day (int): The day number.
+        code_changed (bool): Reload the module of the day first.
+
+        Returns:
+        dict: The day, whether the parse was reused, the parse time (None if
+        the input was not parsed) and one (part, answer, nanoseconds) tuple
+        per part. 'error' holds the traceback if the reload, the parse or a
+        part failed.
+        """
+        result = dict(day=day, reused=False, parse_ns=None, parts=[], error=None)
+        try:
+            module = self._module(day, code_changed)
+            text = days.read_input(day)
+            key = (hashlib.sha256(text.encode()).hexdigest(),
+                   parsecache.parser_fingerprint(module))
+            cached = self.parses.get(day)
+            if cached is not None and cached[0] == key:
+                result["reused"] = True
+                data = cached[1]
+            else:
+                start = time.perf_counter_ns()
+                data = module.parse_input(text)
+                result["parse_ns"] = time.perf_counter_ns() - start
+                self.parses[day] = (key, data)
+            for part in self.parts:
+                argument = copy.deepcopy(data)
+                start = time.perf_counter_ns()
+                answer = days.solver(module, part)(argument)
+                result["parts"].append((part, answer, time.perf_counter_ns() - start))
+        except FileNotFoundError as exc:
+            result["error"] = f"No input: {exc.filename}"
+        except Exception:
+            result["error"] = traceback.format_exc()
+        return result
+
+    async def run(self, interval=DEFAULT_INTERVAL, initial=True):
+        """
+        Watches the files until cancelled.
+
+        Args:
+        interval (float): Seconds between two polls.
+        initial (bool): Solve every watched day once at start.
+        """
+        loop = asyncio.get_running_loop()
+        stamps = _mtimes(self.files)
+        if initial:
+            for day in self.days:
+                self.output(format_result(await loop.run_in_executor(None, self.solve, day)))
+        self.output(f"Watching {len(self.files)} files, Ctrl-C to stop")
+        while True:
+            await asyncio.sleep(interval)
+            current = _mtimes(self.files)
+            changed = [path for path in self.files if current[path] != stamps[path]]
+            if not changed:
+                continue
+            # Let an editor finish writing before reading the files
+            await asyncio.sleep(interval / 5)
+            stamps = _mtimes(self.files)
+            code_days = {self.files[path] for path in changed if path.endswith(".py")}
+            for day in sorted({self.files[path] for path in changed}):
+                result = await loop.run_in_executor(None, self.solve, day, day in code_days)
+                self.output(format_result(result))
+
+def format_result(result):
+    """
+    Formats a run as one line per part with its latency in milliseconds.
+
+    Args:
+    result (dict): Run as returned by Watcher.solve.
+
+    Returns:
+    str: The lines.
+    """
+    if result["reused"]:
+        parse = "reused"
+    elif result["parse_ns"] is None:
+        parse = "-"
+    else:
+        parse = f"{result['parse_ns'] / 1e6:.3f} ms"
+    lines = [f"[{time.strftime('%H:%M:%S')}] day {result['day']}: parse {parse}"]
+    for part, answer, elapsed in result["parts"]:
+        lines.append(f"  part {part}: {answer}  ({elapsed / 1e6:.3f} ms)")
+    if result["error"]:
+        lines.append(result["error"].rstrip())
+    return "\n".join(lines)
+
+def watch(watch_days=days.DAYS, parts=days.PARTS, interval=DEFAULT_INTERVAL, initial=True):
+    """
+    Runs a watcher until interrupted.
+
+    Args:
+    watch_days (tuple): The days to watch.
+    parts (tuple): The parts to solve.
+    interval (float): Seconds between two polls.
+    initial (bool): Solve every watched day once at start.
+    """
+    try:
+        asyncio.run(Watcher(watch_days, parts).run(interval, initial))
+    except KeyboardInterrupt:
+        pass
@@ -2,19 +2,19 @@
 This module contains the solution to the Day 1 Advent of Code challenge.
 """
 
-# importing functools for reduce()
-from functools import reduce as red
 import re
 import time
 import os
 import operator
+import sys
 
-path =  os.getcwd()
-FILE = "day1.txt"
-
-with open(path + "/" + FILE, encoding="utf-8") as f:
-    lines = f.readlines()
-    lines = [item.strip("\n") for item in lines]
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.mapreduce import map_red_lines
 
 #Part 1
 
@@ -52,21 +52,6 @@ def numbers_in_word(word):
 
     return digit1*10+digit2
 
-def map_red_lines(list_, map_function, red_function):
-    """
-    Applies a map function to each element in a list and then reduces the result
-    using a reduce function.
-    
-    Args:
-        list_ (list): The input list to be processed.
-        map_function (function): A function to be applied to each element in the list.
-        red_function (function): A function to be used to reduce the mapped results.
-    
-    Returns:
-        The result of applying the reduce function to the mapped elements of the list.
-    """
-    return red(red_function,(map(map_function,list_)))
-
 #Part 2
 
 digits = [4,5,6,7,9,2,1,3,8]
@@ -183,17 +168,68 @@ def numbers_in_word_2(word, func_trans = translator):
     #print(digit1*10+digit2,"\n")
     return digit1*10+digit2
 
+#Runner interface
+
+def parse_input(text):
+    """
+    Parameters
+    ----------
+    text : string or bytes-like
+        Raw content of the puzzle input, e.g. the buffer of a
+        reader.MappedInput.
+
+    Returns
+    -------
+    output : list
+        The calibration lines, without line breaks.
+    """
+    return [reader.text(line) for line in reader.lines(text)]
+
+def parse_stream(stream):
+    """
+    Parameters
+    ----------
+    stream : file
+        Text or binary file object holding the puzzle input, e.g. sys.stdin.
+
+    Returns
+    -------
+    output : generator
+        The calibration lines, read one at a time. The parts fold them as
+        they come, in constant memory.
+    """
+    return reader.stream_lines(stream)
+
+def part1(calibration_lines):
+    """
+    Sum of the calibration values using only numeric digits.
+    """
+    return map_red_lines(calibration_lines, numbers_in_word, operator.add)
+
+def part2(calibration_lines):
+    """
+    Sum of the calibration values using numeric and spelled-out digits.
+    """
+    return map_red_lines(calibration_lines, numbers_in_word_2, operator.add)
+
 #Solution
 if __name__ == "__main__":
 
+    #Code to open the input file
+    path =  os.getcwd()
+    FILE = "day1.txt"
+
+    with open(path + "/" + FILE, encoding="utf-8") as f:
+        lines = parse_input(f.read())
+
     #Part 1
     time_0 = time.time()
-    print("Solution part 1: ", map_red_lines(lines, numbers_in_word, lambda a,b: a+b))
+    print("Solution part 1: ", part1(lines))
     time_1 = time.time()
     print("Time ex. of part 1: ", time_1-time_0)
 
     #Part 2
     time_0 = time.time()
-    print("Solution part 2: ", map_red_lines(lines, numbers_in_word_2, operator.add))
+    print("Solution part 2: ", part2(lines))
     time_2 = time.time()
     print("Time ex. of part 2: ", time_2-time_0)
@@ -5,23 +5,18 @@ This module contains the solution to the Day 2 Advent of Code challenge.
 #Importing necessary modules
 import re
 from functools import reduce
+import operator
 import os
+import sys
 import time
 
-def map_red_lines(list_, map_function, red_function):
-    """
-    This is a map-reduce function.
-    To use it, you need to import reduce from functools.
-
-    Parameters:
-        list_ (Iterable): an iterable object
-        map_function (function): map fuction
-        red_function (function): reduce fuction
-
-    Returns:
-        The result of applying map-reduce to the interable.
-    """
-    return reduce(red_function,(map(map_function,list_)))
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.mapreduce import map_red_lines
 
 #Part 1
 
@@ -143,6 +138,59 @@ def maxs(game_str):
     result = blue_max * green_max * red_max
     return result
 
+#Runner interface
+
+def parse_input(text):
+    """
+    This function splits the raw puzzle input into game strings.
+
+    Parameters:
+        text (str or bytes-like): Raw content of the puzzle input, e.g. the
+        buffer of a reader.MappedInput
+
+    Returns:
+        games (list): One game string per line
+    """
+    return [reader.text(line) for line in reader.lines(text)]
+
+def parse_stream(stream):
+    """
+    This function reads the game strings of a file object one at a time.
+
+    Parameters:
+        stream (file): Text or binary file object holding the puzzle input,
+        e.g. sys.stdin
+
+    Returns:
+        games (generator): One game string per line. The parts fold them as
+        they come, in constant memory
+    """
+    return reader.stream_lines(stream)
+
+def part1(games):
+    """
+    This function returns the sum of the ids of the possible games.
+
+    Parameters:
+        games (list): Game strings
+
+    Returns:
+        result (int): Sum of the ids of the possible games
+    """
+    return map_red_lines(games, checks, operator.add)
+
+def part2(games):
+    """
+    This function returns the sum of the powers of the minimum sets of cubes.
+
+    Parameters:
+        games (list): Game strings
+
+    Returns:
+        result (int): Sum of the powers of every game
+    """
+    return map_red_lines(games, maxs, operator.add)
+
 #Solution
 if __name__ == "__main__":
 
@@ -151,17 +199,16 @@ if __name__ == "__main__":
     FILE = "day2.txt"
 
     with open(path + '/' + FILE, encoding = 'utf-8') as f:
-        lines = f.readlines()
-        lines = [item.strip("\n") for item in lines]
+        lines = parse_input(f.read())
 
     #Part 1
     time_0 = time.time()
-    print("Solution part 1: ", map_red_lines(lines, checks, lambda a,b: a+b))
+    print("Solution part 1: ", part1(lines))
     time_1 = time.time()
     print("Time ex. of part 1: ", time_1-time_0)
 
     #Part 2
     time_0 = time.time()
-    print("Solution part 2: ", map_red_lines(lines, maxs, lambda a,b: a+b))
+    print("Solution part 2: ", part2(lines))
     time_2 = time.time()
     print("Time ex. of part 2: ", time_2-time_0)
@@ -2,16 +2,29 @@
 This module contains the solution to the Day 3 Advent of Code challenge.
 """
 import os
+import sys
 import time
 
-def check_valid(grid_lines, start_row, start_col, num_length):
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.grid import Grid
+
+DIGITS = b"0123456789"
+DOT = ord('.')
+GEAR = ord('*')
+
+def check_valid(grid, start_row, start_col, num_length):
     """    
     Check the region next to a number to see if it's a part number.
     If it is, check if there's a gear (*) next to the number,
     and if positive returns the gear's coordinates.
 
     Parameters:
-        grid_lines (List[str]): List of strings representing the grid.
+        grid (Grid): The engine schematic, with a border of dots.
         start_row (int): Starting row index.
         start_col (int): Starting column index.
         num_length (int): Length of the number to check from the starting column index.
@@ -26,69 +39,59 @@ def check_valid(grid_lines, start_row, start_col, num_length):
     gear = False
     gear_pos = (-1, -1)
 
-    row_min = max(start_row, 1)
-    row_max = min(start_row, len(grid_lines) - 2)
-
-    col_min = max(start_col, 1)
-    col_max = min(start_col + num_length, len(grid_lines[0]) - 1)
-
-    for row in range(row_min - 1, row_max + 2):
-        for col in range(col_min - 1, col_max + 1):
-            char = grid_lines[row][col]
-            if char != '.' and not char.isdigit():
+    # The border of dots makes the region valid even on the edges of the grid
+    cells = grid.cells
+    first = grid.index(start_row - 1, start_col - 1)
+    for row_start in (first, first + grid.stride, first + 2 * grid.stride):
+        for index in range(row_start, row_start + num_length + 2):
+            char = cells[index]
+            if char != DOT and char not in DIGITS:
                 check = True
-                if char == '*':
+                if char == GEAR:
                     gear = True
-                    gear_pos = (row, col)
+                    gear_pos = grid.position(index)
                 return check, gear, gear_pos
 
     return check, gear, gear_pos
 
 
-def read_numbers(grid_lines):
+def read_numbers(grid):
     """
-    Process the grid grid_lines to identify and sum up part numbers.
-    Additionally, process the grid grid_lines to identify and sum up part gears ('*').
+    Process the grid to identify and sum up part numbers.
+    Additionally, process the grid to identify and sum up part gears ('*').
 
     Parameters:
-        grid_grid_lines (List[str]): List of strings representing the grid.
+        grid (Grid): The engine schematic, with a border of dots.
 
     Returns:
         Tuple[int, int]:
             - total_sum (int): The total sum of all part numbers found in the grid.
             - gear_sum (int): The total product sum of gears ('*').
     """
-    visited = set()
     gear_dict = {}
     total_sum = 0
 
-    for i, line in enumerate(grid_lines):
+    for i, line in enumerate(grid.rows()):
         j = 0
         while j < len(line):
-            if (i, j) in visited:
-                j += 1
-                continue
-
-            if line[j].isdigit():
-                number_str = line[j]
+            if line[j] in DIGITS:
                 start_col = j
-                while (j + 1) < len(line) and line[j + 1].isdigit():
+                while (j + 1) < len(line) and line[j + 1] in DIGITS:
                     j += 1
-                    visited.add((i, j))
-                    number_str += line[j]
+                number = int(line[start_col:j + 1].tobytes())
 
-                check_number, gear, gear_pos = check_valid(grid_lines,
+                check_number, gear, gear_pos = check_valid(grid,
                                                            i, start_col,
-                                                           len(number_str))
+                                                           j + 1 - start_col)
                 if gear:
                     if gear_pos in gear_dict:
                         gear_dict[gear_pos][0] += 1
-                        gear_dict[gear_pos][1] *= int(number_str)
+                        gear_dict[gear_pos][1] *= number
                     else:
-                        gear_dict[gear_pos] = [1, int(number_str)]
+                        gear_dict[gear_pos] = [1, number]
 
                 if check_number:
-                    total_sum += int(number_str)
+                    total_sum += number
 
             j += 1
 
@@ -96,6 +99,33 @@ def read_numbers(grid_lines):
 
     return total_sum, gear_sum
 
+def parse_input(text):
+    """
+    Split the raw puzzle input into the rows of the engine schematic.
+
+    Parameters:
+        text (str or bytes-like): Raw content of the puzzle input, e.g. the
+            buffer of a reader.MappedInput.
+
+    Returns:
+        Grid: The engine schematic, with a border of dots.
+    """
+    return Grid.from_lines(reader.lines(text), border='.')
+
+
+def part1(grid):
+    """
+    Sum of all the part numbers in the engine schematic.
+    """
+    return read_numbers(grid)[0]
+
+
+def part2(grid):
+    """
+    Sum of all the gear ratios in the engine schematic.
+    """
+    return read_numbers(grid)[1]
+
 #Solution
 if __name__ == "__main__":
 
@@ -104,8 +134,7 @@ if __name__ == "__main__":
     FILE = "day3.txt"
 
     with open(os.path.join(path, FILE), encoding='utf-8') as f:
-        lines = f.readlines()
-        lines = [item.strip("\n") for item in lines]
+        lines = parse_input(f.read())
 
     start_time = time.time()
     solution = read_numbers(lines)
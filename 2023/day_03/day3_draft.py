@@ -6,15 +6,8 @@ Created on Sun Jun  9 19:55:56 2024
 @author: auro
 """
 import os
+import time
 
-#Code to open the input file
-path = os.getcwd()
-FILE = "day3.txt"
-
-with open(path + '/' + FILE, encoding = 'utf-8') as f:
-    lines = f.readlines()
-    lines = [item.strip("\n") for item in lines]
-    
 def check_valid(lines,i,j,j_len):
     check = False
     gear = False
@@ -67,19 +60,27 @@ def read_num(lines):
                 if check_number:
                     count += int(number)
                 #print(number, i,j_start, j-j_start+1)
-    print(count)
     #print(gear_dict)
     sum_gear = 0
     for key in gear_dict:
         if gear_dict[key][0]>=2:
             sum_gear+=gear_dict[key][1]
 
+    return count, sum_gear
+
+if __name__ == "__main__":
+    #Code to open the input file
+    path = os.getcwd()
+    FILE = "day3.txt"
+
+    with open(path + '/' + FILE, encoding = 'utf-8') as f:
+        lines = f.readlines()
+        lines = [item.strip("\n") for item in lines]
+
+    time0 = time.time()
+    count, sum_gear = read_num(lines)
+    time1 = time.time()
+    print(count)
     print(sum_gear)
-    return count
-            
-import time
-time0 = time.time()
-read_num(lines)
-time1 = time.time()
-print(time1-time0)
-#check_valid(lines,2,6,3)
+    print(time1-time0)
+    #check_valid(lines,2,6,3)
@@ -1,9 +1,77 @@
 """
 This module contains the solution to the Day 4 Advent of Code challenge.
 """
+from collections import deque
+import operator
 import os
+import sys
 import time
 
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.mapreduce import map_lines, map_red_lines
+
+def card_matches(numbers):
+    """
+    Count the numbers you have that are winning numbers on a card.
+
+    Parameters:
+        numbers (List[str]): The winning numbers and the numbers you have.
+
+    Returns:
+        int: The number of matches.
+    """
+    win_numbers = numbers[0].split(" ")
+    have_numbers = numbers[1].split(" ")
+    matches = 0
+    for num in have_numbers:
+        if num.isalnum() and num in win_numbers:
+            matches += 1
+    return matches
+
+def card_points(numbers):
+    """
+    Points won by a card: 1 for the first match, doubled for each other one.
+
+    Parameters:
+        numbers (List[str]): The winning numbers and the numbers you have.
+
+    Returns:
+        int: The points of the card.
+    """
+    matches = card_matches(numbers)
+    return 2**(matches - 1) if matches else 0
+
+def cards_won(matches):
+    """
+    Count the scratchcards won, original cards included.
+
+    Each card wins one copy of the next cards, as many as its matches, for
+    each of its own copies. Only the copies pending for the next cards are
+    kept, so the matches can come from an iterator in constant memory.
+
+    Parameters:
+        matches (Iterable[int]): The number of matches of each card, in order.
+
+    Returns:
+        int: The total number of cards.
+    """
+    pending = deque()
+    total_cards = 0
+    for count in matches:
+        copies = 1 + (pending.popleft() if pending else 0)
+        total_cards += copies
+        for i in range(count):
+            if i < len(pending):
+                pending[i] += copies
+            else:
+                pending.append(copies)
+    return total_cards
+
 def scratchcards(card_lines):
     """
     Process the cards to count the total number of points won.
@@ -17,30 +85,63 @@ def scratchcards(card_lines):
             - total_wins (int): The total points provided by the cards.
             - total_cards (int): The total number of cards won.
     """
-    total_wins = 0
-    dict_wins = {}
-    total_cards = 0
+    # The cards are independent until the copies are counted
+    matches = map_lines(list(card_lines), card_matches)
+    total_wins = sum(2**(count - 1) for count in matches if count)
+    return total_wins, cards_won(matches)
+
+def parse_input(text):
+    """
+    Split the raw puzzle input into the winning and owned numbers of each card.
 
-    for i, numbers in enumerate(card_lines):
-        win_numbers = numbers[0].split(" ")
-        have_numbers = numbers[1].split(" ")
-        points_pow = -1
-        check = False
-        for num in have_numbers:
-            if num.isalnum() and num in win_numbers:
-                check = True
-                points_pow += 1
-        dict_wins[i] = [points_pow+1, 1]
-        if check:
-            total_wins += 2**points_pow
-
-    for key, value in dict_wins.items():
-        for key2 in range(key + 1, key + 1 + value[0]):
-            if key2 in dict_wins:
-                dict_wins[key2][1] += value[1]
-        total_cards += value[1]
-
-    return total_wins, total_cards
+    Parameters:
+        text (str or bytes-like): Raw content of the puzzle input, e.g. the
+            buffer of a reader.MappedInput.
+
+    Returns:
+        List[List[str]]: For each card, the winning numbers and the numbers you have.
+    """
+    return [parse_card(reader.text(x)) for x in reader.lines(text)]
+
+def parse_card(line):
+    """
+    Split a card line into its winning numbers and the numbers you have.
+
+    Parameters:
+        line (str): The card, e.g. 'Card 1: 41 48 | 83 86 6'.
+
+    Returns:
+        List[str]: The winning numbers and the numbers you have.
+    """
+    # Special split for Day4
+    return line.split(':')[1].split("|")
+
+def parse_stream(stream):
+    """
+    Read the cards of a file object one at a time.
+
+    Parameters:
+        stream (file): Text or binary file object holding the puzzle input,
+            e.g. sys.stdin.
+
+    Returns:
+        Iterator[List[str]]: For each card, the winning numbers and the
+            numbers you have. The parts fold them as they come, in constant
+            memory.
+    """
+    return map(parse_card, reader.stream_lines(stream))
+
+def part1(card_lines):
+    """
+    Total points won by the scratchcards.
+    """
+    return map_red_lines(card_lines, card_points, operator.add, 0)
+
+def part2(card_lines):
+    """
+    Total number of scratchcards won.
+    """
+    return cards_won(map_lines(card_lines, card_matches))
 
 #Solution
 if __name__ == "__main__":
@@ -50,11 +151,7 @@ if __name__ == "__main__":
     FILE = "day4.txt"
 
     with open(path + '/' + FILE, encoding = 'utf-8') as f:
-        lines = f.read().strip()
-        lines = lines.split('\n')
-
-    # Special split for Day4
-    lines = [x.split(':')[1].split("|") for x in lines]
+        lines = parse_input(f.read())
 
     start_time = time.time()
     solution = scratchcards(lines)
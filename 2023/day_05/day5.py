@@ -2,16 +2,86 @@
 This module contains the solution to the Day 5 Advent of Code challenge.
 """
 import os
+import sys
 import time
 
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.records import Record, column
+
+class RangeMap(Record):
+    """
+    Ranges of a category map, as columns of integers.
+
+    Attributes:
+    dests (array): First destination number of every range.
+    starts (array): First source number of every range.
+    lengths (array): Length of every range.
+    """
+    __slots__ = ("dests", "starts", "lengths")
+
+    @classmethod
+    def from_lines(cls, lines):
+        """
+        Reads the ranges of a map from its "destination start length" lines.
+        """
+        dests, starts, lengths = column(), column(), column()
+        for line in lines:
+            dest, start, rang = map(int, line.split())
+            dests.append(dest)
+            starts.append(start)
+            lengths.append(rang)
+        return cls(dests, starts, lengths)
+
+    def convert(self, number):
+        """
+        Maps a number through the first range holding it.
+
+        Returns:
+        int: The destination number, or the number itself outside the ranges.
+        """
+        starts, lengths = self.starts, self.lengths
+        for i in range(len(starts)):
+            start = starts[i]
+            if start <= number < start + lengths[i]:
+                return self.dests[i] + (number - start)
+        return number
+
+    def overlap(self, first, end):
+        """
+        Finds the first range overlapping the interval [first, end).
+
+        Returns:
+        tuple: The start and the end of the overlap and the shift from the
+        sources to the destinations of the range, or None if no range overlaps.
+        """
+        starts, lengths = self.starts, self.lengths
+        for i in range(len(starts)):
+            start = starts[i]
+            ost = max(first, start)
+            oe = min(end, start + lengths[i])
+            if ost < oe:
+                return ost, oe, self.dests[i] - start
+        return None
+
+    def __iter__(self):
+        # (destination, start, length) tuples
+        return zip(self.dests, self.starts, self.lengths)
+
+    def __len__(self):
+        return len(self.dests)
+
 def lowest_location(seeds,dict_maps):
     """
     Calculates the lowest location among the locations of all seeds.
 
     Parameters:
         seeds (List[int]): List of seed numbers.
-        dict_maps (dict): Dictionary mapping categories to lists of lists. 
-                          Each list contains (destination, start, range).
+        dict_maps (dict): Dictionary mapping categories to their RangeMap.
 
     Returns:
         int: The lowest location found.
@@ -19,14 +89,8 @@ def lowest_location(seeds,dict_maps):
     min_dest = float('inf')
     for seed in seeds:
         seed_input = seed
-        for _, list_value in dict_maps.items():
-            for value in list_value:
-                dest = int(value[0])
-                start = int(value[1])
-                rang = int(value[2])
-                if start <= seed_input < start + rang:
-                    seed_input = dest + (seed_input - start)
-                    break
+        for list_value in dict_maps.values():
+            seed_input = list_value.convert(seed_input)
         min_dest = min(min_dest, seed_input)
     return min_dest
 
@@ -36,8 +100,7 @@ def lowest_location_2(seed_ranges, dict_maps, list_maps):
 
     Parameters:
         seeds (List[int, int]): List of seed ranges.
-        dict_maps (dict): Dictionary mapping categories to lists of lists. 
-                          Each list contains (destination, start, range).
+        dict_maps (dict): Dictionary mapping categories to their RangeMap.
         list_maps (List[strings]): List with the names of the dict_maps keys to iterate
 
     Returns:
@@ -49,22 +112,68 @@ def lowest_location_2(seed_ranges, dict_maps, list_maps):
         outputs = []
         while len(seeds) > 0:
             s,e = seeds.pop()
-            for dest, start, rang in list_values:
-                dest, start, rang = int(dest), int(start), int(rang)
-                ost = max(s, start)
-                oe = min(e, start + rang)
-                if ost < oe:
-                    outputs.append((ost - start + dest, oe - start + dest))
-                    if ost>s:
-                        seeds.append((s,ost))
-                    if e>oe:
-                        seeds.append((oe,e))
-                    break
-            else:
+            found = list_values.overlap(s, e)
+            if found is None:
                 outputs.append((s,e))
+                continue
+            ost, oe, shift = found
+            outputs.append((ost + shift, oe + shift))
+            if ost>s:
+                seeds.append((s,ost))
+            if e>oe:
+                seeds.append((oe,e))
         seeds = outputs
     return min(seeds)[0]
 
+LIST_MAPS = [
+    "seed-to-soil map",
+    "soil-to-fertilizer map",
+    "fertilizer-to-water map",
+    "water-to-light map",
+    "light-to-temperature map",
+    "temperature-to-humidity map",
+    "humidity-to-location map"
+]
+
+def parse_input(text):
+    """
+    Parses the almanac into the seed numbers and the category maps.
+
+    Parameters:
+        text (str or bytes-like): Raw content of the puzzle input, e.g. the
+                                  buffer of a reader.MappedInput.
+
+    Returns:
+        Tuple[List[int], dict]: The seed numbers and the dictionary mapping
+                                categories to their RangeMap.
+    """
+    blocks = reader.blocks(text)
+
+    seeds = reader.text(next(blocks)).split(": ")[1].split(" ")
+    seeds = [int(x) for x in seeds]
+
+    dict_maps = {}
+    for block in blocks:
+        name, ranges = reader.text(block).split(":", 1)
+        dict_maps[name] = RangeMap.from_lines(reader.lines(ranges))
+    return seeds, dict_maps
+
+def part1(almanac):
+    """
+    Lowest location number of the listed seeds.
+    """
+    seeds, dict_maps = almanac
+    return lowest_location(seeds, dict_maps)
+
+def part2(almanac):
+    """
+    Lowest location number of the seed ranges.
+    """
+    seeds, dict_maps = almanac
+    seed_ranges = [(seeds[i],seeds[i] + seeds[i+1])
+                   for i in range(0,len(seeds),2)]
+    return lowest_location_2(seed_ranges, dict_maps, LIST_MAPS)
+
 #Solution
 if __name__ == "__main__":
 
@@ -73,36 +182,12 @@ if __name__ == "__main__":
     FILE = "day5.txt"
 
     with open(path + '/' + FILE, encoding = 'utf-8') as f:
-        lines = f.read().strip()
-        lines = lines.split('\n\n')
-
-    seeds_input = lines[0].split(": ")[1].split(" ")
-    seeds_input = [int(x) for x in seeds_input]
-
-    dict_maps_input = {}
-    for i in range(1,len(lines)):
-        parts = lines[i].split(":\n")
-        dict_maps_input[parts[0]] = [x.split(" ") for x in lines[i].split(":\n")[1].split("\n")]
-
-    seed_ranges_input = [(seeds_input[i],seeds_input[i] + seeds_input[i+1])
-                         for i in range(0,len(seeds_input),2)]
-
-    list_maps_input = [
-        "seed-to-soil map",
-        "soil-to-fertilizer map",
-        "fertilizer-to-water map",
-        "water-to-light map",
-        "light-to-temperature map",
-        "temperature-to-humidity map",
-        "humidity-to-location map"
-    ]
+        almanac_input = parse_input(f.read())
+
     start_time = time.time()
     #Part 1
-    print("Solution part 1: ", lowest_location(seeds_input,
-                                               dict_maps_input))
+    print("Solution part 1: ", part1(almanac_input))
     #Part 2
-    print("Solution part 2: ", lowest_location_2(seed_ranges_input,
-                                                 dict_maps_input,
-                                                 list_maps_input))
+    print("Solution part 2: ", part2(almanac_input))
     end_time = time.time()
     print(f"Execution time: {end_time - start_time} seconds")
@@ -2,8 +2,16 @@
 This module contains the solution to the Day 6 Advent of Code challenge.
 """
 import os
+import sys
 import time
 
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+
 def possibilities(time_p, distance):
     """
     Calculates the number of possible ways to cover a given distance
@@ -43,27 +51,56 @@ def solution(list_times, list_distances):
         pos_total *= possibilities(list_times[i], list_distances[i])
     return pos_total
 
-#Solution
-if __name__ == "__main__":
+def parse_input(text):
+    """
+    Parses the race records, both as separate races and as a single race
+    (ignoring the spaces between numbers).
 
-    #Code to open the input file
-    path = os.getcwd()
-    FILE = "day6.txt"
+    Args:
+    text (str or bytes-like): Raw content of the puzzle input, e.g. the
+    buffer of a reader.MappedInput.
 
-    with open(path + '/' + FILE, encoding = 'utf-8') as f:
-        lines = f.read().strip()
-        lines = lines.split('\n')
+    Returns:
+    tuple: The list of times, the list of distances, the single time and
+    the single distance.
+    """
+    lines = [reader.text(line) for line in reader.lines(text)]
 
     times = [int(x) for x in lines[0].split(' ')[1:] if x != '']
     distances =  [int(x) for x in lines[1].split(' ')[1:] if x != '']
 
     times2 = int(lines[0].split(':')[-1].replace(" ",""))
     distances2 =  int(lines[1].split(':')[-1].replace(" ",""))
+    return times, distances, times2, distances2
+
+def part1(races):
+    """
+    Product of the number of ways to win each race.
+    """
+    times, distances, _, _ = races
+    return solution(times, distances)
+
+def part2(races):
+    """
+    Number of ways to win the single long race.
+    """
+    _, _, times2, distances2 = races
+    return solution([times2], [distances2])
+
+#Solution
+if __name__ == "__main__":
+
+    #Code to open the input file
+    path = os.getcwd()
+    FILE = "day6.txt"
+
+    with open(path + '/' + FILE, encoding = 'utf-8') as f:
+        races_input = parse_input(f.read())
 
     start_time = time.time()
     #Part 1
-    print("Solution part 1: ", solution(times, distances))
+    print("Solution part 1: ", part1(races_input))
     #Part 2
-    print("Solution part 2: ", solution([times2],[distances2]))
+    print("Solution part 2: ", part2(races_input))
     end_time = time.time()
     print(f"Execution time: {end_time - start_time} seconds")
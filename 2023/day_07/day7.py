@@ -2,21 +2,60 @@
 This module contains the solution to the Day 7 Advent of Code challenge.
 """
 import os
+import sys
 import time
 from collections import Counter
+from functools import partial
 import math
 
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.mapreduce import map_lines
+from aoc2023.records import Record, column
+
+HAND = 5
+# Base of the card values in a hand strength, above the largest ORDER_DICT_2 value
+CARD_BASE = 14
+
+class Hands(Record):
+    """
+    Hands of the game and their bids, as columns.
+
+    Attributes:
+    cards (str): The hands, HAND cards each, one after the other.
+    bids (array): The bid of every hand.
+    """
+    __slots__ = ("cards", "bids")
+
+    def hand(self, index):
+        """
+        Returns:
+        str: The cards of the hand at the given index.
+        """
+        return self.cards[index * HAND:(index + 1) * HAND]
+
+    def __iter__(self):
+        # (hand, bid) tuples
+        return ((self.hand(index), bid) for index, bid in enumerate(self.bids))
+
+    def __len__(self):
+        return len(self.bids)
+
 def classifier(hand):
     """
     Classifies a hand of cards into a rank based on the frequency of card values.
 
     Args:
-    hand (tuple): A tuple containing the hand string and an associated value.
+    hand (str): The hand string.
 
     Returns:
-    tuple: A tuple containing the original hand string, its rank, and the associated value.
+    int: The rank of the hand, 0 for the strongest type.
     """
-    hand_split = list(hand[0])
+    hand_split = list(hand)
     hand_dict = Counter(hand_split)
     num = math.prod(hand_dict.values())
     if num == 5:
@@ -34,30 +73,23 @@ def classifier(hand):
         rank = 5
     else:
         rank = 6
-    return (hand[0], rank, hand[1])
+    return rank
 
 def classifier2(hand):
-    """#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-Created on Sat Jun 15 03:04:14 2024
-
-@author: auro
-"""
-
+    """
     Classifies a hand of cards into a rank based on the frequency of card values,
     accounting for 'J' as a wildcard.
 
     Args:
-    hand (tuple): A tuple containing the hand string and an associated value.
+    hand (str): The hand string.
 
     Returns:
-    tuple: A tuple containing the original hand string, its rank, and the associated value.
+    int: The rank of the hand, 0 for the strongest type.
     """
-    hand_wo_j = hand[0].replace("J", "")
+    hand_wo_j = hand.replace("J", "")
     num_j = 5 - len(hand_wo_j)
     if num_j == 5:
-        hand_split = list(hand[0])
+        hand_split = list(hand)
         hand_dict = Counter(hand_split)
         num = math.prod(hand_dict.values())
     else:
@@ -81,67 +113,76 @@ Created on Sat Jun 15 03:04:14 2024
         rank = 5
     else:
         rank = 6
-    return (hand[0], rank, hand[1])
+    return rank
 
-def typer(hand1, hand2, order_dict):
+def hander(hand, order_dict):
     """
-    Compares two hands based on their ranks and uses a secondary comparison if ranks are equal.
+    Values the cards of a hand, for the secondary comparison between two
+    hands of the same rank.
 
     Args:
-    hand1 (tuple): A tuple containing a hand string, its rank, and an associated value.
-    hand2 (tuple): A tuple containing a hand string, its rank, and an associated value.
+    hand (str): A hand string.
     order_dict (dict): A dictionary defining the order of card values.
 
     Returns:
-    bool: True if hand1 is ranked higher or equal to hand2, False otherwise.
+    int: The card values as the digits of a number in base CARD_BASE, the
+    first card being the most significant; the lower, the stronger.
     """
-    if hand1[1] < hand2[1]:
-        return True
-    if hand1[1] > hand2[1]:
-        return False
-    return hander(hand1, hand2, order_dict)
+    value = 0
+    for card in hand:
+        value = value * CARD_BASE + order_dict[card]
+    return value
 
-def hander(hand1, hand2, order_dict):
+def strength_at(cards, classifier_func, order_dict, index):
     """
-    Performs a secondary comparison between two hands based on card values.
+    Classifies the hand at an index of the cards column.
 
     Args:
-    hand1 (tuple): A tuple containing a hand string, its rank, and an associated value.
-    hand2 (tuple): A tuple containing a hand string, its rank, and an associated value.
+    cards (str): The cards column of the Hands.
+    classifier_func (function): A function to classify a hand string.
     order_dict (dict): A dictionary defining the order of card values.
+    index (int): The index of the hand.
 
     Returns:
-    bool: True if hand1 is ranked higher or equal to hand2 based on card values, False otherwise.
+    int: The strength of the hand: its rank, then its card values as
+    computed by hander. The lower, the stronger.
     """
-    hand1 = hand1[0]
-    hand2 = hand2[0]
-    length = len(hand1)
-    for i in range(length):
-        if order_dict[hand1[i]] == order_dict[hand2[i]]:
-            continue
-        if order_dict[hand1[i]] < order_dict[hand2[i]]:
-            return True
-        return False
-    return False
+    hand = cards[index * HAND:(index + 1) * HAND]
+    return classifier_func(hand) * CARD_BASE ** HAND + hander(hand, order_dict)
 
-def quicksort(lista, order_dict):
+def typer(hand1, hand2, strengths):
+    """
+    Compares two hands based on their ranks and, when they are equal, their card values.
+
+    Args:
+    hand1 (int): The index of a hand.
+    hand2 (int): The index of another hand.
+    strengths (array): The strength of every hand, as computed by strength_at.
+
+    Returns:
+    bool: True if hand1 is ranked higher than hand2, False otherwise.
+    """
+    return strengths[hand1] < strengths[hand2]
+
+def quicksort(lista, strengths):
     """
     Sorts a list of hands using the quicksort algorithm based on their ranks and card values.
+    The hands equal to the pivot are kept next to it, in their input order.
 
     Args:
-    lista (list): A list of tuples, each containing a hand string, its rank,
-    and an associated value.
-    order_dict (dict): A dictionary defining the order of card values.
+    lista (list): A list of hand indices.
+    strengths (array): The strength of every hand, as computed by strength_at.
 
     Returns:
-    list: A sorted list of hands.
+    list: The sorted hand indices.
     """
     if len(lista) < 2:
         return lista
     pivot = lista[0]
-    left = [x for x in lista if typer(pivot, x, order_dict)]
-    right = [x for x in lista if typer(x, pivot, order_dict)]
-    return quicksort(left, order_dict) + [pivot] + quicksort(right, order_dict)
+    left = [x for x in lista if typer(pivot, x, strengths)]
+    right = [x for x in lista if typer(x, pivot, strengths)]
+    equal = [x for x in lista if strengths[x] == strengths[pivot]]
+    return quicksort(left, strengths) + equal + quicksort(right, strengths)
 
 def solution(card_bids, order_dict, classifier_func):
     """
@@ -149,22 +190,84 @@ def solution(card_bids, order_dict, classifier_func):
     based on their positions.
 
     Args:
-    card_bids (list): A list of tuples, each containing a hand string and an associated value.
+    card_bids (Hands): The hands and their bids.
     order_dict (dict): A dictionary defining the order of card values.
-    classifier_func (function): A function to classify each hand.
+    classifier_func (function): A function to classify a hand string.
 
     Returns:
     int: The total score calculated based on the sorted positions of the card bids.
     """
-    tuples = []
-    for hand in card_bids:
-        tuples.append(classifier_func(hand))
-    sorted_tuples = quicksort(tuples, order_dict)
+    # The hands are classified and sorted by index, straight from the columns
+    indices = range(len(card_bids))
+    strengths = column(map_lines(indices, partial(strength_at, card_bids.cards,
+                                                  classifier_func, order_dict)))
+    sorted_indices = quicksort(list(indices), strengths)
+    bids = card_bids.bids
     ans = 0
-    for i, hand in enumerate(sorted_tuples):
-        ans += (i + 1) * hand[2]
+    for i, index in enumerate(sorted_indices):
+        ans += (i + 1) * bids[index]
     return ans
 
+ORDER_DICT = {'A': 0,
+         'K': 1,
+         'Q': 2,
+         'J': 3,
+         'T': 4,
+         '9': 5,
+         '8': 6,
+         '7': 7,
+         '6': 8,
+         '5': 9,
+         '4': 10,
+         '3': 11,
+         '2': 12}
+
+ORDER_DICT_2 ={'A': 0,
+         'K': 1,
+         'Q': 2,
+         'T': 4,
+         '9': 5,
+         '8': 6,
+         '7': 7,
+         '6': 8,
+         '5': 9,
+         '4': 10,
+         '3': 11,
+         '2': 12,
+         'J': 13}
+
+def parse_input(text):
+    """
+    Parses the puzzle input into the hands and their bids.
+
+    Args:
+    text (str or bytes-like): Raw content of the puzzle input, e.g. the
+    buffer of a reader.MappedInput.
+
+    Returns:
+    Hands: The hand strings and their bids.
+    """
+    cards, bids = [], column()
+    for line in reader.lines(text):
+        hand, bid = reader.text(line).split(' ')
+        if len(hand) != HAND:
+            raise ValueError(f"A hand has {HAND} cards, not {hand!r}")
+        cards.append(hand)
+        bids.append(int(bid))
+    return Hands("".join(cards), bids)
+
+def part1(card_bids):
+    """
+    Total winnings of the set of hands.
+    """
+    return solution(card_bids, ORDER_DICT, classifier)
+
+def part2(card_bids):
+    """
+    Total winnings of the set of hands, with 'J' cards acting as jokers.
+    """
+    return solution(card_bids, ORDER_DICT_2, classifier2)
+
 #Solution
 if __name__ == "__main__":
 
@@ -173,43 +276,12 @@ if __name__ == "__main__":
     FILE = "day7.txt"
 
     with open(path + '/' + FILE, encoding = 'utf-8') as f:
-        lines = f.read().strip()
-        lines = lines.split('\n')
-
-    card_bids_input = [(x.split(' ')[0], int(x.split(' ')[1])) for x in lines]
-
-    order_dict_input = {'A': 0,
-             'K': 1,
-             'Q': 2,
-             'J': 3,
-             'T': 4,
-             '9': 5,
-             '8': 6,
-             '7': 7,
-             '6': 8,
-             '5': 9,
-             '4': 10,
-             '3': 11,
-             '2': 12}
-
-    order_dict_2_input ={'A': 0,
-             'K': 1,
-             'Q': 2,
-             'T': 4,
-             '9': 5,
-             '8': 6,
-             '7': 7,
-             '6': 8,
-             '5': 9,
-             '4': 10,
-             '3': 11,
-             '2': 12,
-             'J': 13}
+        card_bids_input = parse_input(f.read())
 
     start_time = time.time()
     #Part 1
-    print("Solution part 1: ", solution(card_bids_input, order_dict_input, classifier))
+    print("Solution part 1: ", part1(card_bids_input))
     #Part 2
-    print("Solution part 2: ", solution(card_bids_input, order_dict_2_input, classifier2))
+    print("Solution part 2: ", part2(card_bids_input))
     end_time = time.time()
     print(f"Execution time: {end_time - start_time} seconds")
@@ -2,10 +2,19 @@
 This module contains the solution to the Day 8 Advent of Code challenge.
 """
 import os
+import sys
 import time
-from functools import reduce
+from functools import partial, reduce
 import math
 
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.mapreduce import map_tasks
+
 def dict_constructor(nodes):
     """
     Constructs a dictionary from a list of nodes where each node is a string
@@ -22,7 +31,7 @@ def dict_constructor(nodes):
     result = {}
     for node in nodes:
         node_pos = node.split(" = ")
-        left = node_pos[1].split(', ')[0][-3:]
+        left = node_pos[1].split(', ')[0][1:]
         right = node_pos[1].split(', ')[1][:-1]
         result[node_pos[0]] = (left, right)
     return result
@@ -120,11 +129,43 @@ def solution2(dictionary, paths, starts_list):
     int: The LCM of the number of steps required to reach
     the end node 'Z' from each start node.
     """
-    start_count = []
-    for start in starts_list:
-        start_count.append(solution(dictionary, paths, start, 'Z'))
+    # The ghosts walk independently
+    start_count = map_tasks(starts_list, partial(solution, dictionary, paths, end='Z'))
     return lcm_of_list(start_count)
 
+def parse_input(text):
+    """
+    Parses the puzzle input into the instructions and the network of nodes.
+
+    Args:
+    text (str or bytes-like): Raw content of the puzzle input, e.g. the
+    buffer of a reader.MappedInput.
+
+    Returns:
+    tuple: The instructions string and the dictionary of nodes built
+    by dict_constructor.
+    """
+    blocks = reader.block_spans(text)
+
+    instructions = reader.text(reader.view(text, *next(blocks)))
+    nodes = map(reader.text, reader.lines(text, *next(blocks)))
+    return instructions, dict_constructor(nodes)
+
+def part1(network):
+    """
+    Number of steps required to go from 'AAA' to 'ZZZ'.
+    """
+    instructions, maps = network
+    return solution(maps, instructions, start='AAA', end='ZZZ')
+
+def part2(network):
+    """
+    Number of steps required for every node ending with 'A' to be
+    simultaneously on a node ending with 'Z'.
+    """
+    instructions, maps = network
+    return solution2(maps, instructions, starts(maps))
+
 #Solution
 if __name__ == "__main__":
 
@@ -133,25 +174,12 @@ if __name__ == "__main__":
     FILE = "day8.txt"
 
     with open(path + '/' + FILE, encoding = 'utf-8') as f:
-        lines = f.read().strip()
-        lines = lines.split('\n\n')
-
-    instructions_input = lines[0]
-    nodes_input = list(lines[1].split("\n"))
-
-    maps_input = dict_constructor(nodes_input)
-
-    starts_list_input = starts(maps_input)
+        network_input = parse_input(f.read())
 
     start_time = time.time()
     # Part 1
-    print("Solution part 1: ", solution(maps_input,
-                                        instructions_input,
-                                        start='AAA',
-                                        end='ZZZ'))
+    print("Solution part 1: ", part1(network_input))
     # Part 2
-    print("Solution part 2: ", solution2(maps_input,
-                                         instructions_input,
-                                         starts_list_input))
+    print("Solution part 2: ", part2(network_input))
     end_time = time.time()
     print(f"Execution time: {end_time - start_time} seconds")
@@ -1,9 +1,40 @@
 """
 This module contains the solution to the Day 9 Advent of Code challenge.
 """
+import operator
 import os
+import sys
 import time
 
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.mapreduce import map_red_lines
+
+def next_value(report):
+    """
+    Computes the next logical value of a report, which is modified in place.
+
+    Args:
+    report (list): A report containing integers.
+
+    Returns:
+    int: The sum of the last elements of the successive differences.
+    """
+    values = []
+    values.append(report[-1])
+    while len(set(report)) > 1:
+        j = 0
+        while j < len(report) - 1:
+            report[j] = report[j + 1] - report[j]
+            j += 1
+        report = report[:-1]
+        values.append(report[-1])
+    return sum(values)
+
 def solution(report_list):
     """
     Processes a list of reports to compute the next logical value
@@ -22,20 +53,7 @@ def solution(report_list):
     Returns:
     int: The sum of the computed values from each report.
     """
-    ans = 0
-    for report in report_list:
-        values = []
-        values.append(report[-1])
-        while len(set(report)) > 1:
-            j = 0
-            while j < len(report) - 1:
-                report[j] = report[j + 1] - report[j]
-                j += 1
-            report = report[:-1]
-            values.append(report[-1])
-        next_value = sum(values)
-        ans += next_value
-    return ans
+    return map_red_lines(report_list, next_value, operator.add, 0)
 
 def looper(values):
     """
@@ -53,6 +71,29 @@ def looper(values):
         act = value - act
     return act
 
+def previous_value(report):
+    """
+    Computes the previous logical value of a report, which is modified in place.
+
+    Args:
+    report (list): A report containing integers.
+
+    Returns:
+    int: The value computed by looper from the first elements of the
+    successive differences.
+    """
+    values = []
+    values.append(report[0])
+    while len(set(report)) > 1:
+        j = 0
+        while j < len(report) - 1:
+            report[j] = report[j + 1] - report[j]
+            j += 1
+        report = report[:-1]
+        values.append(report[0])
+    values.reverse()
+    return looper(values)
+
 def solution2(report_list):
     """
     Processes a list of reports to compute a sum of values derived from each report.
@@ -68,22 +109,59 @@ def solution2(report_list):
     Returns:
     int: The sum of the computed values from each report.
     """
-    ans = 0
-    for report in report_list:
-        values = []
-        values.append(report[0])
-        while len(set(report)) > 1:
-            j = 0
-            while j < len(report) - 1:
-                report[j] = report[j + 1] - report[j]
-                j += 1
-            report = report[:-1]
-            values.append(report[0])
-        values.reverse()
-        next_value = looper(values)
-        ans += next_value
-    return ans
+    return map_red_lines(report_list, previous_value, operator.add, 0)
+
+
+def parse_input(text):
+    """
+    Parses the puzzle input into a list of reports.
 
+    Args:
+    text (str or bytes-like): Raw content of the puzzle input, e.g. the
+    buffer of a reader.MappedInput.
+
+    Returns:
+    list: A list of lists, where each inner list is a report containing integers.
+    """
+    return [parse_report(reader.text(x)) for x in reader.lines(text)]
+
+def parse_report(line):
+    """
+    Parses one line of the puzzle input into a report.
+
+    Args:
+    line (str): The values of the report, separated by spaces.
+
+    Returns:
+    list: The report, a list of integers.
+    """
+    return [int(x) for x in line.split(" ")]
+
+def parse_stream(stream):
+    """
+    Reads the reports of a file object one at a time.
+
+    Args:
+    stream (file): Text or binary file object holding the puzzle input,
+    e.g. sys.stdin.
+
+    Returns:
+    iterator: The reports, lists of integers. The parts fold them as they
+    come, in constant memory.
+    """
+    return map(parse_report, reader.stream_lines(stream))
+
+def part1(report_list):
+    """
+    Sum of the next values of every report. The reports may be modified in place.
+    """
+    return solution(report_list)
+
+def part2(report_list):
+    """
+    Sum of the previous values of every report. The reports may be modified in place.
+    """
+    return solution2(report_list)
 
 #Solution
 if __name__ == "__main__":
@@ -93,18 +171,12 @@ if __name__ == "__main__":
     FILE = "day9.txt"
 
     with open(path + '/' + FILE, encoding = 'utf-8') as f:
-        lines = f.read().strip()
-        lines = lines.split('\n')
-
-    reports_input = [x.split(" ") for x in lines]
-    reports_input = [[int(x) for x in report] for report in reports_input]
+        text_input = f.read()
 
     start_time = time.time()
     # Part 1
-    print("Solution part 1: ", solution(reports_input))
+    print("Solution part 1: ", part1(parse_input(text_input)))
     # Part 2
-    reports_2_input = [x.split(" ") for x in lines]
-    reports_2_input = [[int(x) for x in report] for report in reports_2_input]
-    print("Solution part 2: ", solution2(reports_2_input))
+    print("Solution part 2: ", part2(parse_input(text_input)))
     end_time = time.time()
     print(f"Execution time: {end_time - start_time} seconds")
@@ -2,25 +2,32 @@
 This module contains the solution to the Day 10 Advent of Code challenge.
 """
 import os
+import sys
 import time
 from collections import namedtuple
 
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023 import geometry
+from aoc2023.grid import Grid
+
 def find_start(pipes):
     """
     Finds the starting position 'S' in a grid of pipes.
 
     Args:
-    pipes (list): A list of strings where each string represents a row of pipes in the grid.
+    pipes (Grid): The grid of pipes, with a border of '.'.
 
     Returns:
-    tuple: A tuple (i, j) representing the coordinates of the start position 'S'.
+    int: The index of the start position 'S' in the grid.
     None: If 'S' is not found in the grid.
     """
-    for i, pipe in enumerate(pipes):
-        for j, char in enumerate(pipe):
-            if char == "S":
-                return (i, j)
-    return None
+    index = pipes.find("S")
+    return None if index == -1 else index
 
 def determiner(pipes, position, directions, coords):
     """
@@ -29,21 +36,20 @@ def determiner(pipes, position, directions, coords):
     Updates the 'coords' dict with the found 'S' coordinates.
 
     Args:
-    pipes (list): A list of strings where each string represents a row of pipes in the grid.
-    position (tuple): A tuple (x, y) representing the current position in the grid.
-    directions (list): A list of direction vectors.
-    coords (dict): A dictionary mapping pipe symbols to their connection coordinates.
+    pipes (Grid): The grid of pipes, with a border of '.'.
+    position (int): The index of the current position in the grid.
+    directions (tuple): The offsets of the north, east, south and west neighbours.
+    coords (dict): A dictionary mapping pipe symbols (as bytes) to their connection coordinates.
 
     Returns:
     list: A list of possible pipe connections from the current position.
     """
-    x, y = position
-    candidates = [[x+dx, y+dy] for [dx, dy] in directions]
+    candidates = [position + offset for offset in directions]
     pipe_coords = []
     for i in range(4):
-        symbol = pipes[candidates[i][0]][candidates[i][1]]
+        symbol = pipes.cells[candidates[i]]
         pipe_coords.append(coords[symbol][(i+2)%4])
-    coords['S'] = pipe_coords
+    coords[START] = pipe_coords
     return pipe_coords
 
 def solution(args):
@@ -53,27 +59,28 @@ def solution(args):
 
     Args:
     args (Args): A namedtuple containing the following:
-        pipes (list): A list of strings where each string represents a row of pipes in the grid.
-        position (tuple): A tuple (x, y) representing the starting position in the grid.
-        directions (list): A list of direction vectors.
-        coords (dict): A dictionary mapping pipe symbols to their connection coordinates.
-        visited (set): A set of visited positions.
-        vertices (list): A list of vertices of special pipes.
+        pipes (Grid): The grid of pipes, with a border of '.'.
+        position (int): The index of the starting position in the grid.
+        directions (tuple): The offsets of the north, east, south and west neighbours.
+        coords (dict): A dictionary mapping pipe symbols (as bytes) to their connection coordinates.
+        visited (set): A set of visited indices.
+        vertices (list): A list of the (x, y) vertices of special pipes.
 
     Returns:
-    tuple: A tuple containing the updated set of visited positions, the list of vertices,
+    tuple: A tuple containing the updated set of visited indices, the list of vertices,
     and the distance to the furthest pipe from the starting pipe 'S'.
     """
     count = 0
+    cells = args.pipes.cells
     current_pipe = args.position
     while current_pipe not in args.visited:
         args.visited.add(current_pipe)
-        candidates = [(current_pipe[0] + dx, current_pipe[1] + dy) for [dx, dy] in args.directions]
-        symbol_current = args.pipes[current_pipe[0]][current_pipe[1]]
-        if symbol_current in ['L', 'J', 'F', '7']:
-            args.vertices.append(current_pipe)
+        candidates = [current_pipe + offset for offset in args.directions]
+        symbol_current = cells[current_pipe]
+        if symbol_current in CORNERS:
+            args.vertices.append(args.pipes.position(current_pipe))
         for i in range(4):
-            symbol_cand = args.pipes[candidates[i][0]][candidates[i][1]]
+            symbol_cand = cells[candidates[i]]
             if (args.coords[symbol_cand][(i + 2) % 4] + args.coords[symbol_current][i] == 2 and
                 candidates[i] not in args.visited):
                 current_pipe = candidates[i]
@@ -86,103 +93,79 @@ def create_file_with_loop_data(pipes, visited):
     Creates a file with a visual representation of the visited nodes in the pipe grid.
 
     Args:
-    pipes (list): A list of strings where each string represents a row of pipes in the grid.
-    visited (set): A set of visited positions.
+    pipes (Grid): The grid of pipes.
+    visited (set): A set of visited indices.
 
     Writes:
     A file 'out.txt' with 'x' marking visited nodes and ' ' marking unvisited nodes.
     """
     with open('out.txt', 'w', encoding='utf-8') as file:
-        for i in range(len(pipes)):
+        for i in range(pipes.height):
             line = ""
-            for j in range(len(pipes[0])):
-                if (i, j) in visited:
+            for j in range(pipes.width):
+                if pipes.index(i, j) in visited:
                     line += "x"
                 else:
                     line += ' '
             file.write(line + "\n")
 
-def shoelace(vertices):
+# coordinates = [N,E,S,W]
+MAP_COORDS = {
+    '|': [1,0,1,0],
+    '-': [0,1,0,1],
+    'L': [1,1,0,0],
+    'J': [1,0,0,1],
+    '7': [0,0,1,1],
+    'F': [0,1,1,0],
+    '.': [0,0,0,0]
+    }
+
+DIRECTIONS = [[-1,0],[0,1],[1,0],[0,-1]]
+
+START = ord('S')
+CORNERS = b"LJF7"
+
+Args = namedtuple('Args', ['pipes', 'position', 'directions', 'coords', 'visited', 'vertices'])
+
+def parse_input(text):
     """
-    Calculates the area of a polygon using the shoelace formula.
+    Parses the puzzle input into a grid of pipes.
 
     Args:
-    vertices (list): A list of tuples representing the vertices of the polygon.
+    text (str or bytes-like): Raw content of the puzzle input, e.g. the
+    buffer of a reader.MappedInput.
 
     Returns:
-    float: The area of the polygon.
+    Grid: The grid of pipes, with a border of '.' (ground) around it.
     """
-    area_pol = 0
-    i = 0
-    while i < len(vertices):
-        x_i = vertices[i][0]
-        y_i1 = vertices[(i+1) % len(vertices)][1]
-        y_1i = vertices[(i-1) % len(vertices)][1]
-        area_pol += x_i * (y_i1 - y_1i)
-        i += 1
-    return 0.5 * abs(area_pol)
+    return Grid.from_lines(reader.lines(text), border='.')
 
-def pick_theorem(area_pol, boundary_points):
+def main_loop(pipes):
     """
-    Calculates the number of interior points of a polygon using Pick's theorem.
+    Finds the main loop of the pipe grid, starting from the pipe 'S'.
 
     Args:
-    area_pol (float): The area of the polygon.
-    boundary_points (int): The number of boundary points on the polygon.
+    pipes (Grid): The grid of pipes, with a border of '.'.
 
     Returns:
-    int: The number of interior points of the polygon.
+    tuple: A tuple containing the set of visited indices, the list of vertices
+    (including 'S' when it is a corner) and the distance to the furthest pipe.
     """
-    interior_points = area_pol - (boundary_points / 2) + 1
-    return int(interior_points)
-
-
-#Solution
-if __name__ == "__main__":
-
-    #Code to open the input file
-    path = os.getcwd()
-    FILE = "day10.txt"
-
-    with open(path + '/' + FILE, encoding = 'utf-8') as f:
-        lines = f.read().strip()
-        lines = lines.split('\n')
+    map_coords = {ord(symbol): value for symbol, value in MAP_COORDS.items()}
+    directions = tuple(pipes.offset(dx, dy) for dx, dy in DIRECTIONS)
+    s = find_start(pipes)
 
-    pipes_input = [list(line) for line in lines]
-
-    # coordinates = [N,E,S,W]
-    map_coords = {
-        '|': [1,0,1,0],
-        '-': [0,1,0,1],
-        'L': [1,1,0,0],
-        'J': [1,0,0,1],
-        '7': [0,0,1,1],
-        'F': [0,1,1,0],
-        '.': [0,0,0,0]
-        }
-
-    directions_input  = [[-1,0],[0,1],[1,0],[0,-1]]
-
-    s = find_start(pipes_input)
-
-    coords_s = determiner(pipes = pipes_input,
+    coords_s = determiner(pipes = pipes,
                           position = s,
-                          directions=directions_input,
+                          directions=directions,
                           coords = map_coords)
 
-    visited_input = set()
-    vertices_input = []
-
-    start_time = time.time()
-
-    Args = namedtuple('Args', ['pipes', 'position', 'directions', 'coords', 'visited', 'vertices'])
-
-    args_input = Args(pipes=pipes_input,
+    args_input = Args(pipes=pipes,
                 position=s,
-                directions=directions_input,
+                directions=directions,
                 coords=map_coords,
-                visited=visited_input,
-                vertices=vertices_input)
+                visited=set(),
+                vertices=[])
 
     visited_output, vertices_output, furthest = solution(args_input)
 
@@ -190,15 +173,43 @@ if __name__ == "__main__":
                     [1,0,0,1],
                     [0,0,1,1],
                     [0,1,1,0]]:
-        vertices_output.append(s)
+        vertices_output.append(pipes.position(s))
+    return visited_output, vertices_output, furthest
+
+def part1(pipes):
+    """
+    Number of steps to the furthest point of the loop from the starting position.
+    """
+    return main_loop(pipes)[2]
+
+def part2(pipes):
+    """
+    Number of tiles enclosed by the loop.
+    """
+    visited_output, vertices_output, _ = main_loop(pipes)
+    area = geometry.twice_area(vertices_output)
+    return geometry.interior_points(area, len(visited_output))
+
+#Solution
+if __name__ == "__main__":
+
+    #Code to open the input file
+    path = os.getcwd()
+    FILE = "day10.txt"
+
+    with open(path + '/' + FILE, encoding = 'utf-8') as f:
+        pipes_input = parse_input(f.read())
+
+    start_time = time.time()
 
-    area = shoelace(vertices_output)
+    visited_main, vertices_main, furthest_main = main_loop(pipes_input)
+    area_main = geometry.twice_area(vertices_main)
 
-    #create_file_with_loop_data(pipes=pipes, visited=visited)
+    #create_file_with_loop_data(pipes=pipes_input, visited=visited_main)
 
     # Part 1
-    print("Solution part 1: ", furthest)
+    print("Solution part 1: ", furthest_main)
     # Part 2
-    print("Solution part 2: ", pick_theorem(area,len(visited_output)))
+    print("Solution part 2: ", geometry.interior_points(area_main, len(visited_main)))
     end_time = time.time()
     print(f"Execution time: {end_time - start_time} seconds")
@@ -2,16 +2,24 @@
 This module contains the solution to the Day 11 Advent of Code challenge.
 """
 import os
+import sys
 import time
 
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.grid import Grid
+
 def galaxier(universe, rows, columns):
     """
     Identifies galaxies in the universe and removes rows and columns
     without them from the lists.
 
     Args:
-    universe (list of list of str): A 2D list representing the universe,
-    where each element is either '.' or '#'.
+    universe (Grid): The universe, where each cell is either '.' or '#'.
     rows (list of int): A list of row indices.
     columns (list of int): A list of column indices.
 
@@ -20,15 +28,15 @@ def galaxier(universe, rows, columns):
     of a galaxy in the universe.
     """
     galaxies = []
-    length =  len(universe)
-    for i in range(length):
-        for j in range(len(universe[0])):
-            if universe[i][j] == "#":
-                galaxies.append((i, j))
-                if i in rows:
-                    rows.remove(i)
-                if j in columns:
-                    columns.remove(j)
+    index = universe.find("#")
+    while index != -1:
+        i, j = universe.position(index)
+        galaxies.append((i, j))
+        if i in rows:
+            rows.remove(i)
+        if j in columns:
+            columns.remove(j)
+        index = universe.find("#", index + 1)
     return galaxies
 
 def distancer(galaxies, rows, cols, expansion):
@@ -64,6 +72,52 @@ def distancer(galaxies, rows, cols, expansion):
             distances.append(dist)
     return sum(distances)
 
+EXPANSION_INPUT_1 = 1
+EXPANSION_INPUT_2 = 999999
+
+def parse_input(text):
+    """
+    Parses the puzzle input into the image of the universe.
+
+    Args:
+    text (str or bytes-like): Raw content of the puzzle input, e.g. the
+    buffer of a reader.MappedInput.
+
+    Returns:
+    Grid: The universe.
+    """
+    return Grid.from_lines(reader.lines(text))
+
+def expanded_distances(universe, expansion):
+    """
+    Sum of the shortest paths between every pair of galaxies once the empty
+    rows and columns have been expanded.
+
+    Args:
+    universe (Grid): The universe.
+    expansion (int): The expansion distance added by each empty row and column.
+
+    Returns:
+    int: The sum of the distances between every pair of galaxies.
+    """
+    rows = set(range(0, universe.height))
+    cols = set(range(0, universe.width))
+    galaxies = galaxier(universe, rows, cols)
+    return distancer(galaxies, rows, cols, expansion)
+
+def part1(universe):
+    """
+    Sum of the distances between galaxies, with empty rows and columns doubled.
+    """
+    return expanded_distances(universe, EXPANSION_INPUT_1)
+
+def part2(universe):
+    """
+    Sum of the distances between galaxies, with empty rows and columns
+    a million times larger.
+    """
+    return expanded_distances(universe, EXPANSION_INPUT_2)
+
 #Solution
 if __name__ == "__main__":
 
@@ -72,29 +126,12 @@ if __name__ == "__main__":
     FILE = "day11.txt"
 
     with open(path + '/' + FILE, encoding = 'utf-8') as f:
-        lines = f.read().strip()
-        lines = lines.split('\n')
-
-    universe_input = [list(line) for line in lines]
-
-    rows_input = set(range(0, len(universe_input)))
-    cols_input = set(range(0, len(universe_input[0])))
-
-    galaxy_output = galaxier(universe_input, rows_input, cols_input)
+        universe_input = parse_input(f.read())
 
     start_time = time.time()
     # Part 1
-    EXPANSION_INPUT_1 = 1
-    print("Solution part 1: ", distancer(galaxy_output,
-                                         rows_input,
-                                         cols_input,
-                                         EXPANSION_INPUT_1))
+    print("Solution part 1: ", part1(universe_input))
     # Part 2
-    galaxy_output = galaxier(universe_input, rows_input, cols_input)
-    EXPANSION_INPUT_2 = 999999
-    print("Solution part 2: ", distancer(galaxy_output,
-                                         rows_input,
-                                         cols_input,
-                                         EXPANSION_INPUT_2))
+    print("Solution part 2: ", part2(universe_input))
     end_time = time.time()
     print(f"Execution time: {end_time - start_time} seconds")
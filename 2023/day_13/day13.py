@@ -2,27 +2,25 @@
 This module contains the solution to the Day 13 Advent of Code challenge.
 """
 import os
+import sys
 import time
 
-def transpose_strings(strings):
-    """
-    Transposes a list of strings, treating each string as a row of characters.
-
-    Args:
-    strings (list of str): A list of strings, where each string represents a row of characters.
-
-    Returns:
-    list of str: A list of strings where each string is a column from the input, effectively 
-    transposing the original list of rows into columns.
-    """
-    return [''.join(row) for row in zip(*strings)]
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.grid import Grid
+from aoc2023.mapreduce import map_tasks
 
 def reflection(pattern):
     """
     Finds the largest reflection symmetry in a pattern (string).
 
     Args:
-    pattern (str): A string representing the pattern in which to look for symmetrical reflection.
+    pattern (sequence): The rows (or columns) of the pattern in which to look
+    for symmetrical reflection.
 
     Returns:
     int: The index of the largest reflection's center. Returns -1 if no reflection is found.
@@ -45,7 +43,7 @@ def reflection_check(pattern,i):
     edges of the pattern are reached.
 
     Args:
-    pattern (str): A string representing the pattern to be checked.
+    pattern (sequence): The rows (or columns) of the pattern to be checked.
     i (int): The index in the pattern where the reflection check should start.
 
     Returns:
@@ -59,6 +57,27 @@ def reflection_check(pattern,i):
         offset += 2
     return True
 
+def pattern_summary(pattern):
+    """
+    Score of one pattern based on its vertical or horizontal reflection line.
+
+    Args:
+    pattern (Grid): The pattern, whose rows are made of characters
+    (e.g., `"#.##..##."`).
+
+    Returns:
+    int: 100 times the number of rows above the horizontal reflection line,
+    or else the number of columns to the left of the vertical one.
+    """
+    candidate = reflection(pattern.rows(copy=True))
+    total = 100*(candidate+1)
+
+    if candidate == -1:
+        candidate = reflection(pattern.columns(copy=True))
+        total += (candidate+1)
+
+    return total
+
 def note_summary(patterns):
     """
     Summarizes the reflection properties of the patterns and calculates a score.
@@ -67,24 +86,15 @@ def note_summary(patterns):
     vertical and horizontal reflection lines.
 
     Args:
-    patterns (list of list of str): A list of patterns where each pattern is a list of strings representing 
-    rows of characters (e.g., `"#.##..##."`).
+    patterns (list of Grid): A list of patterns, whose rows are made of
+    characters (e.g., `"#.##..##."`).
 
     Returns:
     int: The total summary score, which includes the sum of the number of columns to the left of the 
     vertical reflection line and 100 multiplied by the number of rows above the horizontal reflection line.
     """
-    total  = 0
-    for pattern in patterns:
-        candidate = reflection(pattern)
-        total += 100*(candidate+1)
-
-        if candidate == -1:
-            trans_pattern = transpose_strings(pattern)
-            candidate = reflection(trans_pattern)
-            total += (candidate+1)
-
-    return total
+    # The patterns are independent
+    return sum(map_tasks(patterns, pattern_summary))
 
 
 def smudge_reflection(pattern):
@@ -92,7 +102,7 @@ def smudge_reflection(pattern):
     Finds the first reflection in the pattern that allows one smudge (minor difference).
 
     Args:
-    pattern (list of str): The list of strings representing the pattern rows.
+    pattern (sequence): The rows (or columns) of the pattern.
 
     Returns:
     int: The index of the reflection found or -1 if none is found.
@@ -108,7 +118,7 @@ def smudge_row(line1, line2):
     Compares two rows and checks if they differ by exactly one character.
 
     Args:
-    line1, line2 (str): Two strings representing rows to be compared.
+    line1, line2 (sequence): Two rows to be compared.
 
     Returns:
     bool: True if the rows differ by exactly one character, False otherwise.
@@ -121,7 +131,7 @@ def smudge_check(pattern, i):
     Checks for reflection symmetry at index `i` with at most one smudge.
 
     Args:
-    pattern (list of str): The list of strings representing the pattern rows.
+    pattern (sequence): The rows (or columns) of the pattern.
     i (int): The index at which to start checking for reflection.
 
     Returns:
@@ -143,29 +153,64 @@ def smudge_check(pattern, i):
     
     return smudge == 1
 
+def smudge_pattern_summary(pattern):
+    """
+    Score of one pattern based on its smudged reflections.
+
+    Args:
+    pattern (Grid): The pattern.
+
+    Returns:
+    int: The score based on its horizontal or vertical smudged reflection.
+    """
+    # Check horizontal reflection
+    candidate = smudge_reflection(pattern.rows(copy=True))
+    total = 100 * (candidate + 1)
+
+    # If no horizontal smudge reflection, check vertical smudge reflection 
+    if candidate == -1:
+        candidate = smudge_reflection(pattern.columns(copy=True))
+        total += (candidate + 1)
+
+    return total
+
 def smudge_note_summary(patterns):
     """
     Calculates the summary score of patterns based on smudged reflections.
 
     Args:
-    patterns (list of list of str): A list of patterns, each being a list of strings representing rows.
+    patterns (list of Grid): A list of patterns.
 
     Returns:
     int: The total score based on horizontal and vertical smudged reflections.
     """
-    total = 0
-    for pattern in patterns:
-        # Check horizontal reflection
-        candidate = smudge_reflection(pattern)
-        total += 100 * (candidate + 1)
-
-        # If no horizontal smudge reflection, check vertical smudge reflection 
-        if candidate == -1:
-            trans_pattern = transpose_strings(pattern)
-            candidate = smudge_reflection(trans_pattern)
-            total += (candidate + 1)
-    
-    return total
+    return sum(map_tasks(patterns, smudge_pattern_summary))
+
+def parse_input(text):
+    """
+    Parses the puzzle input into a list of patterns.
+
+    Args:
+    text (str or bytes-like): Raw content of the puzzle input, e.g. the
+    buffer of a reader.MappedInput.
+
+    Returns:
+    list of Grid: A list of patterns.
+    """
+    return [Grid.from_lines(reader.lines(text, start, end))
+            for start, end in reader.block_spans(text)]
+
+def part1(patterns):
+    """
+    Summary of the notes using exact reflections.
+    """
+    return note_summary(patterns)
+
+def part2(patterns):
+    """
+    Summary of the notes using reflections with exactly one smudge.
+    """
+    return smudge_note_summary(patterns)
 
 #Solution
 if __name__ == "__main__":
@@ -176,16 +221,13 @@ if __name__ == "__main__":
 
     
     with open(path + '/' + FILE, encoding = 'utf-8') as f:
-        lines = f.read().strip()
-        lines = lines.split('\n\n')
-    
-    patterns = [pattern.split('\n') for pattern in lines]
+        patterns = parse_input(f.read())
 
     start_time = time.time()
     # Part 1
-    print("Solution part 1: ", note_summary(patterns))
+    print("Solution part 1: ", part1(patterns))
     # Part 2
-    print("Solution part 2: ", smudge_note_summary(patterns))
+    print("Solution part 2: ", part2(patterns))
     end_time = time.time()
     print(f"Execution time: {end_time - start_time} seconds")
 
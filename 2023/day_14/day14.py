@@ -1,12 +1,28 @@
 import os
+import sys
 import time
 
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.grid import Grid
+
+ROUND = ord('O')
+CUBE = ord('#')
+EMPTY = ord('.')
+
+# Move of a rounded rock rolling in each direction
+ROLLS = {'north': (-1, 0), 'south': (1, 0), 'west': (0, -1), 'east': (0, 1)}
+
 def roll_all(grid, n, m, direction):
     """
     Rolls the objects ('O') in the grid in the specified direction, stopping at obstacles ('#').
 
     Args:
-    grid (list of list of str): The grid where the objects and obstacles are placed.
+    grid (Grid): The grid where the objects and obstacles are placed.
     n (int): The number of rows in the grid.
     m (int): The number of columns in the grid.
     direction (str): The direction in which to roll the objects. Can be 'north', 'south', 'west', or 'east'.
@@ -14,60 +30,37 @@ def roll_all(grid, n, m, direction):
     Returns:
     None: The grid is modified in place by moving the objects ('O') according to the rules.
     """
-    if direction == 'north':
-        for j in range(m):
-            empty_x = 0
-            for x in range(n):
-                if grid[x][j] == "#":
-                    empty_x = x + 1
-                elif grid[x][j] == "O":
-                    if empty_x != x:
-                        grid[empty_x][j] = "O"
-                        grid[x][j] = '.'
-                    empty_x += 1
-
-    elif direction == 'south':
-        for j in range(m):
-            empty_x = n - 1
-            for x in range(n - 1, -1, -1):
-                if grid[x][j] == "#":
-                    empty_x = x - 1
-                elif grid[x][j] == "O":
-                    if empty_x != x:
-                        grid[empty_x][j] = "O"
-                        grid[x][j] = '.'
-                    empty_x -= 1
-
-    elif direction == 'west':
-        for i in range(n):
-            empty_y = 0
-            for y in range(m):
-                if grid[i][y] == "#":
-                    empty_y = y + 1
-                elif grid[i][y] == "O":
-                    if empty_y != y:
-                        grid[i][empty_y] = "O"
-                        grid[i][y] = '.'
-                    empty_y += 1
-
-    elif direction == 'east':
-        for i in range(n):
-            empty_y = m - 1
-            for y in range(m - 1, -1, -1):
-                if grid[i][y] == "#":
-                    empty_y = y - 1
-                elif grid[i][y] == "O":
-                    if empty_y != y:
-                        grid[i][empty_y] = "O"
-                        grid[i][y] = '.'
-                    empty_y -= 1
+    dx, dy = ROLLS[direction]
+    step = grid.offset(dx, dy)
+    # Every line is scanned from the edge the objects roll to
+    if dx:
+        edge = 0 if dx < 0 else n - 1
+        starts = [grid.index(edge, y) for y in range(m)]
+        length = n
+    else:
+        edge = 0 if dy < 0 else m - 1
+        starts = [grid.index(x, edge) for x in range(n)]
+        length = m
+
+    cells = grid.cells
+    for start in starts:
+        empty = start
+        for index in range(start, start - length * step, -step):
+            cell = cells[index]
+            if cell == CUBE:
+                empty = index - step
+            elif cell == ROUND:
+                if empty != index:
+                    cells[empty] = ROUND
+                    cells[index] = EMPTY
+                empty -= step
 
 def roll_all_directions(grid, n, m):
     """
     Performs one full cycle of rolling objects ('O') in all four directions: north, west, south, and east.
 
     Args:
-    grid (list of list of str): The grid where the objects and obstacles are placed.
+    grid (Grid): The grid where the objects and obstacles are placed.
     n (int): The number of rows in the grid.
     m (int): The number of columns in the grid.
 
@@ -86,26 +79,27 @@ def points(grid, n, m):
     Points are awarded based on how far up the column the 'O' is located, with higher positions earning more points.
 
     Args:
-    grid (list of list of str): The grid where the objects and obstacles are placed.
+    grid (Grid): The grid where the objects and obstacles are placed.
     n (int): The number of rows in the grid.
     m (int): The number of columns in the grid.
 
     Returns:
     int: The total points based on the positions of the objects ('O').
     """
-    return sum(n - x for y in range(m) for x in range(n) if grid[x][y] == "O")
+    cells = grid.cells
+    return sum((n - x) * cells.count(ROUND, grid.index(x, 0), grid.index(x, m)) for x in range(n))
 
 def grid_to_tuple(grid):
     """
-    Converts the grid to a tuple of tuples, making it hashable for storage in a set or dictionary.
+    Converts the grid to an immutable copy of its cells, making it hashable for storage in a set or dictionary.
 
     Args:
-    grid (list of list of str): The grid where the objects and obstacles are placed.
+    grid (Grid): The grid where the objects and obstacles are placed.
 
     Returns:
-    tuple of tuples: A hashable representation of the grid.
+    bytes: A hashable representation of the grid.
     """
-    return tuple(map(tuple, grid))
+    return bytes(grid.cells)
 
 def detect_cycle(grid, n, m, target_cycle=1_000_000_000):
     """
@@ -115,7 +109,7 @@ def detect_cycle(grid, n, m, target_cycle=1_000_000_000):
     computes the points after a large number of cycles efficiently using modulo arithmetic.
 
     Args:
-    grid (list of list of str): The grid where the objects and obstacles are placed.
+    grid (Grid): The grid where the objects and obstacles are placed.
     n (int): The number of rows in the grid.
     m (int): The number of columns in the grid.
     target_cycle (int): The number of cycles after which to calculate the points. Defaults to 1,000,000,000.
@@ -155,11 +149,8 @@ def points_part1(grid_str):
     Returns:
     int: The total points based on the positions of the objects ('O') after rolling north.
     """
-    grid = [list(line) for line in grid_str.split('\n')]
-    n = len(grid)
-    m = len(grid[0])
-    roll_all(grid,n,m,'north')
-    return points(grid, n, m)
+    grid = Grid.from_lines(grid_str.split('\n'), border='#')
+    return part1(grid)
 
 def points_part2(grid_str):
     """
@@ -171,9 +162,41 @@ def points_part2(grid_str):
     Returns:
     int: The total points based on the positions of the objects ('O') after rolling 1_000_000_000 times.
     """
-    grid = [list(line) for line in grid_str.split('\n')]
-    n = len(grid)
-    m = len(grid[0])
+    grid = Grid.from_lines(grid_str.split('\n'), border='#')
+    return part2(grid)
+
+def parse_input(text):
+    """
+    Parses the puzzle input into the grid of the platform.
+
+    Args:
+    text (str or bytes-like): Raw content of the puzzle input, e.g. the
+    buffer of a reader.MappedInput.
+
+    Returns:
+    Grid: The grid where the objects and obstacles are placed, surrounded
+    by a border of cube-shaped rocks ('#').
+    """
+    start, end = next(reader.block_spans(text))
+    return Grid.from_lines(reader.lines(text, start, end), border='#')
+
+def part1(grid):
+    """
+    Total load on the north support beams after tilting the platform north.
+    The grid is modified in place.
+    """
+    n = grid.height
+    m = grid.width
+    roll_all(grid,n,m,'north')
+    return points(grid, n, m)
+
+def part2(grid):
+    """
+    Total load on the north support beams after 1_000_000_000 spin cycles.
+    The grid is modified in place.
+    """
+    n = grid.height
+    m = grid.width
     return detect_cycle(grid, n, m)
 
 # Solution
@@ -1,9 +1,19 @@
 """
 This module contains the solution to the Day 15 Advent of Code challenge.
 """
+import operator
 import os
+import sys
 import time
 
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.mapreduce import map_red_lines
+
 def trans(string):
     """
     Computes a HASH value for a given string based on the specified algorithm.
@@ -85,6 +95,46 @@ def lens_power(boxes):
             total_power += (1 + box_num) * slot_index * focal_length
     return total_power
 
+def parse_input(text):
+    """
+    Splits the initialization sequence into its steps.
+
+    Args:
+    text (str or bytes-like): Raw content of the puzzle input, e.g. the
+    buffer of a reader.MappedInput.
+
+    Returns:
+    list of str: The steps of the initialization sequence.
+    """
+    return [reader.text(step) for step in reader.tokens(text, ',')]
+
+def parse_stream(stream):
+    """
+    Reads the steps of the initialization sequence from a file object in chunks.
+
+    Args:
+    stream (file): Text or binary file object holding the puzzle input,
+    e.g. sys.stdin.
+
+    Returns:
+    generator: The steps, read one at a time. Part 1 folds their HASH values
+    as they come, in constant memory; part 2 only keeps the boxes.
+    """
+    return reader.stream_tokens(stream, ',')
+
+def part1(lines):
+    """
+    Sum of the HASH values of every step of the initialization sequence.
+    """
+    return map_red_lines(lines, trans, operator.add, 0)
+
+def part2(lines):
+    """
+    Focusing power of the lens configuration after the initialization sequence.
+    """
+    boxes = initializator(lines)
+    return lens_power(boxes)
+
 # Solution
 if __name__ == "__main__":
     # Code to open the input file
@@ -92,16 +142,15 @@ if __name__ == "__main__":
     FILE = "day15.txt"
     
     with open(os.path.join(path, FILE), encoding='utf-8') as f:
-        lines = f.read().strip().split(',')
+        lines = parse_input(f.read())
 
     start_time = time.time()
     
     # Part 1 solution
-    part1_solution = (sum(trans(line) for line in lines))
+    part1_solution = part1(lines)
     print("Solution part 1: ", part1_solution)
     # Part 2 solution
-    boxes = initializator(lines)
-    part2_solution = lens_power(boxes)
+    part2_solution = part2(lines)
     print("Solution part 2: ", part2_solution)
     end_time = time.time()
     print(f"Execution time: {end_time - start_time} seconds")
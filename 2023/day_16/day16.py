@@ -2,80 +2,115 @@
 This module contains the solution to the Day 16 Advent of Code challenge.
 """
 import os
+import sys
 import time
+from functools import partial
+
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.grid import Grid
+from aoc2023.mapreduce import map_tasks
+
+BACKSLASH = ord('\\')
+SLASH = ord('/')
+DASH = ord('-')
+PIPE = ord('|')
+DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+def move_table(grid):
+    """
+    Computes, once per grid, where a beam goes from every tile and direction.
+
+    Args:
+    grid (Grid): The grid representing the contraption.
 
-def calculate_next(point_dir, grid):
+    Returns:
+    dict: For every (tile, direction) pair, the offset of the next position,
+    the next direction and the (offset, direction) of the split option, or None.
+    """
+    table = {}
+    for tile in set(grid.cells):
+        for direction in DIRECTIONS:
+            dir_x, dir_y = direction
+            option = None
+            if tile == BACKSLASH:
+                dir_x, dir_y = dir_y, dir_x
+            elif tile == SLASH:
+                dir_x, dir_y = -dir_y, -dir_x
+            elif (tile == DASH and dir_x != 0) or (tile == PIPE and dir_y != 0):
+                option = grid.offset(-dir_y, -dir_x), (-dir_y, -dir_x)
+                dir_x, dir_y = dir_y, dir_x
+            table[tile, direction] = grid.offset(dir_x, dir_y), (dir_x, dir_y), option
+    return table
+
+def calculate_next(point_dir, grid, table):
     """
     Calculates the next position and direction based on the current position and direction.
 
     Args:
-    point_dir (tuple): A tuple containing the current position (x, y) and direction (dir_x, dir_y).
-    grid (list of list): The grid representing the contraption.
+    point_dir (tuple): A tuple containing the index of the current position in the grid
+    and the direction (dir_x, dir_y).
+    grid (Grid): The grid representing the contraption.
+    table (dict): The moves of the grid, as returned by move_table.
 
     Returns:
     tuple: The next position and direction as a tuple, along with any split option if applicable.
     """
-    x, y = point_dir[0]
-    dir_x, dir_y = point_dir[1]
-    next_dir_x, next_dir_y = dir_x, dir_y
-    next_x, next_y = x + dir_x, y + dir_y
-    option = None
-
-    if 0 <= x < len(grid) and 0 <= y < len(grid[0]):
-        if grid[x][y] == '\\':
-            next_dir_x, next_dir_y = dir_y, dir_x
-        elif grid[x][y] == '/':
-            next_dir_x, next_dir_y = -dir_y, -dir_x
-        elif grid[x][y] == '-':
-            if dir_x != 0:
-                next_dir_x, next_dir_y = dir_y, dir_x
-                option = (x - dir_y, y - dir_x), (-dir_y, -dir_x)
-        elif grid[x][y] == '|':
-            if dir_y != 0:
-                next_dir_x, next_dir_y = dir_y, dir_x
-                option = (x - dir_y, y - dir_x), (-dir_y, -dir_x)
-
-        next_x, next_y = x + next_dir_x, y + next_dir_y
-
-    return ((next_x, next_y), (next_dir_x, next_dir_y)), option
+    index, direction = point_dir
+    offset, direction, option = table[grid.cells[index], direction]
+    if option is not None:
+        option = index + option[0], option[1]
+    return (index + offset, direction), option
 
-def calculate_stream(start, grid, visited):
+def calculate_stream(start, grid, visited, table=None):
     """
     Calculates the path of the beam through the grid and keeps track of energized tiles.
 
     Args:
     start (tuple): The starting position and direction of the beam.
-    grid (list of list): The grid representing the contraption.
+    grid (Grid): The grid representing the contraption, with a border
+    that doesn't appear inside it.
+    table (dict): The moves of the grid. Defaults to move_table(grid).
 
     Returns:
     dict: A dictionary of visited tiles with their energized status.
     """
+    cells = grid.cells
+    border = grid.border
+    if table is None:
+        table = move_table(grid)
     queue = [start]
     while queue:
         current = queue.pop(0)
         while current not in visited:
             visited[current] = visited.get(current,0)+1
-            next, option = calculate_next(current,grid)
-            if option != None and option[0][0] in range(0, len(grid)) and option[0][1] in range(0,len(grid[0])):
+            next, option = calculate_next(current, grid, table)
+            # A beam reaching the border has left the contraption
+            if option is not None and cells[option[0]] != border:
                 queue.append(option)
-            if next[0][0]<0 or next[0][0]>=len(grid) or next[0][1]<0 or next[0][1]>= len(grid[0]):
+            if cells[next[0]] == border:
                 break
             current = next
     return visited
 
-def energizer(start,grid):
+def energizer(start, grid, table=None):
     """
     Calculates the number of energized tiles starting from a specific position.
 
     Args:
     start (tuple): The starting position and direction of the beam.
-    grid (list of list): The grid representing the contraption.
+    grid (Grid): The grid representing the contraption.
+    table (dict): The moves of the grid. Defaults to move_table(grid).
 
     Returns:
     int: The number of energized tiles.
     """
     visited = {}
-    visited = calculate_stream(start,grid, visited)
+    visited = calculate_stream(start, grid, visited, table)
     visited2 = set()
     for key,value in visited:
         visited2.add(key)
@@ -87,12 +122,53 @@ def max_energizer(starts, grid):
 
     Args:
     starts (list): A list of starting positions and directions.
-    grid (list of list): The grid representing the contraption.
+    grid (Grid): The grid representing the contraption.
 
     Returns:
     int: The maximum number of energized tiles from any starting position.
     """
-    return max(energizer(start, grid) for start in starts)
+    return max(map_tasks(starts, partial(energizer, grid=grid, table=move_table(grid))))
+
+def edge_starts(grid):
+    """
+    Lists every starting position and direction entering the grid from one of its edges.
+
+    Args:
+    grid (Grid): The grid representing the contraption.
+
+    Returns:
+    list: A list of starting positions (indices in the grid) and directions.
+    """
+    n, m = grid.height, grid.width
+    return ([(grid.index(x,0),(0,1)) for x in range(0, n)]+
+            [(grid.index(0,y),(1,0)) for y in range(0,m)]+
+            [(grid.index(x,m-1),(0,-1)) for x in range(0, n)]+
+            [(grid.index(n-1,y),(-1,0)) for y in range(0,m)])
+
+def parse_input(text):
+    """
+    Parses the puzzle input into the grid of the contraption.
+
+    Args:
+    text (str or bytes-like): Raw content of the puzzle input, e.g. the
+    buffer of a reader.MappedInput.
+
+    Returns:
+    Grid: The grid representing the contraption.
+    """
+    return Grid.from_lines(reader.lines(text))
+
+def part1(grid):
+    """
+    Number of energized tiles with the beam entering from the top-left corner heading right.
+    """
+    return energizer((grid.index(0,0),(0,1)), grid)
+
+def part2(grid):
+    """
+    Maximum number of energized tiles among all the beams entering from the edges.
+    """
+    return max_energizer(edge_starts(grid), grid)
 
 # Solution
 if __name__ == "__main__":
@@ -101,20 +177,12 @@ if __name__ == "__main__":
     FILE = "day16.txt"
     
     with open(os.path.join(path, FILE), encoding='utf-8') as f:
-        lines = f.read().strip()
-        grid = [list(x) for x in lines.split('\n')]
-
-    start = ((0,0),(0,1))
-
-    starts = ([((x,0),(0,1)) for x in range(0, len(grid))]+
-              [((0,y),(1,0)) for y in range(0,len(grid[0]))]+
-              [((x,len(grid[0])-1),(0,-1)) for x in range(0, len(grid))]+
-              [((len(grid)-1,y),(-1,0)) for y in range(0,len(grid[0]))])
+        grid = parse_input(f.read())
 
     start_time = time.time()    
     # Part 1 solution
-    print("Solution part 1: ", energizer(start, grid))
+    print("Solution part 1: ", part1(grid))
     # Part 2 solution
-    print("Solution part 2: ", max_energizer(starts,grid))
+    print("Solution part 2: ", part2(grid))
     end_time = time.time()
     print(f"Execution time: {end_time - start_time} seconds")
@@ -2,51 +2,64 @@
 This module contains the solution to the Day 17 Advent of Code challenge.
 """
 import os
+import sys
 import time
 import heapq
 from collections import defaultdict
 
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023.grid import Grid
+
 def dijkstra(grid, start, end):
     """
     Implements Dijkstra's algorithm to find the least heat loss path.
 
     Args:
-    grid (list of list): The grid representing the heat loss values.
+    grid (Grid): The grid representing the heat loss values, with a
+    negative border.
     start (tuple): The starting coordinates.
     end (tuple): The destination coordinates.
 
     Returns:
     int: The minimum cost (heat loss) to reach the end.
     """
-    queue = [(0, start[0], start[1], 0, 0, 0)]  # Priority queue initialized with (cost, x, y, dx, dy, straight)
+    cells = grid.cells
+    moves = grid.neighbours  # Offsets of the neighbours in the flat grid
+    end = grid.index(*end)
+    queue = [(0, grid.index(*start), 0, 0)]  # Priority queue initialized with (cost, index, step, straight)
     seen = defaultdict(lambda: float('inf'))  # Dictionary to track minimum costs
 
     while queue:
-        cost, x, y, dx, dy, straight = heapq.heappop(queue)  # Get the lowest cost item
+        cost, index, step, straight = heapq.heappop(queue)  # Get the lowest cost item
         
-        if (x, y) == end:  # If reached the end, return the cost
+        if index == end:  # If reached the end, return the cost
             return cost
 
-        if cost > seen[(x, y, dx, dy, straight)]:  # Ignore if cost is not minimal
+        if cost > seen[(index, step, straight)]:  # Ignore if cost is not minimal
             continue
         
         # Explore all possible movements
-        for new_dx, new_dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            new_x, new_y = x + new_dx, y + new_dy  # Calculate new position
-            new_straight = straight + 1 if (new_dx, new_dy) == (dx, dy) else 1  # Update straight movement count
+        for new_step in moves:
+            new_index = index + new_step  # Calculate new position
+            new_straight = straight + 1 if new_step == step else 1  # Update straight movement count
 
             # Ensure valid movements
-            if (new_x, new_y) == (x - dx, y - dy):  # Cannot reverse direction
+            if new_step == -step:  # Cannot reverse direction
                 continue
-            if not (0 <= new_x < len(grid) and 0 <= new_y < len(grid[0])):  # Check bounds
+            if cells[new_index] < 0:  # Check bounds: the border is negative
                 continue
             if new_straight > 3:  # Limit straight movement
                 continue
             
-            new_cost = cost + grid[new_x][new_y]  # Calculate new cost
-            if new_cost < seen[(new_x, new_y, new_dx, new_dy, new_straight)]:
-                seen[(new_x, new_y, new_dx, new_dy, new_straight)] = new_cost
-                heapq.heappush(queue, (new_cost, new_x, new_y, new_dx, new_dy, new_straight))  # Push new state onto queue
+            new_cost = cost + cells[new_index]  # Calculate new cost
+            if new_cost < seen[(new_index, new_step, new_straight)]:
+                seen[(new_index, new_step, new_straight)] = new_cost
+                heapq.heappush(queue, (new_cost, new_index, new_step, new_straight))  # Push new state onto queue
     
     return float('inf')  # Return infinity if no path found
 
@@ -55,66 +68,91 @@ def dijkstra2(grid, start, end):
     Implements a modified Dijkstra's algorithm for ultra crucibles.
 
     Args:
-    grid (list of list): The grid representing the heat loss values.
+    grid (Grid): The grid representing the heat loss values, with a
+    negative border.
     start (tuple): The starting coordinates.
     end (tuple): The destination coordinates.
 
     Returns:
     int: The minimum cost (heat loss) to reach the end with ultra crucible rules.
     """
-    initial_cost = sum(grid[0][i] for i in range(1, 4))  # Initial cost based on starting row
-    queue = [(initial_cost, 0, 3, 0, 1, 3)]  # Initialize queue for ultra crucible
+    cells = grid.cells
+    moves = grid.neighbours  # Offsets of the neighbours in the flat grid
+    end = grid.index(*end)
+    initial_cost = sum(grid[0, i] for i in range(1, 4))  # Initial cost based on starting row
+    queue = [(initial_cost, grid.index(0, 3), grid.offset(0, 1), 3)]  # Initialize queue for ultra crucible
     seen = defaultdict(lambda: float('inf'))  # Track minimum costs
     
     while queue:
-        cost, x, y, dx, dy, straight = heapq.heappop(queue)  # Get the lowest cost item
+        cost, index, step, straight = heapq.heappop(queue)  # Get the lowest cost item
         
-        if (x, y) == end and straight >= 4:  # Check for end condition with straight constraint
+        if index == end and straight >= 4:  # Check for end condition with straight constraint
             return cost
 
-        if cost >= seen[(x, y, dx, dy, straight)]:  # Ignore non-minimal costs
+        if cost >= seen[(index, step, straight)]:  # Ignore non-minimal costs
             continue
         
-        seen[(x, y, dx, dy, straight)] = cost  # Record the current cost
+        seen[(index, step, straight)] = cost  # Record the current cost
         
         # Explore all possible movements
-        for new_dx, new_dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            new_x, new_y = x + new_dx, y + new_dy  # Calculate new position
+        for new_step in moves:
+            new_index = index + new_step  # Calculate new position
             
-            if (new_dx, new_dy) == (-dx, -dy):  # Cannot reverse direction
+            if new_step == -step:  # Cannot reverse direction
                 continue
-            if not (0 <= new_x < len(grid) and 0 <= new_y < len(grid[0])):  # Check bounds
+            if cells[new_index] < 0:  # Check bounds: the border is negative
                 continue
             
-            new_straight = straight + 1 if (new_dx, new_dy) == (dx, dy) else 1  # Update straight movement count
+            new_straight = straight + 1 if new_step == step else 1  # Update straight movement count
 
             # Ensure movement constraints
             if new_straight > 10:  # Max straight movement for ultra crucible
                 continue
-            if (new_dx, new_dy) != (dx, dy) and straight < 4:  # Must have straight movement for turning
+            if new_step != step and straight < 4:  # Must have straight movement for turning
                 continue
             
-            new_cost = cost + grid[new_x][new_y]  # Calculate new cost
-            heapq.heappush(queue, (new_cost, new_x, new_y, new_dx, new_dy, new_straight))  # Push new state onto queue
+            new_cost = cost + cells[new_index]  # Calculate new cost
+            heapq.heappush(queue, (new_cost, new_index, new_step, new_straight))  # Push new state onto queue
         
     return float('inf')  # Return infinity if no path found
 
+def parse_input(text):
+    """
+    Parses the puzzle input into the grid of heat loss values.
+
+    Args:
+    text (str or bytes-like): Raw content of the puzzle input, e.g. the
+    buffer of a reader.MappedInput.
+
+    Returns:
+    Grid: The grid representing the heat loss values, with a border of -1.
+    """
+    return Grid.from_digits(reader.lines(text))
+
+def part1(grid):
+    """
+    Least heat loss from the top-left to the bottom-right block with a crucible.
+    """
+    return dijkstra(grid, (0, 0), (grid.height - 1, grid.width - 1))
+
+def part2(grid):
+    """
+    Least heat loss from the top-left to the bottom-right block with an ultra crucible.
+    """
+    return dijkstra2(grid, (0, 0), (grid.height - 1, grid.width - 1))
+
 if __name__ == "__main__":
     # Code to open the input file
     path = os.getcwd()
     FILE = "day17.txt"
     
     with open(os.path.join(path, FILE), encoding='utf-8') as f:
-        lines = f.read().strip()
-        grid = [list(map(int, x)) for x in lines.split('\n')]
+        grid = parse_input(f.read())
 
     start_time = time.time()
 
-    start = (0, 0)
-    end = (len(grid) - 1, len(grid[0]) - 1)
-
-    sol = dijkstra(grid, start, end)
-    sol2 = dijkstra2(grid, start, end)
+    sol = part1(grid)
+    sol2 = part2(grid)
 
     # Part 1 solution
     print("Solution part 1: ", sol)
@@ -1,69 +1,122 @@
 import os
+import sys
 import time
 
-def frontier(dirs, start, directions):
+try:
+    from aoc2023 import reader
+except ImportError:
+    # Run from the day directory: the aoc2023 package lives one level up.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from aoc2023 import reader
+from aoc2023 import geometry
+from aoc2023.records import Record, column
+
+class DigPlan(Record):
+    """
+    Instructions of a dig plan, as columns.
+
+    Attributes:
+    directions (str): The direction identifier of every instruction.
+    steps (array): The step count of every instruction.
+    """
+    __slots__ = ("directions", "steps")
+
+    def __iter__(self):
+        # (direction, steps) tuples
+        return zip(self.directions, self.steps)
+
+    def __len__(self):
+        return len(self.steps)
+
+def dig_vertices(dirs, start, directions):
     """
-    Calculates the number of frontier points and the vertices of a polygon based on given directions.
+    Generates the vertices of the polygon dug following the instructions.
 
     Args:
-    dirs (list): A list of tuples containing direction identifiers and step counts.
+    dirs (DigPlan): The direction identifiers and step counts.
     start (tuple): The starting coordinates (x, y).
     directions (dict): A dictionary mapping direction identifiers to coordinate changes.
 
+    Yields:
+    tuple: The (x, y) vertices of the polygon, starting and ending with the start.
+    """
+    x, y = start
+    yield start
+    for dir, steps in dirs:
+        nx, ny = directions[dir]
+        x, y = x + nx * steps, y + ny * steps
+        yield x, y
+
+def dig_columns(dirs, directions):
+    """
+    Computes the vertices of the polygon dug following the instructions, as columns.
+
+    Args:
+    dirs (DigPlan): The direction identifiers and step counts.
+    directions (dict): A dictionary mapping direction identifiers to coordinate changes.
+
     Returns:
-    tuple: A tuple containing:
-        - dug_list (list): A list of tuples representing the vertices of the polygon formed by the dug points.
-        - frontier_points_count (int): The total count of frontier points dug, including the starting point.
+    tuple: The x and the y coordinates of the vertices, from (0, 0), as arrays.
     """
-    dug_list = []
-    frontier_points_count = 1
-    dug_list.append(start)
-    next = start
-    for dir in dirs:
-        direction = directions[dir[0]]
-        steps = dir[1]
-        nx = direction[0]
-        ny = direction[1]
-        x = next[0]
-        y = next[1]
-        next = (x + nx * int(steps), y + ny * int(steps))
-        frontier_points_count += int(steps)
-        dug_list.append(next)
-    return dug_list, frontier_points_count
-
-def shoelace(vertices):
+    xs, ys = column(), column()
+    for x, y in dig_vertices(dirs, (0, 0), directions):
+        xs.append(x)
+        ys.append(y)
+    return xs, ys
+
+# Define direction mappings for both sets of directions
+DIRECTIONS = {'D': (1, 0), 'U': (-1, 0), 'L': (0, -1), 'R': (0, 1)}
+DIRECTIONS2 = {'1': (1, 0), '3': (-1, 0), '2': (0, -1), '0': (0, 1)}
+
+def parse_input(text):
     """
-    Calculates the area of a polygon using the shoelace formula.
+    Parses the dig plan into the instructions of both parts.
 
     Args:
-    vertices (list): A list of tuples representing the vertices of the polygon.
+    text (str or bytes-like): Raw content of the puzzle input, e.g. the
+    buffer of a reader.MappedInput.
 
     Returns:
-    float: The area of the polygon.
+    tuple: The DigPlan read from the plan and the one decoded from the
+    hexadecimal colors.
     """
-    area_pol = 0
-    i = 0
-    while i < len(vertices):
-        x_i = vertices[i][0]
-        y_i1 = vertices[(i + 1) % len(vertices)][1]
-        y_1i = vertices[(i - 1) % len(vertices)][1]
-        area_pol += x_i * (y_i1 - y_1i)
-        i += 1
-    return 0.5 * abs(area_pol)
-
-def pick_theorem(area_pol, boundary_points):
+    directions, steps, directions2, steps2 = [], column(), [], column()
+    for line in reader.lines(text):
+        direction, count, color = reader.text(line).split(" ")
+        directions.append(direction)
+        steps.append(int(count))
+        directions2.append(color[7:8])
+        steps2.append(int(color[2:7], 16))
+    return DigPlan("".join(directions), steps), DigPlan("".join(directions2), steps2)
+
+def lagoon_size(dirs, directions):
     """
-    Calculates the number of interior points of a polygon using Pick's theorem.
+    Calculates the number of cubic meters of lava the lagoon can hold.
 
     Args:
-    area_pol (float): The area of the polygon.
-    boundary_points (int): The number of boundary points on the polygon.
+    dirs (DigPlan): The direction identifiers and step counts.
+    directions (dict): A dictionary mapping direction identifiers to coordinate changes.
 
     Returns:
-    int: The number of interior points of the polygon.
+    int: The number of frontier points plus the number of interior points.
+    """
+    xs, ys = dig_columns(dirs, directions)
+    double_area = geometry.twice_area_batch(xs, ys)
+    # Every edge is horizontal or vertical: its lattice points are its steps
+    boundary = sum(dirs.steps)
+    return boundary + geometry.interior_points(double_area, boundary)
+
+def part1(plan):
+    """
+    Size of the lagoon following the plan instructions.
     """
-    interior_points = area_pol - (boundary_points / 2) + 1
-    return int(interior_points)
+    return lagoon_size(plan[0], DIRECTIONS)
+
+def part2(plan):
+    """
+    Size of the lagoon following the instructions decoded from the colors.
+    """
+    return lagoon_size(plan[1], DIRECTIONS2)
 
 if __name__ == "__main__":
     # Code to open the input file
@@ -71,30 +124,13 @@ if __name__ == "__main__":
     FILE = "day18.txt"
     
     with open(os.path.join(path, FILE), encoding='utf-8') as f:
-        lines = f.read().strip()
-        dirs = [tuple(line.split(" ")[:2]) for line in lines.split('\n')]
-        dirs2 = [(line.split(" ")[-1:][0][7:8], int(line.split(" ")[-1:][0][2:7], 16)) for line in lines.split('\n')]
+        plan = parse_input(f.read())
 
     start_time = time.time()
 
-    # Define direction mappings for both sets of directions
-    directions = {'D': (1, 0), 'U': (-1, 0), 'L': (0, -1), 'R': (0, 1)}
-    directions2 = {'1': (1, 0), '3': (-1, 0), '2': (0, -1), '0': (0, 1)}
-    start = (0, 0)
-
-    # Calculate frontier points and counts for both sets of directions
-    dug_frontier, frontier_points_count = frontier(dirs, start, directions)
-    dug_frontier2, frontier_points_count2 = frontier(dirs2, start, directions2)
-    
-    # Calculate areas and interior points for both sets of dug points
-    area = shoelace(dug_frontier)
-    inside_points = pick_theorem(area, frontier_points_count)
-    area2 = shoelace(dug_frontier2)
-    inside_points2 = pick_theorem(area2, frontier_points_count2)
-
     # Part 1 solution
-    print("Solution part 1: ", frontier_points_count + inside_points)
+    print("Solution part 1: ", part1(plan))
     # Part 2 solution
-    print("Solution part 2: ", frontier_points_count2 + inside_points2)
+    print("Solution part 2: ", part2(plan))
     end_time = time.time()
     print(f"Execution time: {end_time - start_time} seconds")
@@ -0,0 +1,11 @@
+"""
+Puts the 2023 directory on the path, so that the tests import aoc2023 and
+the day modules (day_XX.dayN) as the runner does, whatever the directory
+pytest is started from.
+"""
+import os
+import sys
+
+YEAR_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if YEAR_DIR not in sys.path:
+    sys.path.insert(0, YEAR_DIR)
@@ -0,0 +1,98 @@
+"""
+Tests of the answer cache of aoc2023.cache: hits, misses, keys and the
+least recently used eviction.
+"""
+import os
+import types
+
+from aoc2023 import cache, days
+
+DAY6_EXAMPLE = "Time:      7  15   30\nDistance:  9  40  200\n"
+
+def _age(result_cache, entry_key, seconds):
+    path = os.path.join(result_cache.directory, entry_key + ".json")
+    os.utime(path, (seconds, seconds))
+
+def test_miss_then_hit(tmp_path):
+    result_cache = cache.ResultCache(str(tmp_path / "results"))
+    assert result_cache.entries() == []
+    assert result_cache.get("absent") == (False, None)
+    result_cache.put("present", 288)
+    assert result_cache.get("present") == (True, 288)
+    assert result_cache.get("absent") == (False, None)
+    result_cache.put("present", "text")
+    assert result_cache.get("present") == (True, "text")
+    assert len(result_cache.entries()) == 1
+
+def test_corrupted_entry_is_a_miss(tmp_path):
+    result_cache = cache.ResultCache(str(tmp_path))
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+    assert result_cache.get("broken") == (False, None)
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    result_cache = cache.ResultCache(str(tmp_path), max_bytes=10**6)
+    for number, entry_key in enumerate("abcd"):
+        result_cache.put(entry_key, number)
+        _age(result_cache, entry_key, 1000 + number)
+    # Reading "a" makes it the most recently used one
+    assert result_cache.get("a") == (True, 0)
+    # Room for the two most recently used entries, whose sizes vary with their time stamps
+    result_cache.max_bytes = sum(size for _, size, _ in result_cache.entries()[-2:])
+    assert result_cache.evict() == 2
+    assert [result_cache.get(entry_key)[0] for entry_key in "abcd"] \
+        == [True, False, False, True]
+
+def test_put_evicts_over_the_cap(tmp_path):
+    result_cache = cache.ResultCache(str(tmp_path), max_bytes=0)
+    result_cache.put("a", 1)
+    assert result_cache.entries() == []
+
+def test_clear(tmp_path):
+    result_cache = cache.ResultCache(str(tmp_path))
+    result_cache.put("a", 1)
+    result_cache.put("b", 2)
+    result_cache.clear()
+    assert result_cache.entries() == []
+    assert result_cache.get("a") == (False, None)
+
+def test_key_depends_on_input_part_and_code():
+    data_hash = cache.input_hash(b"input")
+    code_hash = "0" * 64
+    keys = {cache.key(data_hash, 1, code_hash), cache.key(data_hash, 2, code_hash),
+            cache.key(cache.input_hash(b"other"), 1, code_hash),
+            cache.key(data_hash, 1, "1" * 64)}
+    assert len(keys) == 4
+
+def test_helper_files_are_transitive():
+    module = types.ModuleType("synthetic")
+    module.__file__ = os.path.abspath(__file__)
+    module.solve = cache.solve
+    found = {os.path.basename(path) for path in cache.helper_files(module)}
+    # cache uses days, budget and parsecache, which use more helpers in turn
+    assert {"cache.py", "days.py", "budget.py", "parsecache.py"} <= found
+    assert os.path.basename(__file__) not in found
+    bare = types.ModuleType("bare")
+    bare.__file__ = module.__file__
+    assert cache.helper_files(bare) == []
+    assert cache.source_hash(module) != cache.source_hash(bare)
+
+def test_helper_files_of_a_day():
+    day16 = days.import_day(16)
+    files = cache.helper_files(day16)
+    assert any(path.endswith(os.path.join("aoc2023", "grid.py")) for path in files)
+    assert day16.__file__ not in files
+
+def test_solve_reuses_the_cached_answers(tmp_path):
+    path = tmp_path / "day6.txt"
+    path.write_text(DAY6_EXAMPLE, encoding="utf-8")
+    result_cache = cache.ResultCache(str(tmp_path / "results"))
+    first = cache.solve(6, path=str(path), cache=result_cache)
+    assert [(row["answer"], row["cached"], row["error"]) for row in first] \
+        == [(288, False, None), (71503, False, None)]
+    second = cache.solve(6, path=str(path), cache=result_cache)
+    assert [(row["answer"], row["cached"]) for row in second] == [(288, True), (71503, True)]
+    assert "cache" in cache.format_rows(second)
+    # Another input misses
+    path.write_text(DAY6_EXAMPLE.replace("200", "201"), encoding="utf-8")
+    third = cache.solve(6, parts=(1,), path=str(path), cache=result_cache)
+    assert not third[0]["cached"]
@@ -0,0 +1,64 @@
+"""
+Tests of aoc2023.geometry, with polygons whose areas go far beyond the
+integers a float holds exactly (2**53).
+"""
+import pytest
+
+from aoc2023 import geometry
+
+def _rectangle(x, y, height, width):
+    return [(x, y), (x, y + width), (x + height, y + width), (x + height, y)]
+
+def test_unit_square():
+    square = _rectangle(0, 0, 1, 1)
+    assert geometry.measure(square) == (2, 4)
+    assert geometry.interior_points(2, 4) == 0
+    assert geometry.lattice_points(square) == 4
+
+def test_empty_and_closed_polygons():
+    assert geometry.measure([]) == (0, 0)
+    square = _rectangle(0, 0, 3, 2)
+    assert geometry.measure(square + square[:1]) == geometry.measure(square)
+
+def test_orientation_does_not_matter():
+    square = _rectangle(-2, 5, 4, 7)
+    assert geometry.measure(square) == geometry.measure(reversed(square))
+
+def test_triangle_boundary_counts_points_between_vertices():
+    # The hypotenuse from (0, 4) to (6, 0) holds gcd(6, 4) + 1 = 3 points
+    triangle = [(0, 0), (0, 4), (6, 0)]
+    assert geometry.measure(iter(triangle)) == (24, 4 + 6 + 2)
+    assert geometry.interior_points(24, 12) == 7
+
+@pytest.mark.parametrize("side", [3 * 10**9 + 1, 2**40 + 3, 10**30 + 7])
+def test_huge_square_is_exact(side):
+    square = _rectangle(-side, 10**6, side, side)
+    double_area, boundary = geometry.measure(square)
+    assert double_area > 2**53
+    assert double_area == 2 * side * side
+    assert boundary == 4 * side
+    assert geometry.interior_points(double_area, boundary) == (side - 1) ** 2
+    assert geometry.lattice_points(square) == (side + 1) ** 2
+
+def test_huge_staircase_is_exact():
+    # Steps of one by one step up to (count, count), closed along the axes
+    step, count = 10**12 + 1, 50
+    vertices = [(0, 0)]
+    for i in range(count):
+        vertices.append((i * step, (i + 1) * step))
+        vertices.append(((i + 1) * step, (i + 1) * step))
+    vertices.append((count * step, 0))
+    side = count * step
+    expected = side * side + count * step * step
+    assert geometry.twice_area(vertices) == expected
+    # A float would round it
+    assert int(float(expected)) != expected
+    assert geometry.boundary_points(vertices) == 4 * side
+
+@pytest.mark.parametrize("side", [5, 10**6, 3 * 10**9 + 1, 2**62 + 1])
+def test_batch_matches_the_pure_python_sum(side):
+    square = _rectangle(1, -7, side, side + 2)
+    xs = [x for x, _ in square]
+    ys = [y for _, y in square]
+    assert geometry.twice_area_batch(xs, ys) == geometry.twice_area(square)
+    assert geometry.twice_area_batch([], []) == 0
@@ -0,0 +1,97 @@
+"""
+Tests of the index arithmetic and the border of aoc2023.grid.Grid.
+"""
+from array import array
+
+import pytest
+
+from aoc2023.grid import Grid
+
+LINES = ["abc", "def"]
+
+def _grid():
+    return Grid.from_lines(LINES, border="#")
+
+def test_shape_and_border():
+    grid = _grid()
+    assert (grid.height, grid.width, grid.stride) == (2, 3, 5)
+    assert len(grid.cells) == (2 + 2) * 5
+    assert bytes(grid.cells) == b"######abc##def######"
+    assert grid.border == ord("#")
+
+@pytest.mark.parametrize("x", range(-1, 3))
+@pytest.mark.parametrize("y", range(-1, 4))
+def test_index_and_position_round_trip(x, y):
+    grid = _grid()
+    index = grid.index(x, y)
+    assert grid.position(index) == (x, y)
+    assert grid.inside(index) == (0 <= x < 2 and 0 <= y < 3)
+    assert grid[x, y] == grid.cells[index]
+    if not grid.inside(index):
+        assert grid.cells[index] == grid.border
+
+def test_cells_by_position():
+    grid = _grid()
+    assert [chr(grid[x, y]) for x in range(2) for y in range(3)] == list("abcdef")
+    grid[1, 2] = ord("z")
+    assert str(grid) == "abc\ndez"
+
+def test_offsets_and_neighbours():
+    grid = _grid()
+    centre = grid.index(0, 1)
+    north, east, south, west = (centre + step for step in grid.neighbours)
+    assert [grid.position(index) for index in (north, east, south, west)] \
+        == [(-1, 1), (0, 2), (1, 1), (0, 0)]
+    assert not grid.inside(north)
+    assert grid.offset(1, 1) == grid.index(1, 2) - centre
+    assert grid.offset(-1, 0) == grid.neighbours[0]
+
+def test_walk_stops_on_the_border():
+    grid = _grid()
+    index, steps = grid.index(1, 0), 0
+    while grid.cells[index] != grid.border:
+        index += grid.neighbours[1]
+        steps += 1
+    assert steps == grid.width
+    assert grid.position(index) == (1, 3)
+
+def test_rows_and_columns():
+    grid = _grid()
+    assert [row.tobytes() for row in grid.rows()] == [b"abc", b"def"]
+    assert [column.tobytes() for column in grid.columns()] == [b"ad", b"be", b"cf"]
+    assert grid.row(1).tobytes() == b"def"
+    assert grid.column(2).tobytes() == b"cf"
+    assert grid.rows(copy=True) == [bytearray(b"abc"), bytearray(b"def")]
+    assert grid.columns(copy=True)[0] == bytearray(b"ad")
+
+def test_find():
+    grid = _grid()
+    assert grid.find("e") == grid.index(1, 1)
+    assert grid.find("a", grid.index(0, 1)) == -1
+    assert grid.find("?") == -1
+
+def test_from_digits():
+    grid = Grid.from_digits([b"123", b"450"])
+    assert isinstance(grid.cells, array)
+    assert grid[1, 2] == 0
+    assert grid[-1, 0] == grid[0, 3] == grid.border == -1
+    assert grid.find(5) == grid.index(1, 1)
+    assert grid.find(9) == -1
+    assert [list(column) for column in grid.columns()] == [[1, 4], [2, 5], [3, 0]]
+    assert str(grid) == "123\n450"
+
+def test_copy_does_not_share_cells():
+    grid = _grid()
+    copy = grid.copy()
+    copy[0, 0] = ord("x")
+    assert grid[0, 0] == ord("a")
+    assert str(copy) == "xbc\ndef"
+
+def test_rows_of_different_lengths():
+    with pytest.raises(ValueError):
+        Grid.from_lines(["ab", "c"])
+
+def test_empty_grid():
+    grid = Grid.from_lines([])
+    assert (grid.height, grid.width) == (0, 0)
+    assert grid.rows() == [] and grid.columns() == []
@@ -0,0 +1,99 @@
+"""
+Tests of the trend detection of aoc2023.history: the exact p-values of the
+Mann-Whitney U test and the status of a series.
+"""
+import itertools
+import math
+
+import pytest
+
+from aoc2023 import history
+
+def _brute_force(sample, reference):
+    # Share of the splits of the values into two groups with a U at least the observed one
+    values = list(sample) + list(reference)
+
+    def u_of(first, second):
+        return sum(1.0 if x > y else 0.5 if x == y else 0.0 for x in first for y in second)
+
+    observed = u_of(sample, reference)
+    splits = list(itertools.combinations(range(len(values)), len(sample)))
+    extreme = 0
+    for chosen in splits:
+        first = [values[i] for i in chosen]
+        second = [values[i] for i in range(len(values)) if i not in chosen]
+        extreme += u_of(first, second) >= observed
+    return extreme / len(splits)
+
+@pytest.mark.parametrize("sample, reference, expected", [
+    ([5, 6, 7], [1, 2, 3, 4], 1 / 35),
+    ([1, 2, 3], [4, 5, 6, 7], 1.0),
+    ([5, 6, 7], [1, 2, 3], 1 / 20),
+    ([4], [1, 2, 3], 1 / 4),
+    ([2, 4], [1, 3], 2 / 6),
+    ([3], [3], 0.5),
+])
+def test_known_p_values(sample, reference, expected):
+    assert math.isclose(history.mann_whitney_greater(sample, reference), expected)
+
+@pytest.mark.parametrize("sample, reference", [([], [1, 2]), ([1, 2], []), ([], [])])
+def test_empty_sample(sample, reference):
+    assert history.mann_whitney_greater(sample, reference) == 1.0
+
+@pytest.mark.parametrize("sample, reference", [
+    ([10, 12, 15], [9, 11, 13, 14, 8]),
+    ([3, 1, 4], [0, 5, 9, 2, 6]),
+    ([7, 16, 8, 9], [10, 6, 5, 11, 4, 3]),
+])
+def test_matches_the_permutation_test(sample, reference):
+    assert math.isclose(history.mann_whitney_greater(sample, reference),
+                        _brute_force(sample, reference))
+
+def test_u_counts_sum_to_the_number_of_orderings():
+    for m, n in [(1, 1), (3, 4), (5, 20)]:
+        counts = history._u_counts(m, n)
+        assert len(counts) == m * n + 1
+        assert sum(counts) == math.comb(m + n, m)
+        assert counts == counts[::-1]
+
+def _series(timings):
+    return [dict(time=f"t{i}", day=16, phase="part2", input="day16.txt:0", host="h", arch="a",
+                 revision=f"r{i}", python="CPython", min_ns=timing)
+            for i, timing in enumerate(timings)]
+
+def test_trend_of_a_short_series():
+    result = history.trend(_series([100, 100, 100, 100]))
+    assert result["status"] == "short"
+    assert result["p_value"] is None
+
+def test_trend_flags_a_slowdown():
+    result = history.trend(_series([100, 101, 99, 100, 102, 98, 100, 150, 152, 151]))
+    assert result["status"] == "slower"
+    assert result["window_revision"] == "r7"
+    assert result["p_value"] < history.ALPHA
+    assert "SLOWER since r7" in history.format_text([result])
+
+def test_trend_flags_a_speedup():
+    result = history.trend(_series([100, 101, 99, 100, 102, 98, 100, 50, 52, 51]))
+    assert result["status"] == "faster"
+
+def test_trend_ignores_small_drifts():
+    # Significant, but under the minimal effect
+    result = history.trend(_series([100, 101, 99, 100, 102, 98, 100, 103, 104, 103]))
+    assert result["p_value"] < history.ALPHA
+    assert result["status"] == "ok"
+
+def test_python_versions_are_separate_series():
+    # The same timings as a slowdown, but the slow entries come from another interpreter
+    entries = _series([100] * 7 + [200] * 3)
+    for entry in entries[7:]:
+        entry["python"] = "CPython 3.13.0"
+    trends = history.trend_report(entries)
+    assert sorted(row["status"] for row in trends) == ["ok", "short"]
+
+def test_report_puts_slowdowns_first():
+    steady = _series([100] * 10)
+    slower = [dict(entry, day=3) for entry in _series([100] * 7 + [200] * 3)]
+    trends = history.trend_report(steady + slower)
+    assert [(row["day"], row["status"]) for row in trends] == [(3, "slower"), (16, "ok")]
+    assert history.trend_report(steady + slower, report_days=[16])[0]["day"] == 16
@@ -0,0 +1,82 @@
+"""
+Tests of aoc2023.mapreduce: map_tasks gives the same answers in every mode,
+and the chunked map-reduce the same as its serial loop.
+"""
+import operator
+
+import pytest
+
+from aoc2023 import days, mapreduce
+
+DAY16_EXAMPLE = r"""
+.|...\....
+|.-.\.....
+.....|-...
+........|.
+..........
+.........\
+..../.\\..
+.-.-/..|..
+.|....-|.\
+..//.|....
+""".lstrip()
+
+def _square(number):
+    return number * number
+
+@pytest.mark.parametrize("mode", mapreduce.MODES)
+def test_map_tasks_in_every_mode(mode):
+    items = range(-50, 50)
+    expected = [number * number for number in items]
+    assert mapreduce.map_tasks(items, _square, mode=mode, workers=2) == expected
+    assert mapreduce.map_tasks(iter(items), _square, mode=mode, workers=3) == expected
+
+@pytest.mark.parametrize("mode", mapreduce.MODES)
+def test_map_tasks_of_few_items(mode):
+    assert mapreduce.map_tasks([], _square, mode=mode, workers=2) == []
+    assert mapreduce.map_tasks([3], _square, mode=mode, workers=2) == [9]
+
+def test_process_mode_falls_back_to_threads_for_lambdas():
+    assert mapreduce.map_tasks(range(10), lambda number: -number, mode="process", workers=2) \
+        == [-number for number in range(10)]
+
+def test_single_worker_runs_serially():
+    calls = []
+    # Appending to a list of this process shows the items were not sent elsewhere
+    assert mapreduce.map_tasks(range(5), calls.append, mode="process", workers=1) == [None] * 5
+    assert calls == list(range(5))
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        mapreduce.map_tasks(range(3), _square, mode="fibers")
+
+def test_default_mode(monkeypatch):
+    monkeypatch.setattr(mapreduce, "MODE", None)
+    monkeypatch.setenv("AOC2023_MODE", "process")
+    assert mapreduce.default_mode() == "process"
+    monkeypatch.setenv("AOC2023_MODE", "unknown")
+    assert mapreduce.default_mode() == ("thread" if mapreduce.free_threaded() else "serial")
+    monkeypatch.setattr(mapreduce, "MODE", "thread")
+    assert mapreduce.default_mode() == "thread"
+
+@pytest.mark.parametrize("mode", mapreduce.MODES)
+def test_day16_answers_in_every_mode(mode, monkeypatch):
+    monkeypatch.setattr(mapreduce, "MODE", mode)
+    monkeypatch.setenv("AOC2023_WORKERS", "2")
+    module = days.import_day(16)
+    assert module.part1(module.parse_input(DAY16_EXAMPLE)) == 46
+    assert module.part2(module.parse_input(DAY16_EXAMPLE)) == 51
+
+def test_chunks():
+    assert mapreduce.chunks(list(range(7)), 3) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert mapreduce.chunks([], 3) == []
+    assert sum(mapreduce.chunks(list(range(10)), 4), []) == list(range(10))
+
+def test_map_reduce_in_chunks_matches_the_serial_loop():
+    items = list(range(1000))
+    serial = mapreduce.map_red_lines(items, _square, operator.add, workers=1)
+    assert mapreduce.map_red_lines(items, _square, operator.add, workers=2, min_parallel=0) \
+        == serial == sum(number * number for number in items)
+    assert mapreduce.map_lines(items, _square, workers=2, min_parallel=0) \
+        == [number * number for number in items]
+    assert mapreduce.map_red_lines([], _square, operator.add, initial=0) == 0
@@ -0,0 +1,61 @@
+"""
+Tests of the work counters of aoc2023.metrics.
+"""
+import pytest
+
+from aoc2023 import mapreduce, metrics
+
+from test_mapreduce import DAY16_EXAMPLE
+
+DAY5_EXAMPLE = """seeds: 79 14 55 13
+
+seed-to-soil map:
+50 98 2
+52 50 48
+
+soil-to-fertilizer map:
+0 15 37
+37 52 2
+39 0 15
+
+fertilizer-to-water map:
+49 53 8
+0 11 42
+42 0 7
+57 7 4
+
+water-to-light map:
+88 18 7
+18 25 70
+
+light-to-temperature map:
+45 77 23
+81 45 19
+68 64 13
+
+temperature-to-humidity map:
+0 69 1
+1 0 69
+
+humidity-to-location map:
+60 56 37
+56 93 4
+"""
+
+@pytest.mark.parametrize("mode", mapreduce.MODES)
+def test_counts_do_not_depend_on_the_mode(mode, monkeypatch):
+    monkeypatch.setenv("AOC2023_WORKERS", "2")
+    expected = metrics.count_part(16, 2, DAY16_EXAMPLE)
+    monkeypatch.setattr(mapreduce, "MODE", mode)
+    assert metrics.count_part(16, 2, DAY16_EXAMPLE) == expected
+    assert expected[0] == 51 and expected[1]["beam steps"] > 0
+    assert mapreduce.MODE == mode
+
+def test_day5_labels_lookups_and_fragments():
+    assert metrics.count_part(5, 1, DAY5_EXAMPLE)[0] == 35
+    answer, counters = metrics.count_part(5, 2, DAY5_EXAMPLE)
+    assert answer == 46
+    assert all(name.endswith(" fragments") for name in counters)
+    _, counters = metrics.count_part(5, 1, DAY5_EXAMPLE)
+    assert set(counters.values()) == {4}
+    assert all(name.endswith(" lookups") for name in counters)
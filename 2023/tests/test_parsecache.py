@@ -0,0 +1,126 @@
+"""
+Tests of the parse cache of aoc2023.parsecache: the round trip of the
+structures the parsers return, and the invalidation of the cache file when
+the input or the parsing code changes.
+"""
+import copy
+import sys
+import types
+from array import array
+
+from aoc2023 import parsecache
+from aoc2023.grid import Grid
+from aoc2023.records import column
+
+PARSER = '''
+from aoc2023 import reader
+from aoc2023.records import Record, column
+
+SEPARATOR = ","
+
+class Row(Record):
+    __slots__ = ("name", "values")
+
+def parse_input(text):
+    CALLS.parses += 1
+    rows = []
+    for line in reader.lines(text):
+        name, values = reader.text(line).split(":")
+        rows.append(Row(name, column(int(value) for value in values.split(SEPARATOR))))
+    return rows
+
+def part1(rows):
+    return sum(sum(row.values) for row in rows)
+'''
+
+def _module(monkeypatch, source=PARSER, name="synthetic_day"):
+    module = types.ModuleType(name)
+    # Not plain data, so that counting the parses doesn't change the fingerprint
+    module.CALLS = types.SimpleNamespace(parses=0)
+    exec(compile(source, name, "exec"), vars(module))
+    # The records are rebuilt from the name of the module of their class
+    monkeypatch.setitem(sys.modules, name, module)
+    return module
+
+def _round_trip(data):
+    encoded, tagged = parsecache._encode(data)
+    return parsecache._decode(encoded), tagged
+
+def test_plain_structures_are_not_tagged():
+    data = {"a": [1, (2, "b")], "c": ("d", [])}
+    assert _round_trip(data) == (data, False)
+
+def test_grids_and_arrays_round_trip():
+    characters = Grid.from_lines(["ab", "cd"])
+    digits = Grid.from_digits(["12", "34"])
+    decoded, tagged = _round_trip({"grids": [characters, digits], "column": column([-5, 2**40])})
+    assert tagged
+    assert isinstance(decoded["grids"][0].cells, bytearray)
+    assert str(decoded["grids"][0]) == "ab\ncd"
+    assert decoded["grids"][1].cells == digits.cells
+    assert decoded["grids"][1].border == -1
+    assert decoded["column"] == array('q', [-5, 2**40])
+
+def test_records_round_trip(monkeypatch):
+    module = _module(monkeypatch)
+    rows = module.parse_input("a:1,2\nb:3\n")
+    decoded, tagged = _round_trip((rows, 7))
+    assert tagged
+    assert decoded == (rows, 7)
+    assert type(decoded[0][0]) is module.Row
+
+def test_load_reuses_the_cache_file(tmp_path, monkeypatch):
+    module = _module(monkeypatch)
+    path = str(tmp_path / "day.txt")
+    buffer = b"a:1,2\nb:3\n"
+    first = parsecache.load(module, buffer, path)
+    second = parsecache.load(module, buffer, path)
+    assert module.CALLS.parses == 1
+    assert second == first
+    assert module.part1(second) == 6
+
+def test_another_input_is_parsed_again(tmp_path, monkeypatch):
+    module = _module(monkeypatch)
+    path = str(tmp_path / "day.txt")
+    parsecache.load(module, b"a:1\n", path)
+    assert module.part1(parsecache.load(module, b"a:2\n", path)) == 2
+    assert module.CALLS.parses == 2
+
+def test_changed_parser_is_parsed_again(tmp_path, monkeypatch):
+    path = str(tmp_path / "day.txt")
+    buffer = b"a:1;2\n"
+    parsecache.load(_module(monkeypatch), b"a:1,2\n", path)
+    # The same input and a new separator: only the parsing code changed
+    edited = _module(monkeypatch, PARSER.replace('SEPARATOR = ","', 'SEPARATOR = ";"'))
+    assert edited.part1(parsecache.load(edited, buffer, path)) == 3
+    assert edited.CALLS.parses == 1
+
+def test_corrupted_cache_file_is_parsed_again(tmp_path, monkeypatch):
+    module = _module(monkeypatch)
+    path = str(tmp_path / "day.txt")
+    parsecache.load(module, b"a:1\n", path)
+    with open(parsecache.cache_path(path), 'r+b') as f:
+        f.truncate(parsecache._HEADER + 1)
+    assert module.part1(parsecache.load(module, b"a:1\n", path)) == 1
+    assert module.CALLS.parses == 2
+
+def test_fingerprint_ignores_the_parts(monkeypatch):
+    module = _module(monkeypatch)
+    edited = _module(monkeypatch, PARSER.replace("return sum(sum(row.values) for row in rows)",
+                                                 "return max(max(row.values) for row in rows)"))
+    assert parsecache.parser_fingerprint(edited) == parsecache.parser_fingerprint(module)
+
+def test_fingerprint_covers_classes_and_constants(monkeypatch):
+    module = _module(monkeypatch)
+    slots = _module(monkeypatch, PARSER.replace('("name", "values")', '("values", "name")'))
+    constant = _module(monkeypatch, PARSER.replace('SEPARATOR = ","', 'SEPARATOR = " "'))
+    fingerprints = {parsecache.parser_fingerprint(other) for other in (module, slots, constant)}
+    assert len(fingerprints) == 3
+
+def test_fingerprint_survives_deepcopy(monkeypatch):
+    module = _module(monkeypatch)
+    before = parsecache.parser_fingerprint(module)
+    # deepcopy caches the slot names of the class as __slotnames__
+    copy.deepcopy(module.parse_input("a:1\n"))
+    assert "__slotnames__" in vars(module.Row)
+    assert parsecache.parser_fingerprint(module) == before
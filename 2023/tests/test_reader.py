@@ -0,0 +1,67 @@
+"""
+Tests of the splitting of inputs by aoc2023.reader, on str and bytes buffers.
+"""
+import io
+
+import pytest
+
+from aoc2023 import reader
+
+def _texts(pieces):
+    return [reader.text(piece) for piece in pieces]
+
+@pytest.mark.parametrize("kind", [str, bytes])
+@pytest.mark.parametrize("raw", ["a\nbb\nccc\n", "a\nbb\nccc", "a\r\nbb\r\nccc\r\n",
+                                 "a\r\nbb\r\nccc", "\n\n  a\nbb\nccc\n\n\n"])
+def test_lines_ignore_trailing_newline_and_carriage_returns(kind, raw):
+    buffer = raw if kind is str else raw.encode()
+    assert _texts(reader.lines(buffer)) == ["a", "bb", "ccc"]
+
+def test_lines_of_empty_input():
+    assert not list(reader.lines(""))
+    assert not list(reader.lines(b" \r\n\n"))
+
+def test_lines_keep_inner_blank_lines():
+    assert _texts(reader.lines("a\n\nb")) == ["a", "", "b"]
+    assert _texts(reader.lines(b"a\r\n\r\nb")) == ["a", "", "b"]
+
+def test_lines_of_a_span():
+    buffer = b"skip\nx\ny\nskip"
+    assert _texts(reader.lines(buffer, 5, 9)) == ["x", "y"]
+
+@pytest.mark.parametrize("kind", [str, bytes])
+@pytest.mark.parametrize("raw", ["a\nb\n\nc\n", "a\nb\n\nc", "a\r\nb\r\n\r\nc\r\n",
+                                 "a\r\nb\r\n\r\nc", "a\nb\n\n\n\nc\n"])
+def test_blocks(kind, raw):
+    buffer = raw if kind is str else raw.encode()
+    blocks = [_texts(reader.lines(buffer, start, end))
+              for start, end in reader.block_spans(buffer)]
+    assert blocks == [["a", "b"], ["c"]]
+    assert [reader.text(block).replace("\r", "") for block in reader.blocks(buffer)] \
+        == ["a\nb", "c"]
+
+def test_single_block():
+    assert _texts(reader.blocks("only\nlines\n")) == ["only\nlines"]
+
+@pytest.mark.parametrize("raw", ["rn=1,cm-,qp=3\n", "rn=1,cm-,qp=3", "rn=1,cm-,qp=3\r\n"])
+def test_tokens(raw):
+    assert _texts(reader.tokens(raw)) == ["rn=1", "cm-", "qp=3"]
+    assert _texts(reader.tokens(raw.encode())) == ["rn=1", "cm-", "qp=3"]
+
+def test_stream_lines_and_tokens_match_the_buffer_iterators():
+    raw = b"a\r\nbb\r\n\r\nccc"
+    assert list(reader.stream_lines(io.BytesIO(raw))) == ["a", "bb", "ccc"]
+    tokens = "x=1," * 50000 + "y-\n"
+    reader_stream = io.BytesIO(tokens.encode())
+    assert list(reader.stream_tokens(reader_stream)) == _texts(reader.tokens(tokens))
+
+def test_mapped_input(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"1\r\n2\r\n3")
+    with reader.MappedInput(str(path)) as mapped:
+        assert _texts(reader.lines(mapped.buffer)) == ["1", "2", "3"]
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    with reader.MappedInput(str(empty)) as mapped:
+        assert len(mapped) == 0
+        assert not list(reader.lines(mapped.buffer))
@@ -0,0 +1,31 @@
+"""
+Tests of the comparison of aoc2023.regression with a baseline.
+"""
+from aoc2023 import regression
+
+def _row(day, phase, min_ns, answer=1, size=10):
+    return dict(day=day, phase=phase, min_ns=min_ns, answer=answer, size=size)
+
+def _statuses(rows, baseline_rows, **kwargs):
+    baseline = {f"{row['day']}.{row['phase']}": row for row in baseline_rows}
+    return [result["status"] for result in regression.compare(rows, baseline, **kwargs)]
+
+def test_slowdowns_under_the_noise_floor_pass():
+    # 13 to 19 microseconds is 46% slower, but only by 6 microseconds
+    assert _statuses([_row(6, "parse", 19_000)], [_row(6, "parse", 13_000)]) == ["ok"]
+
+def test_slowdowns_over_the_threshold_and_the_floor_fail():
+    results = _statuses([_row(8, "part2", 30_000_000), _row(8, "part1", 21_000_000)],
+                        [_row(8, "part2", 20_000_000), _row(8, "part1", 20_000_000)])
+    assert results == ["slower", "ok"]
+    assert regression.failed([dict(status=status) for status in results])
+
+def test_noise_floor_can_be_lowered():
+    assert _statuses([_row(6, "parse", 19_000)], [_row(6, "parse", 13_000)],
+                     noise_floor_ns=0) == ["slower"]
+
+def test_answers_and_new_phases():
+    assert _statuses([_row(1, "part1", 10, answer=2), _row(1, "part2", 10),
+                      _row(2, "part1", 10, size=20)],
+                     [_row(1, "part1", 10), _row(2, "part1", 10)]) \
+        == ["answer changed", "new", "new"]